@@ -7,7 +7,22 @@ import math
 import json
 import os
 import traceback
+import threading
+import bisect
+import heapq
+import argparse
+import struct
+from collections import OrderedDict, deque
+from functools import partial
+from itertools import accumulate, chain
+from operator import attrgetter
 from typing import List, Tuple, Dict, Any, Optional
+
+# NumPy is optional: without it the particle system falls back to Particle objects
+try:
+    import numpy as np
+except ImportError:
+    np = None
 # PowerUp tracker removed
 
 # Music player has been removed, we'll handle music directly
@@ -16,6 +31,13 @@ MusicPlayer = None
 # For smooth transitions
 from pygame.locals import *
 
+# Headless runs (--headless, or SDL's dummy video driver) never open a window
+# or play audio; the drivers have to be chosen before pygame.init()
+HEADLESS = "--headless" in sys.argv or os.environ.get("SDL_VIDEODRIVER") == "dummy"
+if HEADLESS:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
 # Initialize pygame
 pygame.init()
 
@@ -102,39 +124,146 @@ SCALE_Y = SCREEN_HEIGHT / BASE_HEIGHT
 
 def cleanup_caches():
     """Clean up caches to free memory"""
-    global _background_cache, _font_cache
+    # The asset manager keeps itself within its byte budget, so only the
+    # generated garage previews need trimming here
+    with _preview_cache_lock:
+        if len(_preview_cache) > 30:
+            _preview_cache.clear()
+
+
+# Asset cache settings
+ASSET_CACHE_BUDGET = 96 * 1024 * 1024  # bytes of images, fonts and sounds kept loaded
+FONT_SIZE_ESTIMATE = 64 * 1024  # fonts don't report their size, assume this much
+BACKGROUND_IMAGE = "assets/images/bgm.jpg"
+
+
+class AssetManager:
+    """Shared cache for images, fonts and sounds with LRU eviction"""
+
+    def __init__(self, budget=ASSET_CACHE_BUDGET):
+        self.budget = budget
+        self.entries = OrderedDict()  # key -> (asset, size in bytes)
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Menus warm previews from a background thread
+        self.lock = threading.RLock()
+
+    def _get(self, key):
+        """Return a cached asset and mark it as recently used"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _put(self, key, asset, size):
+        """Cache an asset and evict the least recently used ones over budget"""
+        with self.lock:
+            if key in self.entries:
+                self.bytes_used -= self.entries.pop(key)[1]
+            self.entries[key] = (asset, size)
+            self.bytes_used += size
+
+            # Always keep the newest entry, even if it alone exceeds the budget
+            while self.bytes_used > self.budget and len(self.entries) > 1:
+                _, (_, old_size) = self.entries.popitem(last=False)
+                self.bytes_used -= old_size
+                self.evictions += 1
+        return asset
+
+    def load_image(self, path, size=None, alpha=False):
+        """Load an image, optionally scaled to size, converted for the display once"""
+        key = ("image", path, tuple(size) if size else None, alpha)
+        image = self._get(key)
+        if image is not None:
+            return image
+
+        if size:
+            # Scale from the cached original so each file is decoded only once
+            image = pygame.transform.scale(self.load_image(path, alpha=alpha), size)
+        else:
+            image = pygame.image.load(path)
+            # Convert to display format for better performance
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha() if alpha else image.convert()
 
-    # Clear caches if they get too large
-    if len(_background_cache) > 10:
-        _background_cache.clear()
+        return self._put(key, image, image.get_pitch() * image.get_height())
 
-    if len(_font_cache) > 20:
-        _font_cache.clear()
+    def get_font(self, size, bold=False):
+        """Get the game font with the specified size and style"""
+        key = ("font", size, bold)
+        font = self._get(key)
+        if font is not None:
+            return font
+
+        try:
+            if "has_pixelify_font" in globals() and has_pixelify_font:
+                if bold:
+                    font = pygame.font.Font(PIXELIFY_SANS_BOLD, size)
+                else:
+                    font = pygame.font.Font(PIXELIFY_SANS_REGULAR, size)
+            else:
+                # Fall back to system font
+                font = pygame.font.SysFont(DEFAULT_FONT, size, bold=bold)
+        except Exception as e:
+            print(f"Error loading font: {e}")
+            # Ultimate fallback to default pygame font
+            font = pygame.font.Font(None, size)
+
+        return self._put(key, font, FONT_SIZE_ESTIMATE)
+
+    def get_sys_font(self, name, size, bold=False, italic=False):
+        """Get a named system font"""
+        key = ("sysfont", name, size, bold, italic)
+        font = self._get(key)
+        if font is not None:
+            return font
+
+        font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+        return self._put(key, font, FONT_SIZE_ESTIMATE)
+
+    def load_sound(self, path):
+        """Load a short sound effect. Music tracks decode to tens of MB of PCM,
+        so they are loaded with pygame.mixer.Sound and never enter the cache"""
+        key = ("sound", path)
+        sound = self._get(key)
+        if sound is not None:
+            return sound
+
+        sound = pygame.mixer.Sound(path)
+        # Decoded size: seconds * samples per second * bytes per sample frame
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        size = int(
+            sound.get_length() * frequency * channels * (abs(sample_format) // 8)
+        )
+        return self._put(key, sound, size)
+
+    def stats(self):
+        """Return cache counters for debugging"""
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.bytes_used,
+                "budget": self.budget,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
 
 
-# Global background cache to avoid reloading
-_background_cache = {}
+# Global asset manager shared by every menu and the game
+assets = AssetManager()
 
 
 def load_background_image(width, height):
     """Load the background image without blur effect"""
-    cache_key = f"{width}x{height}_original"
-
-    # Return cached version if available
-    if cache_key in _background_cache:
-        return _background_cache[cache_key], True
-
     try:
-        background_image = pygame.image.load("assets/images/bgm.jpg")
-        background_image = pygame.transform.scale(background_image, (width, height))
-
-        # Convert to display format for better performance
-        background_image = background_image.convert()
-
-        # Cache the result
-        _background_cache[cache_key] = background_image
-
-        return background_image, True
+        return assets.load_image(BACKGROUND_IMAGE, (width, height)), True
     except Exception as e:
         print(f"Error loading background image: {e}")
         return None, False
@@ -149,36 +278,243 @@ def scale_value(value):
     return int(value * min(SCALE_X, SCALE_Y))
 
 
-# Font cache for better performance
-_font_cache = {}
-
-
 def get_font(size, bold=False):
     """Get the appropriate font with the specified size and style - cached for performance"""
-    cache_key = f"{size}_{bold}"
+    return assets.get_font(size, bold)
+
+
+# Quality tiers, from best looking to cheapest.
+# particle_scale multiplies the particle system's configured cap, glow_layers caps the glow rings drawn around pickups and obstacles,
+# ambient_update_interval is how many frames the menu clouds and waves are
+# reused for, and render_scale is the resolution they are redrawn at.
+QUALITY_TIERS = [
+    {
+        "name": "HIGH",
+        "particle_scale": 1.0,
+        "glow_layers": 5,
+        "headlight_layers": 3,
+        "sparkle_count": 50,
+        "ambient_update_interval": 1,
+        "render_scale": 1.0,
+    },
+    {
+        "name": "MEDIUM",
+        "particle_scale": 0.7,
+        "glow_layers": 2,
+        "headlight_layers": 2,
+        "sparkle_count": 30,
+        "ambient_update_interval": 2,
+        "render_scale": 1.0,
+    },
+    {
+        "name": "LOW",
+        "particle_scale": 0.4,
+        "glow_layers": 1,
+        "headlight_layers": 1,
+        "sparkle_count": 15,
+        "ambient_update_interval": 4,
+        "render_scale": 0.75,
+    },
+    {
+        "name": "MINIMAL",
+        "particle_scale": 0.2,
+        "glow_layers": 0,
+        "headlight_layers": 0,
+        "sparkle_count": 5,
+        "ambient_update_interval": 8,
+        "render_scale": 0.5,
+    },
+]
+
+# Active tier, read by the draw code every frame
+current_quality = QUALITY_TIERS[0]
+
+# Governor thresholds (fractions of the frame budget) and how long they must hold
+QUALITY_DOWNGRADE_RATIO = 0.9  # step down when work time exceeds 90% of the budget
+QUALITY_UPGRADE_RATIO = 0.5  # step up again only below 50% of the budget
+QUALITY_DOWNGRADE_DELAY = 1.0  # seconds over budget before stepping down
+QUALITY_UPGRADE_DELAY = 5.0  # seconds under budget before stepping up
+
+
+def glow_layers(max_layers):
+    """Glow ring offsets to draw, outermost first, limited by the quality tier"""
+    return range(min(max_layers, current_quality["glow_layers"]), 0, -1)
+
+
+class QualityGovernor:
+    """Picks the quality tier from measured frame work time"""
+
+    MODES = ["AUTO"] + [tier["name"] for tier in QUALITY_TIERS]
+
+    def __init__(self, target_fps=60):
+        self.frame_budget = 1.0 / target_fps
+        self.mode = "AUTO"
+        self.tier_index = 0
+        self.average_frame_time = 0.0
+        self.over_budget_time = 0.0
+        self.under_budget_time = 0.0
+
+    def set_mode(self, mode):
+        """Select AUTO or pin a tier by name"""
+        self.mode = mode
+        if mode != "AUTO":
+            self.set_tier([tier["name"] for tier in QUALITY_TIERS].index(mode))
+        self.over_budget_time = 0.0
+        self.under_budget_time = 0.0
+
+    def set_tier(self, tier_index):
+        """Switch the active quality tier"""
+        global current_quality
+        self.tier_index = max(0, min(len(QUALITY_TIERS) - 1, tier_index))
+        current_quality = QUALITY_TIERS[self.tier_index]
+
+    def record_frame(self, work_time, elapsed):
+        """Feed a frame's work time (without the sleep) and the wall time it covered"""
+        # Smooth out single slow frames
+        if self.average_frame_time == 0.0:
+            self.average_frame_time = work_time
+        else:
+            self.average_frame_time += (work_time - self.average_frame_time) * 0.1
 
-    if cache_key in _font_cache:
-        return _font_cache[cache_key]
+        if self.mode != "AUTO":
+            return
 
-    try:
-        if "has_pixelify_font" in globals() and has_pixelify_font:
-            if bold:
-                font = pygame.font.Font(PIXELIFY_SANS_BOLD, size)
-            else:
-                font = pygame.font.Font(PIXELIFY_SANS_REGULAR, size)
+        if self.average_frame_time > self.frame_budget * QUALITY_DOWNGRADE_RATIO:
+            self.over_budget_time += elapsed
+            self.under_budget_time = 0.0
+            if (
+                self.over_budget_time >= QUALITY_DOWNGRADE_DELAY
+                and self.tier_index < len(QUALITY_TIERS) - 1
+            ):
+                self.set_tier(self.tier_index + 1)
+                self.over_budget_time = 0.0
+                print(f"Quality lowered to {current_quality['name']}")
+        elif self.average_frame_time < self.frame_budget * QUALITY_UPGRADE_RATIO:
+            self.under_budget_time += elapsed
+            self.over_budget_time = 0.0
+            if self.under_budget_time >= QUALITY_UPGRADE_DELAY and self.tier_index > 0:
+                self.set_tier(self.tier_index - 1)
+                self.under_budget_time = 0.0
+                print(f"Quality raised to {current_quality['name']}")
         else:
-            # Fall back to system font
-            font = pygame.font.SysFont(DEFAULT_FONT, size, bold=bold)
+            # Inside the hysteresis band: hold the current tier
+            self.over_budget_time = 0.0
+            self.under_budget_time = 0.0
 
-        # Cache the font
-        _font_cache[cache_key] = font
-        return font
-    except Exception as e:
-        print(f"Error loading font: {e}")
-        # Ultimate fallback to default pygame font
-        font = pygame.font.Font(None, size)
-        _font_cache[cache_key] = font
-        return font
+
+# Global quality governor shared by the game loop and the settings menu
+quality_governor = QualityGovernor()
+
+# Frame pacing settings
+FRAME_HISTORY_SIZE = 600  # Frames kept for the frame-time percentiles (~10s at 60 FPS)
+FRAME_SPIN_MARGIN = 0.002  # Seconds before the deadline where hybrid pacing stops sleeping
+
+
+class FrameScheduler:
+    """Paces every game and menu loop and records frame times"""
+
+    MODES = ["SLEEP", "BUSY", "HYBRID"]
+
+    def __init__(self, mode="HYBRID"):
+        self.mode = mode
+        self.clock = pygame.time.Clock()
+        self.frame_times = deque(maxlen=FRAME_HISTORY_SIZE)
+        self.last_frame_end = time.perf_counter()
+        self.next_deadline = self.last_frame_end
+
+    def set_mode(self, mode):
+        """Switch pacing mode and restart the deadline from now"""
+        self.mode = mode
+        self.last_frame_end = time.perf_counter()
+        self.next_deadline = self.last_frame_end
+        self.frame_times.clear()
+        print(f"Frame pacing set to {mode}")
+
+    def cycle_mode(self):
+        """Step to the next pacing mode"""
+        self.set_mode(self.MODES[(self.MODES.index(self.mode) + 1) % len(self.MODES)])
+
+    def _wait_until(self, deadline):
+        """Sleep most of the way to the deadline, then spin for the rest"""
+        remaining = deadline - time.perf_counter()
+        if remaining > FRAME_SPIN_MARGIN:
+            time.sleep(remaining - FRAME_SPIN_MARGIN)
+        while time.perf_counter() < deadline:
+            pass
+
+    def tick(self, fps=60):
+        """Wait out the rest of the frame; returns milliseconds since the last tick"""
+        frame_budget = 1.0 / fps
+
+        if self.mode == "SLEEP":
+            self.clock.tick(fps)
+        elif self.mode == "BUSY":
+            self.clock.tick_busy_loop(fps)
+        else:
+            # Aim at a fixed cadence instead of "budget after the last frame"
+            # so small overruns don't accumulate drift
+            self.next_deadline += frame_budget
+            now = time.perf_counter()
+            if now > self.next_deadline + frame_budget:
+                # Fell more than a frame behind (menu switch, loading): resync
+                self.next_deadline = now
+            else:
+                self._wait_until(self.next_deadline)
+
+        frame_end = time.perf_counter()
+        frame_time = frame_end - self.last_frame_end
+        self.last_frame_end = frame_end
+        self.frame_times.append(frame_time)
+        return frame_time * 1000.0
+
+    def percentiles(self):
+        """Return p50/p95/p99 frame times in milliseconds"""
+        if not self.frame_times:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        ordered = sorted(self.frame_times)
+        last = len(ordered) - 1
+        return {
+            name: ordered[min(last, int(last * fraction + 0.5))] * 1000.0
+            for name, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+        }
+
+    def get_fps(self):
+        """Average FPS over the recorded history"""
+        if not self.frame_times:
+            return 0.0
+        return len(self.frame_times) / sum(self.frame_times)
+
+
+# Global frame scheduler shared by the game loop and every menu loop
+frame_scheduler = FrameScheduler()
+
+
+# Random stream settings
+RNG_STREAMS = ("spawn", "ai", "particles", "cosmetic")  # One independent stream each
+
+
+class RandomStreams:
+    """Independent random.Random streams derived from one run seed"""
+
+    def __init__(self, seed=None):
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """Restart every stream from a run seed; a new seed is drawn when None"""
+        self.seed = random.SystemRandom().getrandbits(32) if seed is None else seed
+        # String seeds hash the same in every process, unlike hash()-based ones
+        for name in RNG_STREAMS:
+            setattr(self, name, random.Random(f"{self.seed}:{name}"))
+        return self.seed
+
+    @staticmethod
+    def keyed(*key):
+        """A throwaway generator for a fixed key; it consumes no stream and gives
+        the same values in every run, so cosmetics stay put however often they redraw"""
+        return random.Random(":".join(map(str, key)))
+
+
+rng = RandomStreams()
 
 
 def scale_pos_x(x):
@@ -326,6 +662,7 @@ def start_menu_music_fallback():
                     continue
 
                 try:
+                    # Music stays out of the asset cache (see AssetManager.load_sound)
                     menu_music = pygame.mixer.Sound(menu_music_path)
                     menu_music.set_volume(0.4)
                     # Use channel 1 for menu music
@@ -436,12 +773,12 @@ try:
         # Load sounds
         # Load sound effects with error handling
         try:
-            sound_engine = pygame.mixer.Sound(SOUND_ENGINE)
-            sound_crash = pygame.mixer.Sound(SOUND_CRASH)
-            sound_powerup = pygame.mixer.Sound(SOUND_POWERUP) # type: ignore
-            sound_coin = pygame.mixer.Sound(SOUND_COIN)
-            sound_menu_select = pygame.mixer.Sound(SOUND_MENU_SELECT)
-            sound_menu_navigate = pygame.mixer.Sound(SOUND_MENU_NAVIGATE)
+            sound_engine = assets.load_sound(SOUND_ENGINE)
+            sound_crash = assets.load_sound(SOUND_CRASH)
+            sound_powerup = assets.load_sound(SOUND_POWERUP) # type: ignore
+            sound_coin = assets.load_sound(SOUND_COIN)
+            sound_menu_select = assets.load_sound(SOUND_MENU_SELECT)
+            sound_menu_navigate = assets.load_sound(SOUND_MENU_NAVIGATE)
         except (pygame.error, FileNotFoundError):
             # Create dummy sound objects if files not found
             sound_engine = None
@@ -450,9 +787,9 @@ try:
             sound_coin = None
             sound_menu_select = None
             sound_menu_navigate = None
-        sound_boost = pygame.mixer.Sound(SOUND_BOOST)
-        sound_shield = pygame.mixer.Sound(SOUND_SHIELD)
-        sound_game_over = pygame.mixer.Sound(SOUND_GAME_OVER)
+        sound_boost = assets.load_sound(SOUND_BOOST)
+        sound_shield = assets.load_sound(SOUND_SHIELD)
+        sound_game_over = assets.load_sound(SOUND_GAME_OVER)
 
         # Set volume levels
         sound_engine.set_volume(0.3)
@@ -478,6 +815,11 @@ except Exception as e:
     # Keep sound and music enabled in settings even if initialization fails
     pass  # Don't set sound_enabled = False here
 
+if HEADLESS:
+    # Headless simulation stays silent
+    sound_enabled = False
+    music_enabled = False
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -506,6 +848,10 @@ TRANSITION_SPEED = 0.8  # seconds for a full transition
 FADE_SPEED = 0.5  # seconds for a full fade
 SLIDE_DISTANCE = 300  # pixels to slide during transitions
 
+# Updates menu settings
+UPDATES_DOCUMENT_TILE_HEIGHT = 1024  # pixels per pre-rendered content tile
+UPDATES_DOCUMENT_PADDING = 20  # room above the first heading background
+
 # Gameplay color palette
 DARK_SLATE = (47, 79, 79)  # #2F4F4F - Top of gradient
 TEAL = (0, 128, 128)  # #008080 - Bottom of gradient
@@ -538,12 +884,23 @@ POWERUP_HEIGHT = 40
 INITIAL_SPEED = 5
 SPEED_INCREMENT = 0.005  # Smoother acceleration
 
+# Simulation settings
+SIMULATION_HZ = 120  # Fixed rate the game simulation steps at
+SIMULATION_DT = 1.0 / SIMULATION_HZ
+MAX_SIMULATION_STEPS = 12  # Steps run per rendered frame before the backlog is dropped
+REFERENCE_FPS = 60  # Frame rate the per-frame speeds and chances were tuned at
+
 # Magnet power-up settings
 MAGNET_WIDTH = 40
 MAGNET_HEIGHT = 40
 MAGNET_DURATION = 5  # seconds
 MAGNET_RANGE = 150  # pixels - range for coin attraction
 MAGNET_COLOR = (255, 215, 0)  # Gold color
+MAGNET_PULL = 0.1  # Fraction of the distance a coin closes per 60 FPS frame
+MAGNET_MAX_PULL = 8  # Pixels per 60 FPS frame, the pull never goes faster
+# Below this many magnetic entities the NumPy pass loses to plain Python,
+# gathering and scattering positions costs more than the maths it saves
+MAGNET_VECTOR_MIN = 256
 
 # Boost power-up settings
 BOOST_WIDTH = 40
@@ -714,6 +1071,24 @@ class HighScoreManager:
 
 
 class Particle:
+    # Slotted and mutable so the object fallback can recycle instances
+    # from ParticleSystem's free list instead of allocating per spawn
+    __slots__ = (
+        "x",
+        "y",
+        "color",
+        "size",
+        "initial_size",
+        "vx",
+        "vy",
+        "lifetime",
+        "max_lifetime",
+        "alpha",
+        "shrink",
+        "gravity",
+        "glow",
+    )
+
     def __init__(
         self,
         x: float,
@@ -725,38 +1100,62 @@ class Particle:
         alpha: int = 255,
         shrink: bool = True,
         gravity: float = 0,
+        glow: bool = False,
     ):
+        self.reset(x, y, color, size, velocity, lifetime, alpha, shrink, gravity, glow)
+
+    def reset(
+        self,
+        x: float,
+        y: float,
+        color: Tuple[int, int, int],
+        size: float,
+        velocity: Tuple[float, float],
+        lifetime: float,
+        alpha: int = 255,
+        shrink: bool = True,
+        gravity: float = 0,
+        glow: bool = False,
+    ) -> "Particle":
+        """Reinitialise a recycled particle in place"""
         self.x = x
         self.y = y
         self.color = color
         self.size = size
         self.initial_size = size
-        self.velocity = velocity
+        self.vx, self.vy = velocity
+        # Lifetime counts down by the simulation dt, so particles never read the clock
         self.lifetime = lifetime
         self.max_lifetime = lifetime
         self.alpha = alpha
         self.shrink = shrink
         self.gravity = gravity
-        self.creation_time = time.time()
+        self.glow = glow
+        return self
+
+    @property
+    def velocity(self) -> Tuple[float, float]:
+        return (self.vx, self.vy)
 
     def update(self, dt: float) -> None:
         # Scale velocity by delta time for frame-rate independence
-        self.x += self.velocity[0] * dt
-        self.y += self.velocity[1] * dt
+        self.x += self.vx * dt
+        self.y += self.vy * dt
 
         # Apply gravity
         if self.gravity > 0:
-            self.velocity = (self.velocity[0], self.velocity[1] + self.gravity * dt)
+            self.vy += self.gravity * dt
 
         # Update lifetime
         self.lifetime -= dt
+        remaining = self.lifetime / self.max_lifetime
 
         # Update size if shrinking
         if self.shrink:
-            self.size = self.initial_size * (self.lifetime / self.max_lifetime)
+            self.size = self.initial_size * remaining
 
         # Update alpha (fade out)
-        self.alpha = int(255 * (self.lifetime / self.max_lifetime))
+        self.alpha = int(255 * remaining)
 
     def draw(self, screen: pygame.Surface) -> None:
         if self.lifetime <= 0:
@@ -794,459 +1193,1294 @@ class Particle:
         return self.lifetime > 0
 
 
+# Particle store settings
+PARTICLE_CAPACITY = 5000  # Rows preallocated by the NumPy particle store
+PARTICLE_CAP = 400 if np is not None else 50  # Default live particle limit at HIGH quality
+PARTICLE_SHRINK = 1  # Flag bit: size follows remaining lifetime
+PARTICLE_GLOW = 2  # Flag bit: particle also lights up the additive glow pass
+PARTICLE_ALPHA_BUCKETS = 16  # Alpha levels particle sprites are quantised to
+PARTICLE_SPRITE_CACHE_LIMIT = 2048  # Sprites kept before the cache is rebuilt
+GLOW_BUFFER_SCALE = 0.25  # Resolution of the glow buffer relative to the screen
+GLOW_RADIUS = 2.0  # Glow radius relative to particle size
+GLOW_STRENGTH = 0.6  # Brightness of a glow centre relative to the particle colour
+
+
+class ParticleArrays:
+    """Fixed-capacity structure-of-arrays particle store updated with NumPy"""
+
+    # Float fields, one row each in self.data
+    FIELDS = ["x", "y", "vx", "vy", "gravity", "life", "max_life", "size", "initial_size", "alpha"]
+
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.capacity = capacity
+        # Live rows form a ring starting at the oldest particle, so evicting
+        # the oldest is just advancing start
+        self.start = 0
+        self.count = 0
+        # Keeping every float field in one 2D array lets update and compaction
+        # touch all of them with a handful of NumPy calls
+        self.data = np.zeros((len(self.FIELDS), capacity), dtype=np.float32)
+        for row, name in enumerate(self.FIELDS):
+            setattr(self, name, self.data[row])
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+        self.category = np.zeros(capacity, dtype=np.uint8)
+
+    def __len__(self):
+        return self.count
+
+    def spawn(
+        self,
+        x,
+        y,
+        vx,
+        vy,
+        life,
+        size,
+        color,
+        alpha=255,
+        shrink=True,
+        gravity=0.0,
+        limit=None,
+        glow=False,
+        category=0,
+    ):
+        """Append a batch of particles; every argument may be a scalar or an array"""
+        n = int(np.broadcast(x, y, vx, vy, life, size, alpha, gravity).size)
+        block = np.empty((len(self.FIELDS), n), dtype=np.float32)
+        block[0], block[1], block[2], block[3] = x, y, vx, vy
+        block[4] = gravity
+        block[5] = block[6] = life
+        block[7] = block[8] = size
+        block[9] = alpha
+        flags = (
+            np.where(np.broadcast_to(shrink, (n,)), PARTICLE_SHRINK, 0)
+            | np.where(np.broadcast_to(glow, (n,)), PARTICLE_GLOW, 0)
+        ).astype(np.uint8)
+        return self.spawn_block(block, np.broadcast_to(color, (n, 3)), flags, limit, category)
+
+    def spawn_block(self, block, color, flags, limit=None, category=0):
+        """Append prebuilt rows: block is (len(FIELDS), n), color (n, 3), flags (n,)
+
+        Returns how many existing rows were evicted to make room.
+        """
+        n = block.shape[1]
+        limit = self.capacity if limit is None else min(limit, self.capacity)
+        if n == 0 or limit <= 0:
+            return 0
+        if n > limit:
+            # Only the newest particles of an oversized batch survive anyway
+            block, color, flags = block[:, -limit:], color[-limit:], flags[-limit:]
+            n = limit
+
+        # Evict the oldest rows to make room by moving the ring start
+        overflow = max(0, self.count + n - limit)
+        if overflow:
+            self.start = (self.start + overflow) % self.capacity
+            self.count -= overflow
+
+        first = (self.start + self.count) % self.capacity
+        if first + n <= self.capacity:
+            rows = slice(first, first + n)
+        else:
+            rows = (first + np.arange(n)) % self.capacity
+        self.data[:, rows] = block
+        self.color[rows] = color
+        self.flags[rows] = flags
+        self.category[rows] = category
+        self.count += n
+        return overflow
+
+    def kill_oldest(self, category, amount):
+        """Retire the oldest live particles of a category; returns how many"""
+        rows = self.live_rows()
+        candidates = np.flatnonzero((self.category[rows] == category) & (self.life[rows] > 0))
+        candidates = candidates[:amount]
+        victims = candidates + rows.start if isinstance(rows, slice) else rows[candidates]
+        # Dead rows stop drawing now and are compacted away on the next update
+        self.life[victims] = 0.0
+        self.alpha[victims] = 0.0
+        self.size[victims] = 0.0
+        return len(victims)
+
+    def category_counts(self, categories):
+        """Live particles per category index"""
+        rows = self.live_rows()
+        alive = self.life[rows] > 0
+        return np.bincount(self.category[rows][alive], minlength=categories).tolist()
+
+    def live_rows(self):
+        """Index of the live rows, oldest first: a slice unless the ring wraps"""
+        end = self.start + self.count
+        if end <= self.capacity:
+            return slice(self.start, end)
+        return np.r_[self.start : self.capacity, 0 : end - self.capacity]
+
+    def update(self, dt):
+        """Advance every live particle in one vectorised step and drop dead ones"""
+        n = self.count
+        if n == 0:
+            self.start = 0
+            return
+        if self.start != 0:
+            # Move the ring back to the front so the update works on plain views
+            rows = self.live_rows()
+            self.data[:, :n] = self.data[:, rows]
+            self.color[:n] = self.color[rows]
+            self.flags[:n] = self.flags[rows]
+            self.category[:n] = self.category[rows]
+            self.start = 0
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+        life, max_life = self.life[:n], self.max_life[:n]
+
+        x += vx * dt
+        y += vy * dt
+        # Same rule as Particle.update: only positive gravity pulls
+        vy += np.maximum(self.gravity[:n], 0.0) * dt
+        life -= dt
+
+        remaining = life / max_life
+        shrinking = (self.flags[:n] & PARTICLE_SHRINK) != 0
+        np.copyto(self.size[:n], self.initial_size[:n] * remaining, where=shrinking)
+        np.multiply(remaining, 255.0, out=self.alpha[:n])
+
+        alive = life > 0
+        if not alive.all():
+            # Order-preserving compaction keeps the oldest particles first
+            keep = int(np.count_nonzero(alive))
+            self.data[:, :keep] = self.data[:, :n][:, alive]
+            self.color[:keep] = self.color[:n][alive]
+            self.flags[:keep] = self.flags[:n][alive]
+            self.category[:keep] = self.category[:n][alive]
+            self.count = keep
+
+    def clear(self):
+        self.start = 0
+        self.count = 0
+
+
+# Particle budget categories. share is the part of the live particle limit
+# reserved for the category; under pressure categories above their share are
+# shed oldest-first, lowest priority first.
+PARTICLE_CATEGORIES = {
+    "crash": {"share": 0.35, "priority": 4},
+    "boost": {"share": 0.20, "priority": 3},
+    "coin": {"share": 0.15, "priority": 2},
+    "smoke": {"share": 0.15, "priority": 1},
+    "tire": {"share": 0.10, "priority": 0},
+    "misc": {"share": 0.05, "priority": 0},
+}
+PARTICLE_CATEGORY_NAMES = list(PARTICLE_CATEGORIES)
+
+# Emitter presets. Ranges are (low, high) sampled per particle; offset is the
+# half-size of the spawn box; presets marked scaled multiply distances by the
+# screen scale. glow is the share of particles that also light the additive
+# glow pass, secondary spawns a derived particle for a share of the batch
+# and burst entries combine other presets as (name, options, chance).
+# category picks the particle budget a top-level emit is charged to.
+EMITTER_PRESETS = {
+    "spark": {
+        "category": "misc",
+        "count": 5,
+        "scaled": True,
+        "offset": (5, 5),
+        "speed": (50, 150),
+        "size": (1, 3),
+        "lifetime": (0.2, 0.6),
+        "gravity": (-10, 10),
+        "palette": [(255, 255, 0), (255, 165, 0)],  # Yellow, orange
+        "glow": 0.2,
+    },
+    "smoke": {
+        "category": "smoke",
+        "count": 3,
+        "offset": (8, 8),
+        "velocity": ((-10, 10), (-30, -10)),
+        "size": (5, 15),
+        "lifetime": (0.5, 1.5),
+        "gravity": (-8, -2),
+        "gray": (150, 200),
+        "color_jitter": 20,  # Per-channel variation around a given color_base
+        "secondary": {
+            "chance": 0.3,
+            "offset": 5,
+            "size": 0.5,
+            "velocity": 1.2,
+            "lifetime": 0.7,
+            "gravity": 0.8,
+        },
+    },
+    "fire": {
+        "category": "crash",
+        "count": 10,
+        "scaled": True,
+        "offset": (10, 10),
+        "speed": (80, 250),
+        "size": (5, 15),
+        "lifetime": (0.3, 0.8),
+        "gravity": (-50, 50),
+        "palette": [(255, 0, 0), (255, 69, 0), (255, 140, 0), (255, 165, 0)],
+        "glow": 0.3,
+    },
+    "debris": {
+        "category": "crash",
+        "count": 12,
+        "scaled": True,
+        "offset": (15, 15),
+        "speed": (100, 400),
+        "size": (3, 12),
+        "lifetime": (0.5, 2.0),
+        "gravity": (150, 300),
+        "palette": [(100, 100, 100), (80, 80, 80), (50, 50, 50), (100, 0, 0)],
+    },
+    "shockwave": {
+        "category": "crash",
+        "count": 5,
+        "scaled": True,
+        "ramp": True,  # Rings grow, fade and last longer in even steps
+        "size": (5, 25),
+        "alpha": (200, 120),
+        "lifetime": (0.1, 0.3),
+        "shrink": False,
+        "palette": [(255, 255, 255)],
+    },
+    "boost_flame": {
+        "category": "boost",
+        "count": 3,
+        "offset": (15, 8),
+        "velocity": ((-8, 8), (15, 40)),  # Downward, the car is moving up the screen
+        "size": (6, 10),
+        "lifetime": (0.4, 0.8),
+        "gravity": (-5, 5),
+        "palette": [BOOST_COLOR, (255, 140, 0), (255, 99, 71)],
+        "glow": 0.4,
+    },
+    "tire_tracks": {
+        "category": "tire",
+        "count": 3,
+        "offset": (20, 5),
+        "size": (2, 4),
+        "lifetime": (1.0, 3.0),
+        "shrink": False,
+        "gray": (20, 40),
+    },
+    "water_splash": {
+        "category": "misc",
+        "count": 30,
+        "offset": (10, 10),
+        "speed": (50, 200),
+        "size": (2, 6),
+        "lifetime": (0.5, 1.2),
+        "gravity": (100, 300),
+        "palette": [
+            (0, 191, 255),
+            (135, 206, 250),
+            (173, 216, 230),
+            (240, 248, 255),
+            (240, 255, 255),
+        ],
+    },
+    "crash": {
+        "category": "crash",
+        "burst": [
+            ("spark", {"count": 8, "intensity": 1.5}, 1.0),
+            ("smoke", {"count": 3}, 1.0),
+            ("smoke", {"count": 5, "color_base": (100, 100, 100)}, 1.0),
+            ("smoke", {"count": 4, "color_base": (50, 50, 50)}, 1.0),
+            ("fire", {}, 1.0),
+            ("debris", {}, 1.0),
+            ("shockwave", {}, 1.0),
+        ]
+    },
+    "boost_trail": {
+        "category": "boost",
+        "burst": [
+            ("boost_flame", {}, 1.0),
+            ("spark", {"count": 2, "intensity": 0.7}, 0.2),
+        ]
+    },
+    "tire_drift": {
+        "category": "tire",
+        "burst": [
+            ("tire_tracks", {"count": 8, "size": (3, 6)}, 1.0),
+            ("smoke", {"count": 5, "color_base": (50, 50, 50)}, 1.0),
+        ]
+    },
+}
+
+EMITTER_TABLE_SIZE = 16384  # Pre-sampled values per random table
+EMITTER_TABLE_SEED = 1  # Table contents are fixed; runs differ by where the cursors start
+
+
+class RandomTables:
+    """Pre-sampled uniform values and unit vectors handed out in sequence"""
+
+    def __init__(self, size=EMITTER_TABLE_SIZE, seed=None):
+        rng = random.Random(seed)
+        self.size = size
+        self.uniforms = [rng.random() for _ in range(size)]
+        angles = [rng.uniform(0, 2 * math.pi) for _ in range(size)]
+        self.directions = [(math.cos(a), math.sin(a)) for a in angles]
+        self.uniform_cursor = 0
+        self.direction_cursor = 0
+        if np is not None:
+            self.uniform_array = np.asarray(self.uniforms, dtype=np.float32)
+            self.cos_array = np.cos(np.asarray(angles, dtype=np.float32))
+            self.sin_array = np.sin(np.asarray(angles, dtype=np.float32))
+
+    def rewind(self, stream):
+        """Start both cursors at positions drawn from a random stream"""
+        self.uniform_cursor = stream.randrange(self.size)
+        self.direction_cursor = stream.randrange(self.size)
+
+    def uniform(self, low, high):
+        """Next table value scaled to [low, high)"""
+        value = self.uniforms[self.uniform_cursor]
+        self.uniform_cursor = (self.uniform_cursor + 1) % self.size
+        return low + (high - low) * value
+
+    def direction(self):
+        """Next unit vector as (cos, sin)"""
+        value = self.directions[self.direction_cursor]
+        self.direction_cursor = (self.direction_cursor + 1) % self.size
+        return value
+
+    def _indices(self, cursor, n):
+        if cursor + n <= self.size:
+            return slice(cursor, cursor + n)
+        return np.arange(cursor, cursor + n) % self.size
+
+    def take(self, n):
+        """Next n uniform values in [0, 1) as a NumPy array"""
+        rows = self._indices(self.uniform_cursor, n)
+        self.uniform_cursor = (self.uniform_cursor + n) % self.size
+        return self.uniform_array[rows]
+
+    def take_directions(self, n):
+        """Next n unit vectors as (cos array, sin array)"""
+        rows = self._indices(self.direction_cursor, n)
+        self.direction_cursor = (self.direction_cursor + n) % self.size
+        return self.cos_array[rows], self.sin_array[rows]
+
+
+# Shared tables for every particle emitter
+emitter_tables = RandomTables(seed=EMITTER_TABLE_SEED)
+
+
+def flatten_emitter(name, count, intensity, color_base, overrides, group, leaves):
+    """Collect the plain presets behind an emitter as (group, preset, n, intensity, color_base)"""
+    preset = EMITTER_PRESETS[name]
+    if overrides:
+        preset = {**preset, **overrides}
+    if "burst" not in preset:
+        n = preset["count"] if count is None else count
+        if n > 0:
+            leaves.append((group, preset, n, intensity, color_base))
+        return
+    for index, (part_name, part_options, chance) in enumerate(preset["burst"]):
+        options = dict(part_options)
+        # Parts that only happen by chance get their own group and dice roll
+        part_group = group if chance >= 1.0 or group is not None else (index, chance)
+        flatten_emitter(
+            part_name,
+            options.pop("count", None),
+            options.pop("intensity", 1.0),
+            options.pop("color_base", None),
+            options,
+            part_group,
+            leaves,
+        )
+
+
+class EmitterTemplate:
+    """Plain presets flattened into per-particle range arrays for NumPy sampling"""
+
+    # Random streams drawn per particle, one row each
+    RANGES = ["offset_x", "offset_y", "speed", "vx", "vy", "gravity", "lifetime", "size", "alpha"]
+    STREAMS = len(RANGES) + 9  # + palette pick, gray, 3 colour jitter, secondary roll, 2 spread, glow roll
+
+    def __init__(self, leaves, screen_scale):
+        lows, spans = [], []
+        palette, palette_start, palette_length = [], [], []
+        gray_span, jitter, flags, glow_chance = [], [], [], []
+        secondary_chance, secondary_scale, secondary_alpha, secondary_spread = [], [], [], []
+
+        for _, preset, n, intensity, color_base in leaves:
+            distance = (screen_scale if preset.get("scaled") else 1.0) * intensity
+            low = np.zeros((len(self.RANGES), n), np.float32)
+            span = np.zeros((len(self.RANGES), n), np.float32)
+
+            def set_range(row, value, factor=1.0):
+                if not isinstance(value, tuple):
+                    low[row] = value * factor
+                elif preset.get("ramp"):
+                    # Evenly stepped values are fixed at compile time (shockwave rings)
+                    low[row] = np.linspace(value[0] * factor, value[1] * factor, n)
+                else:
+                    low[row] = value[0] * factor
+                    span[row] = (value[1] - value[0]) * factor
+
+            offset_x, offset_y = preset.get("offset", (0, 0))
+            set_range(0, (-offset_x, offset_x), distance)
+            set_range(1, (-offset_y, offset_y), distance)
+            if "speed" in preset:
+                set_range(2, preset["speed"], distance)
+            elif "velocity" in preset:
+                set_range(3, preset["velocity"][0])
+                set_range(4, preset["velocity"][1])
+            set_range(5, preset.get("gravity", 0.0), distance)
+            set_range(6, preset["lifetime"], intensity)
+            set_range(7, preset["size"], distance)
+            set_range(8, preset.get("alpha", 255))
+            lows.append(low)
+            spans.append(span)
+
+            # Colours are palette entry + shared gray offset + per-channel jitter
+            if color_base is not None:
+                entries, gray, channel_jitter = [color_base], 0, preset.get("color_jitter", 0)
+            elif "gray" in preset:
+                low_gray, high_gray = preset["gray"]
+                entries, gray, channel_jitter = [(low_gray,) * 3], high_gray - low_gray, 0
+            else:
+                entries, gray, channel_jitter = preset["palette"], 0, 0
+            palette_start.append(np.full(n, len(palette), np.int32))
+            palette_length.append(np.full(n, len(entries), np.int32))
+            palette.extend(entries)
+            gray_span.append(np.full(n, gray, np.float32))
+            jitter.append(np.full(n, channel_jitter, np.float32))
+            flags.append(np.full(n, PARTICLE_SHRINK if preset.get("shrink", True) else 0, np.uint8))
+            glow_chance.append(np.full(n, preset.get("glow", 0.0), np.float32))
+
+            # Secondary particles: x, y kept, other rows scaled, alpha replaced
+            secondary = preset.get("secondary") or {"chance": 0.0}
+            scale_rows = np.ones((len(ParticleArrays.FIELDS), n), np.float32)
+            scale_rows[2:4] = secondary.get("velocity", 1.0)
+            scale_rows[4] = secondary.get("gravity", 1.0)
+            scale_rows[5:7] = secondary.get("lifetime", 1.0)
+            scale_rows[7:9] = secondary.get("size", 1.0)
+            scale_rows[9] = 0.0
+            secondary_chance.append(np.full(n, secondary["chance"], np.float32))
+            secondary_scale.append(scale_rows)
+            secondary_alpha.append(np.full(n, secondary.get("alpha", 255), np.float32))
+            secondary_spread.append(np.full(n, secondary.get("offset", 0), np.float32))
+
+        self.size = sum(leaf[2] for leaf in leaves)
+        self.low = np.concatenate(lows, axis=1)
+        self.span = np.concatenate(spans, axis=1)
+        self.palette = np.asarray(palette, np.float32)
+        self.palette_start = np.concatenate(palette_start)
+        self.palette_length = np.concatenate(palette_length)
+        self.gray_span = np.concatenate(gray_span)[:, None]
+        self.jitter = np.concatenate(jitter)[:, None]
+        self.flags = np.concatenate(flags)
+        self.glow_chance = np.concatenate(glow_chance)
+        self.has_glow = bool(self.glow_chance.any())
+        self.secondary_chance = np.concatenate(secondary_chance)
+        self.secondary_scale = np.concatenate(secondary_scale, axis=1)
+        self.secondary_alpha = np.concatenate(secondary_alpha)
+        self.secondary_spread = np.concatenate(secondary_spread)
+        self.has_secondary = bool(self.secondary_chance.any())
+
+    def sample(self, x, y, tables):
+        """Return (block, color, flags) rows for ParticleArrays.spawn_block"""
+        n = self.size
+        streams = tables.take(n * self.STREAMS).reshape(self.STREAMS, n)
+        values = self.low + self.span * streams[: len(self.RANGES)]
+        cos_table, sin_table = tables.take_directions(n)
+
+        # Rows follow ParticleArrays.FIELDS
+        block = np.empty((len(ParticleArrays.FIELDS), n), dtype=np.float32)
+        block[0] = values[0] + x
+        block[1] = values[1] + y
+        block[2] = cos_table * values[2] + values[3]
+        block[3] = sin_table * values[2] + values[4]
+        block[4] = values[5]
+        block[5] = block[6] = values[6]
+        block[7] = block[8] = values[7]
+        block[9] = values[8]
+
+        extra_streams = streams[len(self.RANGES) :]
+        pick = self.palette_start + (extra_streams[0] * self.palette_length).astype(np.int32)
+        color = (
+            self.palette[pick]
+            + self.gray_span * extra_streams[1][:, None]
+            + self.jitter * (extra_streams[2:5].T * 2 - 1)
+        )
+        color = np.clip(color, 0, 255).astype(np.uint8)
+        flags = self.flags
+        if self.has_glow:
+            flags = flags | np.where(extra_streams[8] < self.glow_chance, PARTICLE_GLOW, 0).astype(
+                np.uint8
+            )
+
+        if self.has_secondary:
+            chosen = extra_streams[5] < self.secondary_chance
+            if chosen.any():
+                extra = block[:, chosen] * self.secondary_scale[:, chosen]
+                extra[9] = self.secondary_alpha[chosen]
+                extra[0:2] += self.secondary_spread[chosen] * (extra_streams[6:8, chosen] * 2 - 1)
+                block = np.concatenate([block, extra], axis=1)
+                color = np.concatenate([color, color[chosen]])
+                flags = np.concatenate([flags, flags[chosen]])
+        return block, color, flags
+
+
+# Compiled emitters keyed by emitter arguments and screen scale
+_emitter_templates = {}
+
+
+def get_emitter_templates(name, count=None, intensity=1.0, color_base=None, overrides=None):
+    """Return [(chance, EmitterTemplate)] for an emitter, compiling it on first use"""
+    screen_scale = scale_value(1.0)
+    key = (
+        name,
+        count,
+        intensity,
+        color_base,
+        tuple(sorted((overrides or {}).items())),
+        screen_scale,
+    )
+    templates = _emitter_templates.get(key)
+    if templates is None:
+        leaves = []
+        flatten_emitter(name, count, intensity, color_base, overrides, None, leaves)
+        groups = {}
+        for leaf in leaves:
+            groups.setdefault(leaf[0], []).append(leaf)
+        templates = [
+            (1.0 if group is None else group[1], EmitterTemplate(group_leaves, screen_scale))
+            for group, group_leaves in groups.items()
+        ]
+        _emitter_templates[key] = templates
+    return templates
+
+
+# Road decal settings
+DECAL_PIXELS_PER_METER = 6.0  # Road scroll per unit of distance_traveled (obstacle speed at 60 FPS)
+DECAL_MARGIN = 256  # Hidden rows above the screen where new road details are painted
+DECAL_ALPHA = 170  # Marks are drawn slightly see-through over the road
+DECAL_COLORKEY = (255, 0, 255)  # Unpainted decal pixels
+ROAD_DETAIL_CHANCE = 0.003  # Chance per newly exposed row of painting a crack or patch
+
+
+class DecalLayer:
+    """Road marks painted once into a ring surface that scrolls with distance"""
+
+    def __init__(self, width, height):
+        self.resize(width, height)
+
+    def resize(self, width, height):
+        """Recreate the ring for a new screen size, dropping existing marks"""
+        self.width = width
+        self.height = height
+        self.ring_height = height + DECAL_MARGIN
+        # Colorkey plus surface alpha blits much faster than per-pixel alpha
+        self.surface = pygame.Surface((width, self.ring_height))
+        self.surface.set_colorkey(DECAL_COLORKEY)
+        self.surface.set_alpha(DECAL_ALPHA)
+        self.scroll = 0
+        self.clear()
+
+    def clear(self):
+        self.surface.fill(DECAL_COLORKEY)
+        self.last_mark_scroll = None
+
+    def _offset(self):
+        # Ring row of screen row 0; screen row y lives at (y + offset) % ring_height
+        return (DECAL_MARGIN - self.scroll) % self.ring_height
+
+    def set_distance(self, distance):
+        """Scroll to a distance; returns how many new rows came in at the top"""
+        target = int(distance * DECAL_PIXELS_PER_METER)
+        delta = target - self.scroll
+        if delta < 0:
+            # New run: start from a clean road
+            self.scroll = target
+            self.clear()
+            return 0
+        if delta == 0:
+            return 0
+
+        self.scroll = target
+        if delta >= self.ring_height:
+            self.clear()
+            return delta
+
+        # Rows that just scrolled off the bottom come back as the hidden rows
+        # above the screen; wipe them so they can be painted again
+        top = (self._offset() - DECAL_MARGIN) % self.ring_height
+        first = min(delta, self.ring_height - top)
+        self.surface.fill(DECAL_COLORKEY, (0, top, self.width, first))
+        if first < delta:
+            self.surface.fill(DECAL_COLORKEY, (0, 0, self.width, delta - first))
+        return delta
+
+    def stamp(self, draw, top, bottom):
+        """Paint with draw(surface, y_offset) in screen coordinates spanning [top, bottom)"""
+        offset = self._offset()
+        draw(self.surface, offset)
+        # Repeat across the ring seam when the mark straddles it
+        if top + offset < 0:
+            draw(self.surface, offset + self.ring_height)
+        if bottom + offset > self.ring_height:
+            draw(self.surface, offset - self.ring_height)
+        self.last_mark_scroll = self.scroll
+
+    def stamp_marks(self, preset, x, y, count=None, size_factor=1.0):
+        """Paint a batch of round marks described by an emitter preset"""
+        tables = emitter_tables
+        offset_x, offset_y = preset.get("offset", (0, 0))
+        low_gray, high_gray = preset["gray"]
+        marks = []
+        for _ in range(preset["count"] if count is None else count):
+            radius = max(1, int(tables.uniform(*preset["size"]) * size_factor))
+            gray = int(tables.uniform(low_gray, high_gray))
+            marks.append(
+                (
+                    (gray, gray, gray),
+                    int(x + tables.uniform(-offset_x, offset_x)),
+                    int(y + tables.uniform(-offset_y, offset_y)),
+                    radius,
+                )
+            )
+
+        def draw(surface, y_offset):
+            for color, mark_x, mark_y, radius in marks:
+                pygame.draw.circle(surface, color, (mark_x, mark_y + y_offset), radius)
+
+        reach = offset_y + 6 * size_factor
+        self.stamp(draw, y - reach, y + reach)
+
+    def draw(self, screen):
+        """Blit the visible part of the ring in at most two pieces"""
+        if screen.get_size() != (self.width, self.height):
+            self.resize(*screen.get_size())
+            return
+        # Nothing painted within the last ring's worth of scrolling
+        if self.last_mark_scroll is None or self.scroll - self.last_mark_scroll > self.ring_height:
+            return
+        start = self._offset()
+        first = min(self.height, self.ring_height - start)
+        screen.blit(self.surface, (0, 0), (0, start, self.width, first))
+        if first < self.height:
+            screen.blit(self.surface, (0, first), (0, 0, self.width, self.height - first))
+
+
 class ParticleSystem:
-    def __init__(self):
-        self.particles: List[Particle] = []
-        self.last_update_time = time.time()
-        # Pre-create some surfaces for common particle sizes to improve performance
-        self.surface_cache = {}
-
-    def add_particle(self, particle: Particle) -> None:
-        """Add a particle with a limit for performance"""
-        # Stricter limit on total particles for better performance
-        if len(self.particles) >= 50:  # Reduced from 100 to 50
-            # Replace oldest particle instead of just dropping new ones
-            oldest_index = 0
-            oldest_time = float("inf")
-            for i, p in enumerate(self.particles):
-                if p.creation_time < oldest_time:
-                    oldest_time = p.creation_time
-                    oldest_index = i
-            self.particles[oldest_index] = particle
+    def __init__(self, max_particles: int = PARTICLE_CAP):
+        # Live particle limit before the quality tier's scale is applied
+        self.max_particles = max_particles
+        # NumPy store when available, otherwise Particle objects oldest first
+        self.arrays = ParticleArrays() if np is not None else None
+        # Optional DecalLayer that takes tire marks instead of the particle pool
+        self.decals = None
+        # Object fallback keeps one spawn-ordered deque per budget category
+        self.particles = [deque() for _ in PARTICLE_CATEGORY_NAMES]
+
+        # Per-category budget bookkeeping, indexed like PARTICLE_CATEGORY_NAMES
+        self.priorities = [PARTICLE_CATEGORIES[name]["priority"] for name in PARTICLE_CATEGORY_NAMES]
+        self.shed_order = sorted(range(len(PARTICLE_CATEGORY_NAMES)), key=self.priorities.__getitem__)
+        self.live_counts = [0] * len(PARTICLE_CATEGORY_NAMES)
+        self.spawned_counts = [0] * len(PARTICLE_CATEGORY_NAMES)
+        self.shed_counts = [0] * len(PARTICLE_CATEGORY_NAMES)
+        self.dropped_counts = [0] * len(PARTICLE_CATEGORY_NAMES)
+
+        # Retired Particle objects waiting to be reused by the object fallback
+        self.free_particles = []
+        self.particles_allocated = 0
+        self.particles_recycled = 0
+
+        self.last_update_time = time.perf_counter()
+        # Circle sprites keyed by (size, packed colour, alpha bucket)
+        self.sprite_cache = {}
+        # Soft additive glow sprites and the reduced-resolution buffer they land in
+        self.glow_sprite_cache = {}
+        self.glow_buffer = None
+
+    def __len__(self):
+        return sum(self.live_counts)
+
+    def particle_limit(self) -> int:
+        """Live particle limit for the current quality tier"""
+        return max(1, int(self.max_particles * current_quality["particle_scale"]))
+
+    def make_room(self, category: int, amount: int) -> int:
+        """Shed particles so a category can add amount more; returns how many fit"""
+        limit = self.particle_limit()
+        needed = sum(self.live_counts) + amount - limit
+        if needed <= 0:
+            return amount
+
+        reserved = [
+            int(limit * PARTICLE_CATEGORIES[name]["share"]) for name in PARTICLE_CATEGORY_NAMES
+        ]
+        # A category below its reserved share may reclaim room from anyone over
+        # theirs; otherwise it can only push out lower-priority categories
+        below_share = self.live_counts[category] < reserved[category]
+        for victim in self.shed_order:
+            if needed <= 0:
+                break
+            if victim == category:
+                continue
+            if not below_share and self.priorities[victim] >= self.priorities[category]:
+                continue
+            excess = self.live_counts[victim] - reserved[victim]
+            if excess > 0:
+                needed -= self.shed(victim, min(excess, needed))
+
+        # Then recycle the category's own oldest particles
+        if needed > 0:
+            needed -= self.shed(category, min(self.live_counts[category], needed))
+
+        # Whatever still doesn't fit is dropped from the new batch
+        if needed > 0:
+            self.dropped_counts[category] += needed
+            return amount - needed
+        return amount
+
+    def shed(self, category: int, amount: int) -> int:
+        """Retire a category's oldest particles; returns how many went"""
+        if amount <= 0:
+            return 0
+        if self.arrays is not None:
+            removed = self.arrays.kill_oldest(category, amount)
+        else:
+            queue = self.particles[category]
+            removed = min(amount, len(queue))
+            for _ in range(removed):
+                self.release_particle(queue.popleft())
+        self.live_counts[category] -= removed
+        self.shed_counts[category] += removed
+        return removed
+
+    def record_spawned(self, category: int, amount: int, evicted: int = 0) -> None:
+        self.live_counts[category] += amount
+        self.spawned_counts[category] += amount
+        if evicted:
+            # The store's ring overflowed; recount instead of guessing
+            self.live_counts = self.arrays.category_counts(len(PARTICLE_CATEGORY_NAMES))
+
+    def budget_stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-category counters for profiling"""
+        limit = self.particle_limit()
+        return {
+            name: {
+                "live": self.live_counts[i],
+                "reserved": int(limit * PARTICLE_CATEGORIES[name]["share"]),
+                "spawned": self.spawned_counts[i],
+                "shed": self.shed_counts[i],
+                "dropped": self.dropped_counts[i],
+            }
+            for i, name in enumerate(PARTICLE_CATEGORY_NAMES)
+        }
+
+    def acquire_particle(self, *args, **kwargs) -> Particle:
+        """Reuse a retired Particle when one is free, otherwise allocate"""
+        if self.free_particles:
+            self.particles_recycled += 1
+            return self.free_particles.pop().reset(*args, **kwargs)
+        self.particles_allocated += 1
+        return Particle(*args, **kwargs)
+
+    def release_particle(self, particle: Particle) -> None:
+        # The free list never needs to outgrow the live limit
+        if len(self.free_particles) < self.max_particles:
+            self.free_particles.append(particle)
+
+    def add_particle(self, particle: Particle, category: str = "misc") -> None:
+        """Add a particle, charged to a budget category"""
+        index = PARTICLE_CATEGORY_NAMES.index(category)
+        if not self.make_room(index, 1):
+            self.release_particle(particle)
+            return
+
+        evicted = 0
+        if self.arrays is not None:
+            evicted = self.arrays.spawn(
+                particle.x,
+                particle.y,
+                particle.vx,
+                particle.vy,
+                particle.lifetime,
+                particle.size,
+                particle.color,
+                alpha=particle.alpha,
+                shrink=particle.shrink,
+                gravity=particle.gravity,
+                glow=particle.glow,
+                category=index,
+            )
+            # The store copied the fields, so the object can go straight back
+            self.release_particle(particle)
         else:
-            self.particles.append(particle)
+            self.particles[index].append(particle)
+        self.record_spawned(index, 1, evicted)
 
     def update(self, dt: float) -> None:
         """Update all particles with improved performance"""
         # If dt is not provided or is zero, calculate it
         if dt <= 0:
-            current_time = time.time()
+            current_time = time.perf_counter()
             dt = current_time - self.last_update_time
             self.last_update_time = current_time
 
         # Cap dt to avoid large jumps
         dt = min(dt, 0.1)
 
-        # More efficient in-place filtering
-        i = 0
-        while i < len(self.particles):
-            particle = self.particles[i]
-            particle.update(dt)
-            if particle.is_alive():
-                i += 1
-            else:
-                # Remove dead particles in-place (faster than creating a new list)
-                self.particles[i] = self.particles[-1]
-                self.particles.pop()
-
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw all particles with improved performance"""
-        # Performance optimization: Get screen rect once
-        screen_rect = screen.get_rect()
+        if self.arrays is not None:
+            self.arrays.update(dt)
+            self.live_counts = self.arrays.category_counts(len(PARTICLE_CATEGORY_NAMES))
+            return
 
-        # Batch similar particles together to reduce surface creation
-        for particle in self.particles:
-            if particle.lifetime <= 0:
-                continue
+        # Rotate through each deque once, re-appending survivors so spawn order
+        # (and with it oldest-first shedding) is preserved
+        for index, queue in enumerate(self.particles):
+            for _ in range(len(queue)):
+                particle = queue.popleft()
+                particle.update(dt)
+                if particle.is_alive():
+                    queue.append(particle)
+                else:
+                    self.release_particle(particle)
+            self.live_counts[index] = len(queue)
+
+    def get_sprite(self, size, packed_color, alpha_bucket):
+        """Return the pre-rendered circle sprite for a (size, colour, alpha bucket)"""
+        key = (size, packed_color, alpha_bucket)
+        sprite = self.sprite_cache.get(key)
+        if sprite is None:
+            if len(self.sprite_cache) >= PARTICLE_SPRITE_CACHE_LIMIT:
+                self.sprite_cache.clear()
+            color = (
+                (packed_color >> 16) & 255,
+                (packed_color >> 8) & 255,
+                packed_color & 255,
+                alpha_bucket * 255 // (PARTICLE_ALPHA_BUCKETS - 1),
+            )
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (size, size), size)
+            self.sprite_cache[key] = sprite
+        return sprite
+
+    def build_blit_sequence(self, width, height):
+        """Cull particles against the screen and pair the rest with their sprites"""
+        if self.arrays is not None:
+            live = self.arrays.live_rows()
+            x = self.arrays.x[live]
+            y = self.arrays.y[live]
+            size = self.arrays.size[live].astype(np.int32)
+            bucket = (
+                np.clip(self.arrays.alpha[live], 0, 255).astype(np.int32)
+                * (PARTICLE_ALPHA_BUCKETS - 1)
+                + 127
+            ) // 255
+            color = self.arrays.color[live].astype(np.int32)
+            packed = (color[:, 0] << 16) | (color[:, 1] << 8) | color[:, 2]
+
+            # Bulk culling: off-screen, zero-size and fully faded particles
+            visible = (
+                (size > 0)
+                & (bucket > 0)
+                & (x > -size)
+                & (x < width + size)
+                & (y > -size)
+                & (y < height + size)
+            )
+            rows = zip(
+                (x[visible] - size[visible]).astype(np.int32).tolist(),
+                (y[visible] - size[visible]).astype(np.int32).tolist(),
+                size[visible].tolist(),
+                packed[visible].tolist(),
+                bucket[visible].tolist(),
+            )
+        else:
+            rows = []
+            for p in (p for queue in self.particles for p in queue):
+                size = int(p.size)
+                bucket = (
+                    max(0, min(255, int(p.alpha))) * (PARTICLE_ALPHA_BUCKETS - 1) + 127
+                ) // 255
+                if (
+                    p.lifetime <= 0
+                    or size <= 0
+                    or bucket <= 0
+                    or not (-size < p.x < width + size and -size < p.y < height + size)
+                ):
+                    continue
+                r, g, b = (max(0, min(255, int(c))) for c in p.color[:3])
+                rows.append(
+                    (int(p.x) - size, int(p.y) - size, size, (r << 16) | (g << 8) | b, bucket)
+                )
 
-            # Simple culling - only draw particles that might be visible
-            if (
-                particle.x < -50
-                or particle.x > screen_rect.width + 50
-                or particle.y < -50
-                or particle.y > screen_rect.height + 50
-            ):
-                continue
+        get_sprite = self.get_sprite
+        return [
+            (get_sprite(size, packed_color, bucket), (left, top))
+            for left, top, size, packed_color, bucket in rows
+        ]
 
-            try:
-                # Round size to nearest integer to improve cache hits
-                size = int(particle.size)
-                if size <= 0:
+    def get_glow_sprite(self, radius, packed_color, alpha_bucket):
+        """Return a soft radial glow sprite for additive blending"""
+        key = (radius, packed_color, alpha_bucket)
+        sprite = self.glow_sprite_cache.get(key)
+        if sprite is None:
+            if len(self.glow_sprite_cache) >= PARTICLE_SPRITE_CACHE_LIMIT:
+                self.glow_sprite_cache.clear()
+            brightness = GLOW_STRENGTH * alpha_bucket / (PARTICLE_ALPHA_BUCKETS - 1)
+            base = (
+                (packed_color >> 16) & 255,
+                (packed_color >> 8) & 255,
+                packed_color & 255,
+            )
+            sprite = pygame.Surface((radius * 2, radius * 2))
+            sprite.fill(BLACK)
+            # Concentric discs, brightest in the middle; black adds nothing
+            steps = max(1, min(radius, 4))
+            for step in range(steps):
+                falloff = brightness * (step + 1) / steps
+                pygame.draw.circle(
+                    sprite,
+                    tuple(int(c * falloff) for c in base),
+                    (radius, radius),
+                    max(1, radius * (steps - step) // steps),
+                )
+            self.glow_sprite_cache[key] = sprite
+        return sprite
+
+    def build_glow_sequence(self, width, height):
+        """Glow sprites and positions in glow buffer coordinates"""
+        scale = GLOW_BUFFER_SCALE
+        if self.arrays is not None:
+            live = self.arrays.live_rows()
+            glowing = (self.arrays.flags[live] & PARTICLE_GLOW) != 0
+            if not glowing.any():
+                return []
+            x = self.arrays.x[live][glowing] * scale
+            y = self.arrays.y[live][glowing] * scale
+            radius = np.maximum(
+                1, (self.arrays.size[live][glowing] * (GLOW_RADIUS * scale)).astype(np.int32)
+            )
+            bucket = (
+                np.clip(self.arrays.alpha[live][glowing], 0, 255).astype(np.int32)
+                * (PARTICLE_ALPHA_BUCKETS - 1)
+                + 127
+            ) // 255
+            color = self.arrays.color[live][glowing].astype(np.int32)
+            packed = (color[:, 0] << 16) | (color[:, 1] << 8) | color[:, 2]
+            visible = (
+                (bucket > 0)
+                & (x > -radius)
+                & (x < width * scale + radius)
+                & (y > -radius)
+                & (y < height * scale + radius)
+            )
+            rows = zip(
+                (x[visible] - radius[visible]).astype(np.int32).tolist(),
+                (y[visible] - radius[visible]).astype(np.int32).tolist(),
+                radius[visible].tolist(),
+                packed[visible].tolist(),
+                bucket[visible].tolist(),
+            )
+        else:
+            rows = []
+            for p in (p for queue in self.particles for p in queue):
+                if not p.glow or p.lifetime <= 0:
                     continue
+                radius = max(1, int(p.size * GLOW_RADIUS * scale))
+                bucket = (
+                    max(0, min(255, int(p.alpha))) * (PARTICLE_ALPHA_BUCKETS - 1) + 127
+                ) // 255
+                x, y = p.x * scale, p.y * scale
+                if bucket <= 0 or not (
+                    -radius < x < width * scale + radius
+                    and -radius < y < height * scale + radius
+                ):
+                    continue
+                r, g, b = (max(0, min(255, int(c))) for c in p.color[:3])
+                rows.append(
+                    (int(x) - radius, int(y) - radius, radius, (r << 16) | (g << 8) | b, bucket)
+                )
 
-                # Make sure alpha is within valid range
-                alpha = max(0, min(255, particle.alpha))
+        get_glow_sprite = self.get_glow_sprite
+        return [
+            (get_glow_sprite(radius, packed_color, bucket), (left, top), None, BLEND_ADD)
+            for left, top, radius, packed_color, bucket in rows
+        ]
 
-                # Make sure color values are valid
-                r = max(0, min(255, particle.color[0]))
-                g = max(0, min(255, particle.color[1]))
-                b = max(0, min(255, particle.color[2]))
+    def draw_glow(self, screen: pygame.Surface) -> None:
+        """Add glowing particles through a reduced-resolution additive buffer"""
+        width, height = screen.get_size()
+        sequence = self.build_glow_sequence(width, height)
+        if not sequence:
+            return
 
-                # Use cached surface if available for this size
-                surface_key = size
-                if surface_key not in self.surface_cache:
-                    # Create and cache a new surface for this size
-                    self.surface_cache[surface_key] = pygame.Surface(
-                        (size * 2, size * 2), pygame.SRCALPHA
-                    )
+        buffer_size = (
+            max(1, int(width * GLOW_BUFFER_SCALE)),
+            max(1, int(height * GLOW_BUFFER_SCALE)),
+        )
+        if self.glow_buffer is None or self.glow_buffer.get_size() != buffer_size:
+            self.glow_buffer = pygame.Surface(buffer_size)
+
+        # Only the area the glows touched gets cleared, upscaled and added
+        touched = pygame.Rect(sequence[0][1], sequence[0][0].get_size()).unionall(
+            [pygame.Rect(dest, sprite.get_size()) for sprite, dest, _, _ in sequence[1:]]
+        ).clip(self.glow_buffer.get_rect())
+        if touched.width == 0 or touched.height == 0:
+            return
+        self.glow_buffer.fill(BLACK, touched)
+        self.glow_buffer.blits(sequence, doreturn=False)
 
-                # Get the cached surface and clear it
-                particle_surface = self.surface_cache[surface_key]
-                particle_surface.fill((0, 0, 0, 0))
+        inverse = 1.0 / GLOW_BUFFER_SCALE
+        glow = pygame.transform.smoothscale(
+            self.glow_buffer.subsurface(touched),
+            (int(touched.width * inverse), int(touched.height * inverse)),
+        )
+        screen.blit(
+            glow,
+            (int(touched.x * inverse), int(touched.y * inverse)),
+            special_flags=BLEND_ADD,
+        )
 
-                # Draw the particle with alpha
-                pygame.draw.circle(
-                    particle_surface,
-                    (r, g, b, alpha),
-                    (size, size),
-                    size,
-                )
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw all particles as cached sprites in a single blits call"""
+        sequence = self.build_blit_sequence(screen.get_width(), screen.get_height())
+        if sequence:
+            screen.blits(sequence, doreturn=False)
 
-                # Blit the particle surface onto the screen
-                screen.blit(particle_surface, (particle.x - size, particle.y - size))
-            except:
-                # Silently fail if there's an error drawing a particle
-                pass
+        # The cheapest quality tier skips glow like it skips glow rings
+        if current_quality["glow_layers"] > 0:
+            self.draw_glow(screen)
 
-    def create_spark(
-        self, x: float, y: float, count: int = 5, intensity: float = 1.0
+    def emit(
+        self,
+        name: str,
+        x: float,
+        y: float,
+        count: int = None,
+        intensity: float = 1.0,
+        color_base: Tuple[int, int, int] = None,
+        category: str = None,
+        **overrides,
     ) -> None:
-        """Create spark particles at the given position with adjustable intensity - optimized version"""
-        for _ in range(count):
-            # Random velocity in all directions
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 150) * intensity * scale_value(1.0)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
+        """Spawn a batch of particles described by an EMITTER_PRESETS entry"""
+        # The whole effect is charged to one budget category
+        category = PARTICLE_CATEGORY_NAMES.index(
+            category or EMITTER_PRESETS[name].get("category", "misc")
+        )
+        if self.arrays is None:
+            self._emit_preset(name, x, y, count, intensity, color_base, overrides, category)
+            return
 
-            # Simplified color choices - fewer options
-            color_choice = random.choice(
-                [
-                    (255, 255, 0),  # Yellow
-                    (255, 165, 0),  # Orange
-                ]
+        # Every part of a composite effect lands in the store with one spawn
+        batches = [
+            template.sample(x, y, emitter_tables)
+            for chance, template in get_emitter_templates(
+                name, count, intensity, color_base, overrides
             )
+            if chance >= 1.0 or emitter_tables.uniform(0.0, 1.0) < chance
+        ]
+        if not batches:
+            return
+        if len(batches) == 1:
+            block, color, flags = batches[0]
+        else:
+            blocks, colors, flags = zip(*batches)
+            block = np.concatenate(blocks, axis=1)
+            color = np.concatenate(colors)
+            flags = np.concatenate(flags)
+
+        total = block.shape[1]
+        allowed = self.make_room(category, total)
+        if allowed < total:
+            # Keep the newest part of the batch, like eviction would
+            block, color, flags = block[:, total - allowed :], color[total - allowed :], flags[total - allowed :]
+        if allowed:
+            evicted = self.arrays.spawn_block(block, color, flags, category=category)
+            self.record_spawned(category, allowed, evicted)
+
+    def _emit_preset(self, name, x, y, count, intensity, color_base, overrides, category):
+        """Expand composite presets into Particle objects (no NumPy)"""
+        preset = EMITTER_PRESETS[name]
+        if overrides:
+            preset = {**preset, **overrides}
+
+        # Composite effects are lists of other presets, some only by chance
+        if "burst" in preset:
+            for part_name, part_options, chance in preset["burst"]:
+                if chance >= 1.0 or emitter_tables.uniform(0.0, 1.0) < chance:
+                    options = dict(part_options)
+                    self._emit_preset(
+                        part_name,
+                        x,
+                        y,
+                        options.pop("count", None),
+                        options.pop("intensity", 1.0),
+                        options.pop("color_base", None),
+                        options,
+                        category,
+                    )
+            return
+
+        n = preset["count"] if count is None else count
+        if n <= 0:
+            return
+        # Distances follow the screen size for presets marked scaled
+        distance = (scale_value(1.0) if preset.get("scaled") else 1.0) * intensity
+        self._emit_objects(preset, n, x, y, distance, intensity, color_base, category)
+
+    def _emit_objects(self, preset, n, x, y, distance, intensity, color_base, category):
+        """Sample a preset batch into Particle objects from the pre-sampled tables"""
+        tables = emitter_tables
+        ramp = preset.get("ramp")
+
+        def sample(value, i, factor=1.0):
+            if not isinstance(value, tuple):
+                return value * factor
+            low, high = value
+            if ramp:
+                step = i / (n - 1) if n > 1 else 0.0
+                return (low + (high - low) * step) * factor
+            return tables.uniform(low, high) * factor
+
+        offset_x, offset_y = preset.get("offset", (0, 0))
+        secondary = preset.get("secondary")
+        for i in range(n):
+            px = x + sample((-offset_x, offset_x), i, distance)
+            py = y + sample((-offset_y, offset_y), i, distance)
+            if "speed" in preset:
+                speed = sample(preset["speed"], i, distance)
+                direction_x, direction_y = tables.direction()
+                velocity = (direction_x * speed, direction_y * speed)
+            elif "velocity" in preset:
+                velocity = (
+                    sample(preset["velocity"][0], i),
+                    sample(preset["velocity"][1], i),
+                )
+            else:
+                velocity = (0, 0)
+
+            if color_base is not None:
+                jitter = preset.get("color_jitter", 0)
+                color = tuple(
+                    int(min(255, max(0, c + tables.uniform(-jitter, jitter))))
+                    for c in color_base
+                )
+            elif "gray" in preset:
+                gray = int(sample(preset["gray"], i))
+                color = (gray, gray, gray)
+            else:
+                palette = preset["palette"]
+                color = palette[int(tables.uniform(0, len(palette))) % len(palette)]
 
-            # Create the particle with enhanced properties based on intensity
-            particle = Particle(
-                x=x + random.uniform(-5, 5) * intensity * scale_value(1.0),
-                y=y + random.uniform(-5, 5) * intensity * scale_value(1.0),
-                color=color_choice,
-                size=random.uniform(1, 3) * intensity * scale_value(1.0),
+            particle = self.acquire_particle(
+                x=px,
+                y=py,
+                color=color,
+                size=sample(preset["size"], i, distance),
                 velocity=velocity,
-                lifetime=random.uniform(0.2, 0.6) * intensity,  # Shorter lifetime
-                shrink=True,
-                gravity=random.uniform(-10, 10) * intensity * scale_value(1.0),
-            )
-            self.add_particle(particle)
-
-            # Add a glow effect for fewer particles
-            if random.random() < 0.2:  # Reduced from 0.3 to 0.2
-                glow = Particle(
-                    x=particle.x,
-                    y=particle.y,
-                    color=color_choice,
-                    size=particle.size * 1.5,  # Smaller glow (reduced from 2)
-                    velocity=particle.velocity,
-                    lifetime=particle.lifetime * 0.7,
-                    alpha=80,  # Reduced from 100
-                    shrink=True,
-                    gravity=particle.gravity,
+                lifetime=sample(preset["lifetime"], i, intensity),
+                alpha=int(sample(preset.get("alpha", 255), i)),
+                shrink=preset.get("shrink", True),
+                gravity=sample(preset.get("gravity", 0.0), i, distance),
+                glow=tables.uniform(0.0, 1.0) < preset.get("glow", 0.0),
+            )
+            self.add_particle(particle, PARTICLE_CATEGORY_NAMES[category])
+
+            if secondary and tables.uniform(0.0, 1.0) < secondary["chance"]:
+                spread = secondary.get("offset", 0)
+                speed_factor = secondary.get("velocity", 1.0)
+                self.add_particle(
+                    self.acquire_particle(
+                        x=particle.x + tables.uniform(-spread, spread),
+                        y=particle.y + tables.uniform(-spread, spread),
+                        color=color,
+                        size=particle.size * secondary.get("size", 1.0),
+                        velocity=(velocity[0] * speed_factor, velocity[1] * speed_factor),
+                        lifetime=particle.lifetime * secondary.get("lifetime", 1.0),
+                        alpha=secondary.get("alpha", 255),
+                        shrink=particle.shrink,
+                        gravity=particle.gravity * secondary.get("gravity", 1.0),
+                    ),
+                    PARTICLE_CATEGORY_NAMES[category],
                 )
-                self.add_particle(glow)
+
+    def create_spark(
+        self,
+        x: float,
+        y: float,
+        count: int = 5,
+        intensity: float = 1.0,
+        category: str = None,
+    ) -> None:
+        """Create spark particles at the given position with adjustable intensity"""
+        self.emit("spark", x, y, count=count, intensity=intensity, category=category)
 
     def create_smoke(
         self,
         x: float,
         y: float,
-        count: int = 3,  # Reduced default from 5 to 3
+        count: int = 3,
         color_base: Tuple[int, int, int] = None,
     ) -> None:
-        """Create smoke particles at the given position with optional color base - optimized version"""
-        for _ in range(count):
-            # Upward and slightly random velocity
-            velocity = (random.uniform(-10, 10), random.uniform(-30, -10))
-
-            # Color with random variation
-            if color_base:
-                # Use provided color base with some variation
-                r = min(255, max(0, color_base[0] + random.randint(-20, 20)))
-                g = min(255, max(0, color_base[1] + random.randint(-20, 20)))
-                b = min(255, max(0, color_base[2] + random.randint(-20, 20)))
-                color = (r, g, b)
-            else:
-                # Default gray smoke
-                gray_value = random.randint(150, 200)
-                color = (gray_value, gray_value, gray_value)
-
-            # Create the particle with more dynamic properties
-            particle = Particle(
-                x=x + random.uniform(-8, 8),  # Add position variation
-                y=y + random.uniform(-8, 8),
-                color=color,
-                size=random.uniform(5, 15),  # Smaller size range (was 5-20)
-                velocity=velocity,
-                lifetime=random.uniform(0.5, 1.5),  # Shorter lifetime (was 0.5-2.5)
-                shrink=True,  # Always shrink for consistency
-                gravity=random.uniform(-8, -2),  # Variable rise speed
-            )
-            self.add_particle(particle)
-
-            # Add smaller particles less frequently
-            if random.random() < 0.3:  # Reduced from 0.5 to 0.3
-                small_particle = Particle(
-                    x=particle.x + random.uniform(-5, 5),
-                    y=particle.y + random.uniform(-5, 5),
-                    color=color,
-                    size=particle.size * 0.5,
-                    velocity=(
-                        velocity[0] * 1.2,
-                        velocity[1] * 1.2,
-                    ),  # Move a bit faster
-                    lifetime=particle.lifetime * 0.7,
-                    shrink=True,
-                    gravity=particle.gravity * 0.8,
-                )
-                self.add_particle(small_particle)
+        """Create smoke particles at the given position with optional color base"""
+        self.emit("smoke", x, y, count=count, color_base=color_base)
 
     def create_crash(self, x: float, y: float) -> None:
-        """Create an enhanced crash effect with multiple particle types but optimized for performance"""
-        # Create a burst of sparks with high intensity but fewer particles
-        self.create_spark(x, y, count=8, intensity=1.5)  # Reduced from 15 to 8
-
-        # Create smoke with different colors for a more dramatic effect but fewer particles
-        self.create_smoke(x, y, count=3)  # Reduced from 5 to 3
-        self.create_smoke(
-            x, y, count=5, color_base=(100, 100, 100)
-        )  # Reduced from 10 to 5
-        self.create_smoke(x, y, count=4, color_base=(50, 50, 50))  # Reduced from 8 to 4
-
-        # Add some fire/explosion particles - reduced count
-        for _ in range(10):  # Reduced from 20 to 10
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(80, 250) * scale_value(1.0)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-
-            # Fire colors
-            color_choice = random.choice(
-                [
-                    (255, 0, 0),  # Red
-                    (255, 69, 0),  # Red-Orange
-                    (255, 140, 0),  # Dark Orange
-                    (255, 165, 0),  # Orange
-                ]
-            )
-
-            # Create fire particle
-            fire_particle = Particle(
-                x=x + random.uniform(-10, 10) * scale_value(1.0),
-                y=y + random.uniform(-10, 10) * scale_value(1.0),
-                color=color_choice,
-                size=random.uniform(5, 15) * scale_value(1.0),
-                velocity=velocity,
-                lifetime=random.uniform(0.3, 0.8),
-                shrink=True,
-                gravity=random.uniform(-50, 50) * scale_value(1.0),
-            )
-            self.add_particle(fire_particle)
-
-            # Add glow effect to fewer fire particles
-            if random.random() < 0.3:  # Reduced from 0.5 to 0.3
-                glow = Particle(
-                    x=fire_particle.x,
-                    y=fire_particle.y,
-                    color=color_choice,
-                    size=fire_particle.size * 2,
-                    velocity=fire_particle.velocity,
-                    lifetime=fire_particle.lifetime * 0.7,
-                    alpha=100,
-                    shrink=True,
-                    gravity=fire_particle.gravity,
-                )
-                self.add_particle(glow)
-
-        # Create debris particles with enhanced physics - reduced count
-        for _ in range(12):  # Reduced from 25 to 12
-            # Random velocity in all directions, but stronger than sparks
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(100, 400) * scale_value(1.0)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
-
-            # Random colors for debris - add car color variations
-            color_choice = random.choice(
-                [
-                    (100, 100, 100),  # Gray
-                    (80, 80, 80),  # Dark Gray
-                    (50, 50, 50),  # Very Dark Gray
-                    (100, 0, 0),  # Dark Red (car parts)
-                ]
-            )
-
-            # Create the particle with gravity and rotation
-            particle = Particle(
-                x=x + random.uniform(-15, 15) * scale_value(1.0),
-                y=y + random.uniform(-15, 15) * scale_value(1.0),
-                color=color_choice,
-                size=random.uniform(3, 12) * scale_value(1.0),
-                velocity=velocity,
-                lifetime=random.uniform(0.5, 2.0),
-                shrink=True,  # Always shrink for consistency
-                gravity=random.uniform(150, 300) * scale_value(1.0),
-            )
-            self.add_particle(particle)
-
-        # Create a shockwave effect - reduced count
-        for i in range(5):  # Reduced from 10 to 5
-            size = (5 + i * 5) * scale_value(1.0)  # Increasing sizes
-            alpha = 200 - i * 20  # Decreasing alpha
-
-            shockwave = Particle(
-                x=x,
-                y=y,
-                color=(255, 255, 255),  # White shockwave
-                size=size,
-                velocity=(0, 0),  # Stationary
-                lifetime=0.1 + i * 0.05,  # Longer lifetime for larger rings
-                alpha=alpha,
-                shrink=False,
-                gravity=0,
-            )
-            self.add_particle(shockwave)
+        """Create a crash effect: sparks, smoke, fire, debris and a shockwave"""
+        self.emit("crash", x, y)
 
     def create_boost_trail(self, x: float, y: float) -> None:
-        """Create optimized boost trail particles behind a car"""
-        # Create fewer particles at slightly different positions
-        for _ in range(3):  # Reduced from 5 to 3 particles
-            # Random position variation
-            pos_x = x + random.uniform(-15, 15)
-            pos_y = y + random.uniform(-8, 8)
-
-            # Downward velocity (car is moving up the screen)
-            velocity = (random.uniform(-8, 8), random.uniform(15, 40))
-
-            # Random color from boost colors with fewer variations
-            color_choice = random.choice(
-                [
-                    BOOST_COLOR,
-                    (255, 140, 0),  # Dark Orange
-                    (255, 99, 71),  # Tomato
-                ]
-            )
-
-            # Create the main particle
-            particle = Particle(
-                x=pos_x,
-                y=pos_y,
-                color=color_choice,
-                size=random.uniform(6, 10),  # Slightly smaller size range
-                velocity=velocity,
-                lifetime=random.uniform(0.4, 0.8),  # Slightly shorter lifetime
-                shrink=True,
-                gravity=random.uniform(-5, 5),  # Some drift up, some down
-            )
-            self.add_particle(particle)
-
-            # Add a glow effect for fewer particles
-            if random.random() < 0.4:  # Reduced from 0.6 to 0.4
-                glow = Particle(
-                    x=pos_x,
-                    y=pos_y,
-                    color=color_choice,
-                    size=particle.size * 1.5,  # Smaller glow (reduced from 1.8)
-                    velocity=particle.velocity,
-                    lifetime=particle.lifetime * 0.7,
-                    alpha=100,  # Semi-transparent
-                    shrink=True,
-                    gravity=particle.gravity,
-                )
-                self.add_particle(glow)
-
-        # Add spark particles less frequently
-        if random.random() < 0.2:  # Reduced from 0.3 to 0.2
-            self.create_spark(x, y, count=2, intensity=0.7)  # Reduced from 3 to 2
+        """Create boost trail particles behind a car"""
+        self.emit("boost_trail", x, y)
 
     def create_tire_tracks(self, x: float, y: float, is_drifting: bool = False) -> None:
         """Create tire track marks on the road"""
-        # Determine intensity based on whether the car is drifting
-        count = 8 if is_drifting else 3
-        size_factor = 1.5 if is_drifting else 1.0
-
-        for _ in range(count):
-            # Position with slight variation
-            pos_x = x + random.uniform(-20, 20)
-            pos_y = y + random.uniform(-5, 5)
-
-            # Darker color for tire tracks
-            darkness = random.randint(20, 40)
-            color = (darkness, darkness, darkness)
-
-            # Create the tire mark particle
-            particle = Particle(
-                x=pos_x,
-                y=pos_y,
-                color=color,
-                size=random.uniform(2, 4) * size_factor,
-                velocity=(0, 0),  # Stationary
-                lifetime=random.uniform(1.0, 3.0),  # Longer lifetime
-                shrink=False,
-                gravity=0,
-            )
-            self.add_particle(particle)
+        if self.decals is None:
+            self.emit("tire_drift" if is_drifting else "tire_tracks", x, y)
+            return
 
-        # Add some smoke if drifting
+        # Marks are painted into the scrolling road layer once and cost no
+        # particle budget; only the drift smoke stays a particle effect
+        preset = EMITTER_PRESETS["tire_tracks"]
         if is_drifting:
+            self.decals.stamp_marks(preset, x, y, count=8, size_factor=1.5)
             self.create_smoke(x, y, count=5, color_base=(50, 50, 50))
+        else:
+            self.decals.stamp_marks(preset, x, y)
 
     def create_water_splash(self, x: float, y: float) -> None:
         """Create water splash effect"""
-        # Create water droplets
-        for _ in range(30):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 200)
-            velocity = (math.cos(angle) * speed, math.sin(angle) * speed)
+        self.emit("water_splash", x, y)
 
-            # Blue/white colors for water
-            color_choice = random.choice(
-                [
-                    (0, 191, 255),  # Deep Sky Blue
-                    (135, 206, 250),  # Light Sky Blue
-                    (173, 216, 230),  # Light Blue
-                    (240, 248, 255),  # Alice Blue
-                    (240, 255, 255),  # Azure
-                ]
-            )
 
-            # Create water particle
-            particle = Particle(
-                x=x + random.uniform(-10, 10),
-                y=y + random.uniform(-10, 10),
-                color=color_choice,
-                size=random.uniform(2, 6),
-                velocity=velocity,
-                lifetime=random.uniform(0.5, 1.2),
-                shrink=True,
-                gravity=random.uniform(100, 300),  # Water falls down
-            )
-            self.add_particle(particle)
+def pulse_phase(spawn_ticks, speed):
+    """Animation phase in radians for something spawned at spawn_ticks that
+    pulses at speed radians per second; nothing is stored between frames"""
+    return (pygame.time.get_ticks() - spawn_ticks) * 0.001 * speed
 
 
 class PowerUp:
+    __slots__ = ("lane", "x", "y", "type", "color", "symbol", "collected", "spawn_ticks")
+
+    width = POWERUP_WIDTH
+    height = POWERUP_HEIGHT
+    PULSE_SPEED = 6.0  # Radians per second
+    # Color and symbol for each type
+    STYLES = {
+        "boost": (BOOST_COLOR, "⚡"),
+        "shield": (SHIELD_COLOR, "🛡️"),
+        "magnet": (MAGNET_COLOR, "🧲"),
+        "coin": (COIN_COLOR, "💰"),
+        "slow_mo": (SLOW_MO_COLOR, "⏱️"),
+    }
+
     def __init__(self, lane, powerup_type):
         self.lane = lane
         self.x = LANE_POSITIONS[lane]
-        self.y = -POWERUP_HEIGHT // 2 # type: ignore
-        self.width = POWERUP_WIDTH # type: ignore
-        self.height = POWERUP_HEIGHT # type: ignore
+        self.y = -POWERUP_HEIGHT // 2
         self.type = powerup_type  # 'boost', 'shield', 'magnet', 'coin', 'slow_mo'
-
-        # Set color based on type
-        if self.type == "boost":
-            self.color = BOOST_COLOR
-            self.symbol = "⚡"
-        elif self.type == "shield":
-            self.color = SHIELD_COLOR
-            self.symbol = "🛡️"
-        elif self.type == "magnet":
-            self.color = MAGNET_COLOR
-            self.symbol = "🧲"
-        elif self.type == "coin":
-            self.color = COIN_COLOR
-            self.symbol = "💰"
-        elif self.type == "slow_mo":
-            self.color = SLOW_MO_COLOR
-            self.symbol = "⏱️"
-
-        self.pulse_effect = 0
+        self.color, self.symbol = self.STYLES[powerup_type]
         self.collected = False
+        self.spawn_ticks = pygame.time.get_ticks()
 
     def draw(self, screen):
         """Draw the power-up with enhanced animations"""
@@ -1255,8 +2489,7 @@ class PowerUp:
             return
 
         # Pulsating effect
-        self.pulse_effect = (self.pulse_effect + 0.1) % (2 * math.pi)
-        pulse_size = math.sin(self.pulse_effect) * 5
+        pulse_size = math.sin(pulse_phase(self.spawn_ticks, self.PULSE_SPEED)) * 5
 
         # Rotation effect
         rotation_angle = (pygame.time.get_ticks() * 0.05) % 360
@@ -1266,7 +2499,7 @@ class PowerUp:
         draw_y = self.y + float_offset
 
         # Draw power-up with glow effect
-        for offset in range(3, 0, -1):
+        for offset in glow_layers(3):
             glow_color = (*self.color, 100 - offset * 30)
             glow_surface = pygame.Surface(
                 (
@@ -1380,15 +2613,25 @@ class PowerUp:
 
 
 class Magnet:
+    __slots__ = ("lane", "x", "y", "collected", "spawn_ticks", "handle", "prev_x", "prev_y")
+
+    width = MAGNET_WIDTH
+    height = MAGNET_HEIGHT
+    color = MAGNET_COLOR
+    PULSE_SPEED = 6.0  # Radians per second
+
     def __init__(self, lane):
+        self.reset(lane)
+
+    def reset(self, lane):
         self.lane = lane
         self.x = LANE_POSITIONS[lane]
         self.y = -MAGNET_HEIGHT // 2
-        self.width = MAGNET_WIDTH
-        self.height = MAGNET_HEIGHT
-        self.color = MAGNET_COLOR
         self.collected = False
-        self.pulse_effect = 0
+        self.spawn_ticks = pygame.time.get_ticks()
+        self.prev_x = self.x
+        self.prev_y = self.y
+        return self
 
     def draw(self, screen):
         """Draw the magnet with animations"""
@@ -1396,15 +2639,14 @@ class Magnet:
             return
 
         # Pulsating effect
-        self.pulse_effect = (self.pulse_effect + 0.1) % (2 * math.pi)
-        pulse_size = math.sin(self.pulse_effect) * 5
+        pulse_size = math.sin(pulse_phase(self.spawn_ticks, self.PULSE_SPEED)) * 5
 
         # Floating animation
         float_offset = math.sin(pygame.time.get_ticks() * 0.003) * 3
         draw_y = self.y + float_offset
 
         # Draw glow effect
-        for offset in range(3, 0, -1):
+        for offset in glow_layers(3):
             glow_color = (*self.color, 100 - offset * 30)
             glow_surface = pygame.Surface(
                 (self.width + offset * 4 + pulse_size, self.height + offset * 4 + pulse_size),
@@ -1462,15 +2704,25 @@ class Magnet:
 
 
 class Boost:
+    __slots__ = ("lane", "x", "y", "collected", "spawn_ticks", "handle", "prev_x", "prev_y")
+
+    width = BOOST_WIDTH
+    height = BOOST_HEIGHT
+    color = BOOST_COLOR
+    PULSE_SPEED = 9.0  # Radians per second
+
     def __init__(self, lane):
+        self.reset(lane)
+
+    def reset(self, lane):
         self.lane = lane
         self.x = LANE_POSITIONS[lane]
         self.y = -BOOST_HEIGHT // 2
-        self.width = BOOST_WIDTH
-        self.height = BOOST_HEIGHT
-        self.color = BOOST_COLOR
         self.collected = False
-        self.pulse_effect = 0
+        self.spawn_ticks = pygame.time.get_ticks()
+        self.prev_x = self.x
+        self.prev_y = self.y
+        return self
 
     def draw(self, screen):
         """Draw the boost with animations"""
@@ -1478,15 +2730,14 @@ class Boost:
             return
 
         # Pulsating effect
-        self.pulse_effect = (self.pulse_effect + 0.15) % (2 * math.pi)
-        pulse_size = math.sin(self.pulse_effect) * 6
+        pulse_size = math.sin(pulse_phase(self.spawn_ticks, self.PULSE_SPEED)) * 6
 
         # Floating animation
         float_offset = math.sin(pygame.time.get_ticks() * 0.004) * 4
         draw_y = self.y + float_offset
 
         # Draw glow effect
-        for offset in range(4, 0, -1):
+        for offset in glow_layers(4):
             glow_color = (*self.color, 120 - offset * 25)
             glow_surface = pygame.Surface(
                 (self.width + offset * 5 + pulse_size, self.height + offset * 5 + pulse_size),
@@ -1544,15 +2795,25 @@ class Boost:
 
 
 class SlowMo:
+    __slots__ = ("lane", "x", "y", "collected", "spawn_ticks", "handle", "prev_x", "prev_y")
+
+    width = SLOWMO_WIDTH
+    height = SLOWMO_HEIGHT
+    color = SLOWMO_COLOR
+    PULSE_SPEED = 4.8  # Radians per second
+
     def __init__(self, lane):
+        self.reset(lane)
+
+    def reset(self, lane):
         self.lane = lane
         self.x = LANE_POSITIONS[lane]
         self.y = -SLOWMO_HEIGHT // 2
-        self.width = SLOWMO_WIDTH
-        self.height = SLOWMO_HEIGHT
-        self.color = SLOWMO_COLOR
         self.collected = False
-        self.pulse_effect = 0
+        self.spawn_ticks = pygame.time.get_ticks()
+        self.prev_x = self.x
+        self.prev_y = self.y
+        return self
 
     def draw(self, screen):
         """Draw the slow-mo with animations"""
@@ -1560,15 +2821,14 @@ class SlowMo:
             return
 
         # Slow pulsating effect
-        self.pulse_effect = (self.pulse_effect + 0.08) % (2 * math.pi)
-        pulse_size = math.sin(self.pulse_effect) * 4
+        pulse_size = math.sin(pulse_phase(self.spawn_ticks, self.PULSE_SPEED)) * 4
 
         # Slow floating animation
         float_offset = math.sin(pygame.time.get_ticks() * 0.002) * 2
         draw_y = self.y + float_offset
 
         # Draw glow effect
-        for offset in range(5, 0, -1):
+        for offset in glow_layers(5):
             glow_color = (*self.color, 80 - offset * 15)
             glow_surface = pygame.Surface(
                 (self.width + offset * 6 + pulse_size, self.height + offset * 6 + pulse_size),
@@ -1626,15 +2886,25 @@ class SlowMo:
 
 
 class Shield:
+    __slots__ = ("lane", "x", "y", "collected", "spawn_ticks", "handle", "prev_x", "prev_y")
+
+    width = SHIELD_WIDTH
+    height = SHIELD_HEIGHT
+    color = SHIELD_COLOR
+    PULSE_SPEED = 7.2  # Radians per second
+
     def __init__(self, lane):
+        self.reset(lane)
+
+    def reset(self, lane):
         self.lane = lane
         self.x = LANE_POSITIONS[lane]
         self.y = -SHIELD_HEIGHT // 2
-        self.width = SHIELD_WIDTH
-        self.height = SHIELD_HEIGHT
-        self.color = SHIELD_COLOR
         self.collected = False
-        self.pulse_effect = 0
+        self.spawn_ticks = pygame.time.get_ticks()
+        self.prev_x = self.x
+        self.prev_y = self.y
+        return self
 
     def draw(self, screen):
         """Draw the shield with animations"""
@@ -1642,15 +2912,14 @@ class Shield:
             return
 
         # Steady pulsating effect
-        self.pulse_effect = (self.pulse_effect + 0.12) % (2 * math.pi)
-        pulse_size = math.sin(self.pulse_effect) * 3
+        pulse_size = math.sin(pulse_phase(self.spawn_ticks, self.PULSE_SPEED)) * 3
 
         # Gentle floating animation
         float_offset = math.sin(pygame.time.get_ticks() * 0.0025) * 2
         draw_y = self.y + float_offset
 
         # Draw glow effect
-        for offset in range(4, 0, -1):
+        for offset in glow_layers(4):
             glow_color = (*self.color, 100 - offset * 20)
             glow_surface = pygame.Surface(
                 (self.width + offset * 4 + pulse_size, self.height + offset * 4 + pulse_size),
@@ -1708,14 +2977,25 @@ class Shield:
 
 
 class Coin:
+    __slots__ = ("x", "y", "collected", "spawn_ticks", "handle", "prev_x", "prev_y")
+
+    width = 20
+    height = 20
+    color = COIN_COLOR
+    PULSE_SPEED = 6.0  # Radians per second
+
     def __init__(self, x, y):
+        self.reset(x, y)
+
+    def reset(self, x, y):
         self.x = x
         self.y = y
-        self.width = 20
-        self.height = 20
-        self.color = COIN_COLOR
         self.collected = False
-        self.pulse_effect = random.random() * 2 * math.pi
+        # Coins spawned at different times pulse out of step with each other
+        self.spawn_ticks = pygame.time.get_ticks()
+        self.prev_x = self.x
+        self.prev_y = self.y
+        return self
 
     def draw(self, screen):
         """Draw the coin with enhanced animations"""
@@ -1723,8 +3003,7 @@ class Coin:
             return
 
         # Pulsating effect
-        self.pulse_effect = (self.pulse_effect + 0.1) % (2 * math.pi)
-        pulse_size = math.sin(self.pulse_effect) * 2
+        pulse_size = math.sin(pulse_phase(self.spawn_ticks, self.PULSE_SPEED)) * 2
 
         # Spinning animation
         spin_angle = (pygame.time.get_ticks() * 0.1) % 360
@@ -1734,7 +3013,7 @@ class Coin:
 
         # Draw coin with glow and 3D effect
         # Outer glow
-        for offset in range(3, 0, -1):
+        for offset in glow_layers(3):
             glow_radius = (self.width // 2 + pulse_size + offset * 2) * spin_scale
             glow_alpha = 100 - offset * 30
             glow_surface = pygame.Surface(
@@ -1785,6 +3064,16 @@ class Coin:
 
 
 class Car:
+    __slots__ = (
+        "x", "y", "width", "height", "color", "lane",
+        "has_shield", "shield_timer", "has_boost", "boost_timer",
+        "has_magnet", "magnet_timer", "has_slow_mo", "slow_mo_timer",
+        "deactivation_notifications", "boost_energy", "max_boost_energy",
+        "current_boost_factor", "target_boost_factor", "boost_acceleration_rate",
+        "swerve_offset", "swerve_direction", "is_boosting", "boost_particles",
+        "tire_smoke_cooldown", "prev_speed", "prev_x", "prev_y", "game_instance",
+    )
+
     def __init__(self, x, y, width, height, color):
         self.x = x
         self.y = y
@@ -1968,7 +3257,7 @@ class Car:
         glow_intensity = (
             math.sin(pygame.time.get_ticks() * 0.005) + 1
         ) * 0.5 + 0.5  # 0.5 to 1.5
-        for offset in range(3, 0, -1):
+        for offset in range(current_quality["headlight_layers"], 0, -1):
             glow_color = (255, 255, 100, int((100 - offset * 30) * glow_intensity))
             glow_surface = pygame.Surface(
                 (headlight_width + offset * 4, headlight_height + offset * 4),
@@ -2004,7 +3293,7 @@ class Car:
         )
 
         # Right headlight glow
-        for offset in range(3, 0, -1):
+        for offset in range(current_quality["headlight_layers"], 0, -1):
             glow_color = (255, 255, 100, int((100 - offset * 30) * glow_intensity))
             glow_surface = pygame.Surface(
                 (headlight_width + offset * 4, headlight_height + offset * 4),
@@ -2258,13 +3547,13 @@ class Car:
             self.tire_smoke_cooldown = 0.2  # Will create smoke for 0.2 seconds
 
     def update(self, dt):
-        # Cap dt to prevent huge jumps that could cause issues
-        dt = min(dt, 1.0 / 30.0)  # Cap at ~33ms for stability
-        
+        # dt is always one fixed simulation step, so timers run at sim speed
+        # whatever rate the simulation ticks at
+
         # Update power-up timers
         if self.has_shield:
-            # Ensure minimum delta time to prevent timer from getting stuck
-            effective_dt = max(dt, 1.0/60.0)  # Minimum 60 FPS equivalent
+            # Timers tick by the fixed simulation step
+            effective_dt = dt
             self.shield_timer -= effective_dt
             if self.shield_timer <= 0:
                 self.has_shield = False
@@ -2273,8 +3562,8 @@ class Car:
                 self.add_deactivation_notification("SHIELD DEACTIVATED", (100, 200, 255))
 
         if self.has_boost:
-            # Ensure minimum delta time to prevent timer from getting stuck
-            effective_dt = max(dt, 1.0/60.0)  # Minimum 60 FPS equivalent
+            # Timers tick by the fixed simulation step
+            effective_dt = dt
             self.boost_timer -= effective_dt
             if self.boost_timer <= 0:
                 self.has_boost = False
@@ -2285,8 +3574,8 @@ class Car:
                 self.add_deactivation_notification("BOOST DEACTIVATED", (255, 140, 0))
 
         if self.has_magnet:
-            # Ensure minimum delta time to prevent timer from getting stuck
-            effective_dt = max(dt, 1.0/60.0)  # Minimum 60 FPS equivalent
+            # Timers tick by the fixed simulation step
+            effective_dt = dt
             self.magnet_timer -= effective_dt
             if self.magnet_timer <= 0:
                 self.has_magnet = False
@@ -2295,8 +3584,8 @@ class Car:
                 self.add_deactivation_notification("MAGNET DEACTIVATED", (255, 215, 0))
 
         if self.has_slow_mo:
-            # Ensure minimum delta time to prevent timer from getting stuck
-            effective_dt = max(dt, 1.0/60.0)  # Minimum 60 FPS equivalent
+            # Timers tick by the fixed simulation step
+            effective_dt = dt
             self.slow_mo_timer -= effective_dt
             if self.slow_mo_timer <= 0:
                 self.has_slow_mo = False
@@ -2455,19 +3744,28 @@ class Car:
 
 
 class Obstacle:
+    __slots__ = ("lane", "x", "y", "type", "handle", "prev_x", "prev_y")
+
+    width = OBSTACLE_WIDTH
+    height = OBSTACLE_HEIGHT
+    color = BRIGHT_RED
+
     def __init__(self, lane):
+        self.reset(lane)
+
+    def reset(self, lane):
         self.lane = lane
         self.x = LANE_POSITIONS[lane]
         self.y = -OBSTACLE_HEIGHT // 2
-        self.width = OBSTACLE_WIDTH
-        self.height = OBSTACLE_HEIGHT
-        self.color = BRIGHT_RED
-        self.type = random.choice(["cone", "barrier", "pothole"])
+        self.type = rng.spawn.choice(["cone", "barrier", "pothole"])
+        self.prev_x = self.x
+        self.prev_y = self.y
+        return self
 
     def draw(self, screen):
         if self.type == "cone":
             # Traffic cone with glow effect
-            for offset in range(3, 0, -1):
+            for offset in glow_layers(3):
                 glow_color = (255, 100, 0, 100 - offset * 30)
                 glow_surface = pygame.Surface(
                     (self.width + offset * 4, self.height + offset * 4), pygame.SRCALPHA
@@ -2511,7 +3809,7 @@ class Obstacle:
             )
         elif self.type == "barrier":
             # Road barrier with glow effect
-            for offset in range(3, 0, -1):
+            for offset in glow_layers(3):
                 glow_color = (255, 50, 50, 100 - offset * 30)
                 glow_surface = pygame.Surface(
                     (self.width + offset * 4, self.height + offset * 4), pygame.SRCALPHA
@@ -2553,7 +3851,7 @@ class Obstacle:
                 )
         else:  # pothole
             # Pothole with glow effect
-            for offset in range(3, 0, -1):
+            for offset in glow_layers(3):
                 glow_color = (0, 0, 50, 100 - offset * 30)
                 glow_surface = pygame.Surface(
                     (self.width + offset * 4, self.height + offset * 4), pygame.SRCALPHA
@@ -2609,13 +3907,16 @@ class Obstacle:
 
 
 class MovingObstacle(Obstacle):
-    def __init__(self, lane):
-        super().__init__(lane)
-        self.move_direction = random.choice([-1, 1])
-        self.move_speed = random.uniform(0.5, 2.0)
+    __slots__ = ("move_direction", "move_speed", "original_x", "move_range", "move_progress")
+
+    def reset(self, lane):
+        super().reset(lane)
+        self.move_direction = rng.spawn.choice([-1, 1])
+        self.move_speed = rng.spawn.uniform(0.5, 2.0)
         self.original_x = self.x
         self.move_range = LANE_WIDTH * 0.4
         self.move_progress = 0
+        return self
 
     def update(self, dt):
         # Move side to side
@@ -2625,21 +3926,31 @@ class MovingObstacle(Obstacle):
 
 
 class OtherCar:
+    # Height and color vary with the car type, so only the width is shared
+    __slots__ = ("lane", "x", "y", "height", "color", "car_type", "handle", "prev_x", "prev_y")
+
+    width = CAR_WIDTH
+    is_car = True  # Flag to identify as a car for AI detection
+
     def __init__(self, lane):
+        self.reset(lane)
+
+    def reset(self, lane):
         self.lane = lane
         self.x = LANE_POSITIONS[lane]
         self.y = -CAR_HEIGHT // 2
-        self.width = CAR_WIDTH
         self.height = CAR_HEIGHT
-        self.color = random.choice(
+        self.color = rng.spawn.choice(
             [NEON_GREEN, ELECTRIC_PURPLE, (255, 165, 0), (128, 0, 128), METALLIC_SILVER]
         )
-        self.car_type = random.choice(["sedan", "suv", "truck"])
+        self.car_type = rng.spawn.choice(["sedan", "suv", "truck"])
         if self.car_type == "truck":
             self.height = int(CAR_HEIGHT * 1.3)
         elif self.car_type == "suv":
             self.height = int(CAR_HEIGHT * 1.1)
-        self.is_car = True  # Flag to identify as a car for AI detection
+        self.prev_x = self.x
+        self.prev_y = self.y
+        return self
 
     def draw(self, screen):
         # Car body
@@ -2950,16 +4261,29 @@ class OtherCar:
         )
 
 
+# AI car settings
+AI_LANE_CHANGE_SPEED = 60.0  # Lanes per second; one lane per frame at REFERENCE_FPS
+
+
 class AIControlledCar(OtherCar):
-    def __init__(self, lane):
-        super().__init__(lane)
-        self.ai_type = random.choice(["normal", "aggressive", "cautious"])
+    __slots__ = (
+        "ai_type", "lane_change_cooldown", "brake_cooldown", "is_braking", "target_lane",
+        "lane_progress",
+    )
+
+    def reset(self, lane):
+        super().reset(lane)
+        self.ai_type = rng.ai.choice(["normal", "aggressive", "cautious"])
         self.lane_change_cooldown = 0
         self.brake_cooldown = 0
         self.is_braking = False
         self.target_lane = lane
+        # Fraction of a lane travelled towards target_lane
+        self.lane_progress = 0.0
+        return self
 
-    def update(self, dt, player_lane, obstacles):
+    def update(self, dt, player_lane, occupancy):
+        """Pick lanes from the shared per-frame OccupancyGrid"""
         # Update lane change cooldown
         if self.lane_change_cooldown > 0:
             self.lane_change_cooldown -= dt
@@ -2972,95 +4296,56 @@ class AIControlledCar(OtherCar):
 
         # AI decision making
         if self.lane_change_cooldown <= 0:
-            # Check for obstacles in current lane
-            obstacle_ahead = False
-
-            # First check for static obstacles
-            for obstacle in obstacles:
-                if (
-                    not hasattr(obstacle, "is_car")
-                    and obstacle.lane == self.lane
-                    and obstacle.y > self.y
-                    and obstacle.y - self.y < 300
-                ):
-                    obstacle_ahead = True
-                    break
+            # Check for static obstacles in current lane
+            obstacle_ahead = occupancy.count("static", self.lane, self.y, self.y + 300) > 0
 
-            # Then check for other cars
-            car_ahead = False
-            for other in obstacles:
-                if (
-                    hasattr(other, "is_car")
-                    and other != self  # Don't detect self
-                    and other.lane == self.lane
-                    and other.y > self.y
-                    and other.y - self.y < 250
-                ):
-                    car_ahead = True
-                    break
+            # Then check for other cars (the grid counts this car too)
+            car_ahead = occupancy.count("cars", self.lane, self.y, self.y + 250) > 1
 
             # Decide whether to change lanes
             if obstacle_ahead or car_ahead:
-                # Find a safe lane to move to
-                safe_lanes = []
-                for l in range(8):  # Changed from 6 to 8 lanes
-                    if l != self.lane:
-                        lane_safe = True
-
-                        # Check for obstacles in the potential lane
-                        for obstacle in obstacles:
-                            if (
-                                not hasattr(obstacle, "is_car")
-                                and obstacle.lane == l
-                                and abs(obstacle.y - self.y) < 200
-                            ):
-                                lane_safe = False
-                                break
-
-                        # Check for other cars in the potential lane
-                        for other in obstacles:
-                            if (
-                                hasattr(other, "is_car")
-                                and other != self  # Don't detect self
-                                and other.lane == l
-                                and abs(other.y - self.y) < 200
-                            ):
-                                lane_safe = False
-                                break
-
-                        if lane_safe:
-                            safe_lanes.append(l)
+                # Find a safe lane to move to: no obstacles or other cars nearby
+                safe_lanes = [
+                    l
+                    for l in occupancy.clear_lanes(self.y - 200, self.y + 200)
+                    if l != self.lane
+                ]
 
                 if safe_lanes:
-                    self.target_lane = random.choice(safe_lanes)
-                    self.lane_change_cooldown = random.uniform(2.0, 4.0)
+                    self.target_lane = rng.ai.choice(safe_lanes)
+                    self.lane_change_cooldown = rng.ai.uniform(2.0, 4.0)
                 elif self.ai_type == "aggressive":
                     # Aggressive cars might brake suddenly
-                    if random.random() < 0.3 and self.brake_cooldown <= 0:
+                    if (
+                        rng.ai.random() < 0.3 * dt * REFERENCE_FPS
+                        and self.brake_cooldown <= 0
+                    ):
                         self.is_braking = True
-                        self.brake_cooldown = random.uniform(0.5, 1.5)
+                        self.brake_cooldown = rng.ai.uniform(0.5, 1.5)
             elif (
                 self.ai_type == "aggressive"
-                and random.random() < 0.05
+                and rng.ai.random() < 0.05 * dt * REFERENCE_FPS
                 and self.lane != player_lane
             ):
                 # Aggressive cars might randomly change lanes to block player
                 self.target_lane = player_lane
-                self.lane_change_cooldown = random.uniform(2.0, 4.0)
-            elif self.ai_type == "normal" and random.random() < 0.02:
+                self.lane_change_cooldown = rng.ai.uniform(2.0, 4.0)
+            elif self.ai_type == "normal" and rng.ai.random() < 0.02 * dt * REFERENCE_FPS:
                 # Normal cars occasionally change lanes randomly
-                new_lane = random.randint(0, 7)  # Changed from 0-5 to 0-7 for 8 lanes
+                new_lane = rng.ai.randint(0, 7)  # Changed from 0-5 to 0-7 for 8 lanes
                 if new_lane != self.lane:
                     self.target_lane = new_lane
-                    self.lane_change_cooldown = random.uniform(2.0, 5.0)
+                    self.lane_change_cooldown = rng.ai.uniform(2.0, 5.0)
 
-        # Move towards target lane
+        # Move towards target lane at a fixed speed whatever the tick rate
         if self.lane != self.target_lane:
-            if self.target_lane > self.lane:
-                self.lane += 1
-            else:
-                self.lane -= 1
+            self.lane_progress += dt * AI_LANE_CHANGE_SPEED
+            while self.lane != self.target_lane and self.lane_progress >= 1.0:
+                self.lane_progress -= 1.0
+                self.lane += 1 if self.target_lane > self.lane else -1
             self.x = LANE_POSITIONS[self.lane]
+        else:
+            self.lane_progress = 0.0
 
 
 class SettingsMenu:
@@ -3078,6 +4363,7 @@ class SettingsMenu:
             "SOUND": ["OFF", "ON"],
             "MUSIC": ["OFF", "ON"],
             "DIFFICULTY": ["EASY", "NORMAL", "HARD"],
+            "QUALITY": QualityGovernor.MODES,
         }
 
         # Current values (indexes into the settings arrays)
@@ -3088,6 +4374,7 @@ class SettingsMenu:
             "SOUND": 1,  # Default to ON
             "MUSIC": 1,  # Default to ON
             "DIFFICULTY": 1,  # NORMAL by default
+            "QUALITY": QualityGovernor.MODES.index(quality_governor.mode),
         }
 
         # Apply default settings immediately
@@ -3134,13 +4421,13 @@ class SettingsMenu:
     def resize(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.font_large = pygame.font.SysFont(
+        self.font_large = assets.get_sys_font(
             "arial", int(screen_height * 0.06), bold=True
         )
-        self.font_medium = pygame.font.SysFont(
+        self.font_medium = assets.get_sys_font(
             "arial", int(screen_height * 0.04), bold=True
         )
-        self.font_small = pygame.font.SysFont("arial", int(screen_height * 0.03))
+        self.font_small = assets.get_sys_font("arial", int(screen_height * 0.03))
         self.create_background()
 
     def draw(self):
@@ -3402,7 +4689,6 @@ class SettingsMenu:
         original_bg = self.screen.copy()
 
         # Animation loop
-        clock = pygame.time.Clock()
         while True:
             current_time = time.time()
             progress = min(1.0, (current_time - start_time) / duration)
@@ -3493,7 +4779,7 @@ class SettingsMenu:
                     sys.exit()
 
             # Cap the frame rate
-            clock.tick(60)
+            frame_scheduler.tick(60)
 
     def handle_input(self):
         for event in pygame.event.get():
@@ -3773,6 +5059,11 @@ class SettingsMenu:
                 start_menu_music()
             print(f"Music {'enabled' if music_enabled else 'disabled'}")
             return None
+        elif option == "QUALITY":
+            # AUTO lets the governor pick a tier, anything else pins it
+            quality_governor.set_mode(self.settings[option][self.current_values[option]])
+            print(f"Quality mode set to {quality_governor.mode}")
+            return None
 
         # Other settings would be applied here
         print(
@@ -3820,13 +5111,13 @@ class PauseMenu:
     def resize(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.font_large = pygame.font.SysFont(
+        self.font_large = assets.get_sys_font(
             "arial", int(screen_height * 0.06), bold=True
         )
-        self.font_medium = pygame.font.SysFont(
+        self.font_medium = assets.get_sys_font(
             "arial", int(screen_height * 0.04), bold=True
         )
-        self.font_small = pygame.font.SysFont("arial", int(screen_height * 0.03))
+        self.font_small = assets.get_sys_font("arial", int(screen_height * 0.03))
         self.create_background()
 
     def draw(self):
@@ -4105,13 +5396,13 @@ class PauseMenu:
                 LANE_POSITIONS = [LANE_WIDTH * i + LANE_WIDTH // 2 for i in range(6)]
 
                 # Update fonts for new screen size
-                self.font_large = pygame.font.SysFont(
+                self.font_large = assets.get_sys_font(
                     "arial", int(self.screen_height * 0.06), bold=True
                 )
-                self.font_medium = pygame.font.SysFont(
+                self.font_medium = assets.get_sys_font(
                     "arial", int(self.screen_height * 0.04), bold=True
                 )
-                self.font_small = pygame.font.SysFont(
+                self.font_small = assets.get_sys_font(
                     "arial", int(self.screen_height * 0.03)
                 )
 
@@ -4147,13 +5438,13 @@ class PauseMenu:
                 LANE_POSITIONS = [LANE_WIDTH * i + LANE_WIDTH // 2 for i in range(6)]
 
                 # Update fonts for new screen size
-                self.font_large = pygame.font.SysFont(
+                self.font_large = assets.get_sys_font(
                     "arial", int(self.screen_height * 0.06), bold=True
                 )
-                self.font_medium = pygame.font.SysFont(
+                self.font_medium = assets.get_sys_font(
                     "arial", int(self.screen_height * 0.04), bold=True
                 )
-                self.font_small = pygame.font.SysFont(
+                self.font_small = assets.get_sys_font(
                     "arial", int(self.screen_height * 0.03)
                 )
 
@@ -4912,50 +6203,1083 @@ class PromptSystem:
             # Increment y_offset for next prompt
             y_offset += bg_rect.height + scale_value(10)
 
-    def handle_input(self, event):
-        """Handle input for dismissing prompts"""
-        # Don't consume scroll events
-        if event.type == pygame.MOUSEBUTTONDOWN and (
-            event.button == 4 or event.button == 5
-        ):
-            return False
+    def handle_input(self, event):
+        """Handle input for dismissing prompts"""
+        # Don't consume scroll events
+        if event.type == pygame.MOUSEBUTTONDOWN and (
+            event.button == 4 or event.button == 5
+        ):
+            return False
+
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_x:
+            if self.active_prompts:
+                # Start fade out for all prompts
+                for prompt in self.active_prompts:
+                    prompt["fade_out"] = True
+                    # Make fade out faster
+                    remaining_time = 0.5
+                    prompt["duration"] = (
+                        time.time() - prompt["start_time"] + remaining_time
+                    )
+                return True
+        return False
+
+    def reset(self):
+        """Reset all prompts to be shown again"""
+        for prompt_id in self.prompts:
+            self.prompts[prompt_id]["shown"] = False
+        self.active_prompts = []
+    
+    def show_custom_prompt(self, text, duration=3.0, fade_out=True):
+        """Show a custom prompt with specified text and duration"""
+        prompt = {
+            "text": text,
+            "start_time": time.time(),
+            "duration": duration,
+            "alpha": 255,
+            "fade_out": fade_out,
+            "fade_in": True,  # Add missing fade_in attribute
+            "y_offset": 0
+        }
+        self.active_prompts.append(prompt)
+
+    def resize(self):
+        """Update font sizes after window resize"""
+        self.font = get_font(scale_value(24), bold=True)
+        self.small_font = get_font(scale_value(18))
+
+
+# Garage cars - same car design, different colors
+GARAGE_CARS = [
+    {
+        "name": "RED RACER",
+        "speed": 8,
+        "acceleration": 9,
+        "handling": 7,
+        "color": (255, 0, 0),  # Red
+        "description": "Fast and agile sports car with excellent acceleration.",
+    },
+    {
+        "name": "BLUE BOLT",
+        "speed": 9,
+        "acceleration": 7,
+        "handling": 6,
+        "color": (0, 0, 255),  # Blue
+        "description": "Powerful sports car with high top speed.",
+    },
+    {
+        "name": "GREEN MACHINE",
+        "speed": 6,
+        "acceleration": 6,
+        "handling": 9,
+        "color": (0, 255, 0),  # Green
+        "description": "Nimble sports car with excellent handling.",
+    },
+    {
+        "name": "YELLOW FLASH",
+        "speed": 7,
+        "acceleration": 8,
+        "handling": 7,
+        "color": (255, 255, 0),  # Yellow
+        "description": "Well-balanced sports car with good all-around stats.",
+    },
+    {
+        "name": "PURPLE PHANTOM",
+        "speed": 8,
+        "acceleration": 8,
+        "handling": 8,
+        "color": (128, 0, 128),  # Purple
+        "description": "Premium sports car with balanced performance.",
+    },
+]
+
+# Power-ups and collectibles shown in the items menu
+MENU_ITEMS = [
+    {
+        "name": "BOOST",
+        "color": BOOST_COLOR,
+        "symbol": "⚡",
+        "description": "Increases your speed for a short time.",
+        "effect": "Speed x1.5 for 5 seconds",
+    },
+    {
+        "name": "SHIELD",
+        "color": SHIELD_COLOR,
+        "symbol": "🛡️",
+        "description": "Protects your car from crashes.",
+        "effect": "Immunity for 7 seconds",
+    },
+    {
+        "name": "MAGNET",
+        "color": MAGNET_COLOR,
+        "symbol": "🧲",
+        "description": "Attracts coins to your car.",
+        "effect": "150px attraction radius for 5 seconds",
+    },
+    {
+        "name": "SLOW-MO",
+        "color": SLOW_MO_COLOR,
+        "symbol": "⏱️",
+        "description": "Slows down time for better control.",
+        "effect": "50% slower gameplay for 5 seconds",
+    },
+    {
+        "name": "COIN",
+        "color": COIN_COLOR,
+        "symbol": "💰",
+        "description": "Collect to increase your score.",
+        "effect": "+10 points per coin",
+    },
+]
+
+ITEM_ICON_SIZE = 80
+
+# Preview cache shared by the garage and items menus.
+# Keys include the resolution so previews survive across menu visits.
+_preview_cache = {}
+_preview_cache_lock = threading.Lock()
+_preview_warmup_thread = None
+
+
+def _render_car_preview(car, screen_width):
+    """Draw the large garage preview image for a car"""
+    # Create a larger surface for the car
+    car_width = int(screen_width * 0.4)  # 40% of screen width
+    car_height = int(car_width * 0.5)  # Maintain aspect ratio
+    img = pygame.Surface((car_width, car_height), pygame.SRCALPHA)
+
+    # Draw the car body
+    car_body_width = car_width * 0.8
+    car_body_height = car_height * 0.5
+    car_body_x = (car_width - car_body_width) / 2
+    car_body_y = car_height * 0.3
+
+    # Car shadow (for depth)
+    shadow_offset = car_height * 0.05
+    shadow_surface = pygame.Surface(
+        (car_body_width, car_body_height), pygame.SRCALPHA
+    )
+    shadow_surface.fill((0, 0, 0, 100))
+    img.blit(
+        shadow_surface, (car_body_x + shadow_offset, car_body_y + shadow_offset)
+    )
+
+    # Main car body (bottom part)
+    pygame.draw.rect(
+        img,
+        car["color"],
+        [car_body_x, car_body_y, car_body_width, car_body_height],
+        0,
+        int(car_width * 0.05),  # Rounded corners
+    )
+
+    # Add metallic effect with gradient
+    highlight_color = (
+        min(car["color"][0] + 60, 255),
+        min(car["color"][1] + 60, 255),
+        min(car["color"][2] + 60, 255),
+    )
+
+    # Top part of car (hood, roof, trunk)
+    top_height = car_height * 0.2
+    top_y = car_body_y - top_height
+
+    # Hood
+    hood_width = car_body_width * 0.8
+    hood_x = car_body_x + (car_body_width - hood_width) / 2
+    pygame.draw.rect(
+        img,
+        highlight_color,
+        [hood_x, top_y, hood_width, top_height],
+        0,
+        int(car_width * 0.03),  # Rounded corners
+    )
+
+    # Windshield (angled)
+    windshield_points = [
+        (hood_x + hood_width * 0.1, top_y + top_height),  # Bottom left
+        (hood_x + hood_width * 0.3, top_y),  # Top left
+        (hood_x + hood_width * 0.7, top_y),  # Top right
+        (hood_x + hood_width * 0.9, top_y + top_height),  # Bottom right
+    ]
+    pygame.draw.polygon(
+        img, (100, 200, 255), windshield_points  # Blue windshield
+    )
+
+    # Windows (side)
+    window_height = car_body_height * 0.3
+    window_y = car_body_y + car_body_height * 0.1
+
+    # Left window
+    pygame.draw.rect(
+        img,
+        (150, 230, 255),  # Light blue window
+        [car_body_x, window_y, car_body_width * 0.15, window_height],
+        0,
+        int(car_width * 0.01),  # Rounded corners
+    )
+
+    # Right window
+    pygame.draw.rect(
+        img,
+        (150, 230, 255),  # Light blue window
+        [
+            car_body_x + car_body_width * 0.85,
+            window_y,
+            car_body_width * 0.15,
+            window_height,
+        ],
+        0,
+        int(car_width * 0.01),  # Rounded corners
+    )
+
+    # Wheels - larger and more detailed
+    wheel_radius = car_height * 0.15
+    wheel_y = car_body_y + car_body_height - wheel_radius * 0.7
+
+    wheel_positions = [
+        # Front wheel
+        car_body_x + car_body_width * 0.2,
+        # Rear wheel
+        car_body_x + car_body_width * 0.8,
+    ]
+
+    # Draw wheels with rims
+    for wheel_x in wheel_positions:
+        # Tire
+        pygame.draw.circle(
+            img, BLACK, (int(wheel_x), int(wheel_y)), int(wheel_radius)
+        )
+
+        # Rim
+        pygame.draw.circle(
+            img,
+            SLEEK_SILVER,
+            (int(wheel_x), int(wheel_y)),
+            int(wheel_radius * 0.6),
+        )
+
+        # Hub
+        pygame.draw.circle(
+            img,
+            (100, 100, 100),
+            (int(wheel_x), int(wheel_y)),
+            int(wheel_radius * 0.2),
+        )
+
+        # Spokes
+        for angle in range(0, 360, 45):
+            spoke_x = (
+                wheel_x + math.cos(math.radians(angle)) * wheel_radius * 0.5
+            )
+            spoke_y = (
+                wheel_y + math.sin(math.radians(angle)) * wheel_radius * 0.5
+            )
+            pygame.draw.line(
+                img,
+                SLEEK_SILVER,
+                (int(wheel_x), int(wheel_y)),
+                (int(spoke_x), int(spoke_y)),
+                int(wheel_radius * 0.1),
+            )
+
+    # Headlights with glow effect
+    headlight_radius = car_height * 0.08
+    headlight_y = car_body_y + car_body_height * 0.2
+
+    headlight_positions = [
+        # Left headlight
+        car_body_x + car_body_width * 0.1,
+        # Right headlight
+        car_body_x + car_body_width * 0.9,
+    ]
+
+    for headlight_x in headlight_positions:
+        # Headlight glow
+        for offset in range(3, 0, -1):
+            glow_radius = headlight_radius + offset * 2
+            glow_alpha = 150 - offset * 40
+            glow_surface = pygame.Surface(
+                (glow_radius * 2, glow_radius * 2), pygame.SRCALPHA
+            )
+            pygame.draw.circle(
+                glow_surface,
+                (255, 255, 150, glow_alpha),
+                (glow_radius, glow_radius),
+                glow_radius,
+            )
+            img.blit(
+                glow_surface,
+                (
+                    int(headlight_x - glow_radius),
+                    int(headlight_y - glow_radius),
+                ),
+            )
+
+        # Headlight
+        pygame.draw.circle(
+            img,
+            NEON_YELLOW,
+            (int(headlight_x), int(headlight_y)),
+            int(headlight_radius),
+        )
+
+    # Taillights
+    taillight_radius = car_height * 0.06
+    taillight_y = car_body_y + car_body_height * 0.2
+
+    taillight_positions = [
+        # Left taillight
+        car_body_x + car_body_width * 0.05,
+        # Right taillight
+        car_body_x + car_body_width * 0.95,
+    ]
+
+    for taillight_x in taillight_positions:
+        # Taillight glow
+        for offset in range(2, 0, -1):
+            glow_radius = taillight_radius + offset * 2
+            glow_alpha = 100 - offset * 30
+            glow_surface = pygame.Surface(
+                (glow_radius * 2, glow_radius * 2), pygame.SRCALPHA
+            )
+            pygame.draw.circle(
+                glow_surface,
+                (255, 50, 50, glow_alpha),
+                (glow_radius, glow_radius),
+                glow_radius,
+            )
+            img.blit(
+                glow_surface,
+                (
+                    int(taillight_x - glow_radius),
+                    int(taillight_y + car_body_height * 0.6 - glow_radius),
+                ),
+            )
+
+        # Taillight
+        pygame.draw.circle(
+            img,
+            BRIGHT_RED,
+            (int(taillight_x), int(taillight_y + car_body_height * 0.6)),
+            int(taillight_radius),
+        )
+
+    # Add details - door lines
+    door_y = car_body_y + car_body_height * 0.4
+    pygame.draw.line(
+        img,
+        (car["color"][0] * 0.7, car["color"][1] * 0.7, car["color"][2] * 0.7),
+        (int(car_body_x + car_body_width * 0.4), int(door_y)),
+        (
+            int(car_body_x + car_body_width * 0.4),
+            int(door_y + car_body_height * 0.4),
+        ),
+        2,
+    )
+
+    # Add details - door handles
+    handle_width = car_body_width * 0.05
+    handle_height = car_body_height * 0.03
+    handle_y = car_body_y + car_body_height * 0.35
+
+    # Left door handle
+    pygame.draw.rect(
+        img,
+        SLEEK_SILVER,
+        [
+            car_body_x + car_body_width * 0.25,
+            handle_y,
+            handle_width,
+            handle_height,
+        ],
+        0,
+        int(handle_height * 0.5),  # Rounded corners
+    )
+
+    # Right door handle
+    pygame.draw.rect(
+        img,
+        SLEEK_SILVER,
+        [
+            car_body_x + car_body_width * 0.65,
+            handle_y,
+            handle_width,
+            handle_height,
+        ],
+        0,
+        int(handle_height * 0.5),  # Rounded corners
+    )
+
+    # Add car name on the side
+    name_font = get_font(int(car_height * 0.1))
+    name_text = name_font.render(
+        car["name"].split()[0], True, (255, 255, 255, 150)
+    )
+    name_rect = name_text.get_rect(
+        center=(
+            car_body_x + car_body_width * 0.5,
+            car_body_y + car_body_height * 0.7,
+        )
+    )
+    img.blit(name_text, name_rect)
+
+    return img
+
+
+def _render_garage_display_bg(screen_width, screen_height):
+    """Draw the grid background behind the garage car preview"""
+    car_display_bg = pygame.Surface(
+        (screen_width * 0.6, screen_height * 0.4), pygame.SRCALPHA
+    )
+    car_display_bg.fill((30, 30, 50, 180))  # Semi-transparent dark blue background
+
+    # Draw a grid pattern on the background
+    grid_spacing = 20
+    for x in range(0, int(screen_width * 0.6), grid_spacing):
+        pygame.draw.line(
+            car_display_bg, (50, 50, 70, 100), (x, 0), (x, screen_height * 0.4), 1
+        )
+    for y in range(0, int(screen_height * 0.4), grid_spacing):
+        pygame.draw.line(
+            car_display_bg, (50, 50, 70, 100), (0, y), (screen_width * 0.6, y), 1
+        )
+
+    return car_display_bg
+
+
+def _render_item_icon(item):
+    """Draw the round icon for an item in the items menu"""
+    # Create a surface for the item
+    item_width = ITEM_ICON_SIZE
+    item_height = ITEM_ICON_SIZE
+    img = pygame.Surface((item_width, item_height), pygame.SRCALPHA)
+
+    # Draw the item with glow effect
+    for offset in range(3, 0, -1):
+        glow_color = (*item["color"], 100 - offset * 30)
+        pygame.draw.circle(
+            img,
+            glow_color,
+            (item_width // 2, item_height // 2),
+            item_width // 2 - offset * 2,
+        )
+
+    # Draw main item
+    pygame.draw.circle(
+        img,
+        item["color"],
+        (item_width // 2, item_height // 2),
+        item_width // 2 - 6,
+    )
+
+    # Draw symbol
+    symbol_font = get_font(30, bold=True)
+    symbol_text = symbol_font.render(item["symbol"], True, WHITE)
+    symbol_rect = symbol_text.get_rect(
+        center=(item_width // 2, item_height // 2)
+    )
+    img.blit(symbol_text, symbol_rect)
+
+    return img
+
+
+def _get_cached_preview(cache_key, render):
+    """Return a cached preview surface, rendering it on a miss"""
+    with _preview_cache_lock:
+        cached = _preview_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    surface = render()
+
+    # Another thread may have finished the same preview first
+    with _preview_cache_lock:
+        return _preview_cache.setdefault(cache_key, surface)
+
+
+def get_car_preview(car_index, screen_width, screen_height):
+    """Get the garage preview for a car at the given resolution"""
+    car = GARAGE_CARS[car_index]
+    return _get_cached_preview(
+        ("car", car["name"], screen_width, screen_height),
+        lambda: _render_car_preview(car, screen_width),
+    )
+
+
+def get_garage_display_bg(screen_width, screen_height):
+    """Get the garage display background at the given resolution"""
+    return _get_cached_preview(
+        ("display_bg", screen_width, screen_height),
+        lambda: _render_garage_display_bg(screen_width, screen_height),
+    )
+
+
+def get_item_icon(item_index):
+    """Get the items menu icon for an item"""
+    item = MENU_ITEMS[item_index]
+    return _get_cached_preview(
+        ("item", item["name"], ITEM_ICON_SIZE),
+        lambda: _render_item_icon(item),
+    )
+
+
+def warm_preview_cache(screen_width, screen_height):
+    """Build garage previews and item icons in a background thread"""
+    global _preview_warmup_thread
+
+    # Only one warm-up at a time
+    if _preview_warmup_thread is not None and _preview_warmup_thread.is_alive():
+        return
+
+    def warm():
+        try:
+            get_garage_display_bg(screen_width, screen_height)
+            for car_index in range(len(GARAGE_CARS)):
+                get_car_preview(car_index, screen_width, screen_height)
+            for item_index in range(len(MENU_ITEMS)):
+                get_item_icon(item_index)
+        except Exception as e:
+            print(f"Error warming preview cache: {e}")
+
+    _preview_warmup_thread = threading.Thread(
+        target=warm, name="preview-warmup", daemon=True
+    )
+    _preview_warmup_thread.start()
+
+
+# Entity store settings
+# Per-kind behaviour for the single move/cull/collide pass in Game.update_entities.
+# Hazards end the run unless the shield is up; everything else is a pickup.
+# Kinds with a spawner come up on the SpawnScheduler every spawn_every seconds.
+ENTITY_KINDS = {
+    "obstacle": {
+        "spawner": "spawn_obstacle",
+        "spawn_every": (3.0, 6.0),
+        "hazard": True,
+        "occupancy": "static",  # Layer of the AI occupancy grid
+        "speed": 1.0,
+        "pass_score": 1,
+        "pass_multiplied": False,
+        "pass_raises_multiplier": True,
+        "combo_prompt": True,
+        "shield_score": 2,
+        "shield_sparks": 15,
+    },
+    "car": {
+        "spawner": "spawn_car",
+        "spawn_every": (4.0, 8.0),
+        "hazard": True,
+        "occupancy": "cars",
+        "speed": 0.8,
+        "brake_speed": 0.5,  # AI cars hold back while braking
+        "steers": True,  # AI cars look at the traffic around them
+        "pass_score": 2,
+        "pass_multiplied": True,
+        "shield_score": 3,
+        "shield_sparks": 20,
+    },
+    "magnet": {
+        "spawner": "spawn_powerup",
+        "spawn_every": (10.0, 20.0),
+        "spawn_class": Magnet,
+        "spawn_message": "🧲 Magnet spawned in lane {lane}!",
+        "speed": 1.0,
+        "score": 10,
+        "effect": "activate_magnet",
+        "message": "🧲 Magnet collected!",
+    },
+    "boost": {
+        "spawner": "spawn_powerup",
+        "spawn_every": (8.0, 15.0),
+        "spawn_class": Boost,
+        "spawn_message": "⚡ Boost spawned in lane {lane}!",
+        "speed": 1.0,
+        "score": 15,
+        "effect": "activate_boost",
+        "message": "⚡ Boost collected!",
+    },
+    "slowmo": {
+        "spawner": "spawn_powerup",
+        "spawn_every": (12.0, 25.0),
+        "spawn_class": SlowMo,
+        "spawn_message": "⏱️ Slow-Mo spawned in lane {lane}!",
+        "speed": 1.0,
+        "score": 20,
+        "effect": "activate_slow_mo",
+        "message": "⏱️ Slow-Mo collected!",
+    },
+    "shield": {
+        "spawner": "spawn_powerup",
+        "spawn_every": (15.0, 30.0),
+        "spawn_class": Shield,
+        "spawn_message": "🛡️ Shield spawned in lane {lane}!",
+        "speed": 1.0,
+        "score": 25,
+        "effect": "activate_shield",
+        "message": "🛡️ Shield collected!",
+    },
+    "coin": {
+        "spawner": "spawn_coin",
+        "spawn_every": (1.0, 3.0),
+        "speed": 1.0,
+        "score": COIN_VALUE,
+        "magnetic": True,  # Pulled in while the magnet is active
+        "counts_as_coin": True,
+        "sparks": 5,
+        "sets_multiplier": True,
+        "boost_energy": 3,
+    },
+}
+
+
+# Spawn scheduler settings
+SPAWN_RETRY_DELAY = 0.25  # Seconds before a spawner that found no room tries again
+
+
+class SpawnScheduler:
+    """Heap of (due time, kind) events; a kind samples its next due time only
+    when it spawns, so frames with nothing due cost one comparison"""
+
+    def __init__(self, kinds):
+        self.intervals = {
+            kind: spec["spawn_every"] for kind, spec in kinds.items() if "spawner" in spec
+        }
+        # Ties between kinds due at the same time break in table order
+        self.order = {kind: i for i, kind in enumerate(self.intervals)}
+        self.clock = 0.0
+        self.heap = []
+        for kind in self.intervals:
+            self.schedule(kind)
+
+    def schedule(self, kind, delay=None):
+        """Queue a kind's next spawn, delay seconds from now or a fresh interval"""
+        if delay is None:
+            delay = rng.spawn.uniform(*self.intervals[kind])
+        heapq.heappush(self.heap, (self.clock + delay, self.order[kind], kind))
+
+    def advance(self, dt):
+        """Run the clock on by dt and yield the kinds now due, earliest first;
+        each yielded kind must be scheduled again"""
+        self.clock += dt
+        heap = self.heap
+        while heap and heap[0][0] <= self.clock:
+            yield heapq.heappop(heap)[2]
+
+
+# Entity pool settings
+ENTITY_POOL_LIMIT = 64  # Retired instances kept per entity class
+
+
+class EntityPool:
+    """Free lists of despawned entities per class, handed out again through reset()"""
+
+    def __init__(self, limit=ENTITY_POOL_LIMIT):
+        self.limit = limit
+        self.free = {}
+        # class name -> hits, misses, live and high-water counts
+        self.counters = {}
+
+    def _counters(self, cls):
+        counters = self.counters.get(cls.__name__)
+        if counters is None:
+            counters = self.counters[cls.__name__] = {
+                "hits": 0,
+                "misses": 0,
+                "live": 0,
+                "high_water": 0,
+            }
+        return counters
+
+    def acquire(self, cls, *args):
+        """Reset a retired instance when one is free, otherwise allocate"""
+        counters = self._counters(cls)
+        free = self.free.get(cls)
+        if free:
+            counters["hits"] += 1
+            entity = free.pop().reset(*args)
+        else:
+            counters["misses"] += 1
+            entity = cls(*args)
+        counters["live"] += 1
+        if counters["live"] > counters["high_water"]:
+            counters["high_water"] = counters["live"]
+        return entity
+
+    def release(self, entity):
+        cls = type(entity)
+        self._counters(cls)["live"] -= 1
+        free = self.free.setdefault(cls, [])
+        if len(free) < self.limit:
+            free.append(entity)
+
+    def stats(self):
+        """Per-class counters plus free list sizes, with totals under 'all'"""
+        stats = {}
+        totals = dict.fromkeys(("hits", "misses", "live", "high_water", "free"), 0)
+        for cls_name, counters in self.counters.items():
+            entry = dict(counters)
+            entry["free"] = sum(
+                len(free) for cls, free in self.free.items() if cls.__name__ == cls_name
+            )
+            stats[cls_name] = entry
+            for key in totals:
+                totals[key] += entry[key]
+        stats["all"] = totals
+        return stats
+
+
+class EntityStore:
+    """Dense per-kind entity lists with stable handles and swap-remove deletion"""
+
+    def __init__(self, kinds, pool=None):
+        self.lists = {kind: [] for kind in kinds}
+        # handle -> (kind, index into that kind's list)
+        self.slots = {}
+        self.next_handle = 1
+        # Removed entities go back here for the next spawn to reuse
+        self.pool = pool
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __iter__(self):
+        for items in self.lists.values():
+            yield from items
+
+    def add(self, kind, entity):
+        """Store an entity and return its handle"""
+        items = self.lists[kind]
+        handle = self.next_handle
+        self.next_handle += 1
+        entity.handle = handle
+        self.slots[handle] = (kind, len(items))
+        items.append(entity)
+        return handle
+
+    def spawn(self, kind, cls, *args):
+        """Add a pooled instance of cls built from args and return it"""
+        entity = self.pool.acquire(cls, *args) if self.pool else cls(*args)
+        self.add(kind, entity)
+        return entity
+
+    def get(self, handle):
+        slot = self.slots.get(handle)
+        return None if slot is None else self.lists[slot[0]][slot[1]]
+
+    def remove(self, entity):
+        """Remove in O(1) by moving the kind's last entity into the freed slot"""
+        slot = self.slots.pop(getattr(entity, "handle", None), None)
+        if slot is None:
+            return False
+        kind, index = slot
+        items = self.lists[kind]
+        last = items.pop()
+        if index < len(items):
+            items[index] = last
+            self.slots[last.handle] = (kind, index)
+        # Still safe to read until the next spawn, which may reset it
+        if self.pool:
+            self.pool.release(entity)
+        return True
+
+    def of(self, kind):
+        """The live list for a kind; read it, but add and remove through the store"""
+        return self.lists[kind]
+
+    def count(self, kind):
+        return len(self.lists[kind])
+
+    def kind_of(self, entity):
+        slot = self.slots.get(getattr(entity, "handle", None))
+        return None if slot is None else slot[0]
+
+    def clear(self):
+        if self.pool:
+            for entity in self:
+                self.pool.release(entity)
+        for items in self.lists.values():
+            items.clear()
+        self.slots.clear()
+
+
+def lane_boundaries():
+    """x coordinates halfway between lane centres, for bisecting a lane out of x"""
+    return [(left + right) / 2 for left, right in zip(LANE_POSITIONS, LANE_POSITIONS[1:])]
+
+
+def swept_collides(entity, car):
+    """AABB test with the vertical axis swept over the last step, so something
+    moving faster than the two boxes are tall can't pass through the car
+    between ticks; matches collides_with when neither has moved"""
+    if getattr(entity, "collected", False):
+        return False
+    if abs(entity.x - car.x) >= (entity.width + car.width) // 2:
+        return False
+    reach = (entity.height + car.height) // 2
+    # Vertical offset from the car at the start and end of the step
+    start = getattr(entity, "prev_y", entity.y) - getattr(car, "prev_y", car.y)
+    end = entity.y - car.y
+    if start > end:
+        start, end = end, start
+    return start < reach and end > -reach
+
+
+def magnet_pull(entities, x, y, step):
+    """Pull every entity within MAGNET_RANGE of (x, y) towards it in one pass.
+    The move is the delta scaled by pull / distance, so no angle is computed,
+    and the square root is only needed where the pull hits MAGNET_MAX_PULL."""
+    range_sq = MAGNET_RANGE * MAGNET_RANGE
+    if np is not None and len(entities) >= MAGNET_VECTOR_MIN:
+        count = len(entities)
+        xs = np.fromiter(map(attrgetter("x"), entities), float, count)
+        ys = np.fromiter(map(attrgetter("y"), entities), float, count)
+        dx = x - xs
+        dy = y - ys
+        dist_sq = dx * dx + dy * dy
+        pulled = np.flatnonzero((dist_sq > 0) & (dist_sq < range_sq))
+        if not pulled.size:
+            return
+        scale = np.minimum(MAGNET_PULL, MAGNET_MAX_PULL / np.sqrt(dist_sq[pulled])) * step
+        new_xs = xs[pulled] + dx[pulled] * scale
+        new_ys = ys[pulled] + dy[pulled] * scale
+        for i, new_x, new_y in zip(pulled.tolist(), new_xs.tolist(), new_ys.tolist()):
+            entity = entities[i]
+            entity.x = new_x
+            entity.y = new_y
+        return
+
+    # Inside this distance the proportional pull is under the cap
+    capped_sq = (MAGNET_MAX_PULL / MAGNET_PULL) ** 2
+    proportional = MAGNET_PULL * step
+    for entity in entities:
+        dx = x - entity.x
+        dy = y - entity.y
+        dist_sq = dx * dx + dy * dy
+        if 0 < dist_sq < range_sq:
+            if dist_sq <= capped_sq:
+                scale = proportional
+            else:
+                scale = MAGNET_MAX_PULL * step / math.sqrt(dist_sq)
+            entity.x += dx * scale
+            entity.y += dy * scale
+
+
+# Occupancy grid settings
+OCCUPANCY_BIN_HEIGHT = 50  # Pixels of road per occupancy grid row
+OCCUPANCY_MARGIN = 200  # Pixels covered above and below the screen
+
+
+class OccupancyGrid:
+    """Per-frame lane x y-bin counts of obstacles and cars for O(1) AI lookups"""
+
+    LAYERS = ("static", "cars")
+
+    def __init__(self):
+        # layer -> per-lane prefix sums over the y bins
+        self.prefix = {layer: [] for layer in self.LAYERS}
+        self.bins = 0
+
+    def bin_for_y(self, y):
+        return min(self.bins - 1, max(0, int((y + OCCUPANCY_MARGIN) // OCCUPANCY_BIN_HEIGHT)))
+
+    def build(self, layers):
+        """Count entities per cell; layers maps a layer name to its entities"""
+        bins = self.bins = (SCREEN_HEIGHT + 2 * OCCUPANCY_MARGIN) // OCCUPANCY_BIN_HEIGHT + 1
+        boundaries = lane_boundaries()
+        lane_for_x = partial(bisect.bisect, boundaries)
+        last_row = bins - 1
+        for layer in self.LAYERS:
+            counts = [[0] * bins for _ in LANE_POSITIONS]
+            for entity in layers.get(layer, ()):
+                row = int((entity.y + OCCUPANCY_MARGIN) // OCCUPANCY_BIN_HEIGHT)
+                if row < 0:
+                    row = 0
+                elif row > last_row:
+                    row = last_row
+                counts[lane_for_x(entity.x)][row] += 1
+            # Prefix sums turn any y range into two lookups
+            self.prefix[layer] = [[0, *accumulate(lane_counts)] for lane_counts in counts]
+        return self
+
+    def count(self, layer, lane, y_min, y_max):
+        """Entities in a lane between y_min and y_max, to bin resolution"""
+        prefix = self.prefix[layer]
+        if not 0 <= lane < len(prefix):
+            return 0
+        lane_prefix = prefix[lane]
+        return lane_prefix[self.bin_for_y(y_max) + 1] - lane_prefix[self.bin_for_y(y_min)]
+
+    def clear_lanes(self, y_min, y_max):
+        """Lanes with nothing in either layer between y_min and y_max"""
+        low = self.bin_for_y(y_min)
+        high = self.bin_for_y(y_max) + 1
+        return [
+            lane
+            for lane, (static, cars) in enumerate(zip(self.prefix["static"], self.prefix["cars"]))
+            if static[high] == static[low] and cars[high] == cars[low]
+        ]
+
 
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_x:
-            if self.active_prompts:
-                # Start fade out for all prompts
-                for prompt in self.active_prompts:
-                    prompt["fade_out"] = True
-                    # Make fade out faster
-                    remaining_time = 0.5
-                    prompt["duration"] = (
-                        time.time() - prompt["start_time"] + remaining_time
-                    )
-                return True
-        return False
+class LaneIndex:
+    """Per-frame broad phase: entities bucketed by lane and sorted by y"""
 
-    def reset(self):
-        """Reset all prompts to be shown again"""
-        for prompt_id in self.prompts:
-            self.prompts[prompt_id]["shown"] = False
-        self.active_prompts = []
-    
-    def show_custom_prompt(self, text, duration=3.0, fade_out=True):
-        """Show a custom prompt with specified text and duration"""
-        prompt = {
-            "text": text,
-            "start_time": time.time(),
-            "duration": duration,
-            "alpha": 255,
-            "fade_out": fade_out,
-            "fade_in": True,  # Add missing fade_in attribute
-            "y_offset": 0
-        }
-        self.active_prompts.append(prompt)
+    def __init__(self):
+        self.buckets = []
+        self.ys = []
+        # Lane boundaries halfway between lane centres, for bisecting x
+        self.boundaries = []
+        self.max_width = 0
+        self.max_height = 0
+
+    def build(self, entities):
+        """Rebuild the buckets from the current entity positions"""
+        self.boundaries = lane_boundaries()
+        self.buckets = [[] for _ in LANE_POSITIONS]
+        entities = list(entities)
+        self.max_width = max(map(attrgetter("width"), entities), default=0)
+        self.max_height = max(map(attrgetter("height"), entities), default=0)
+
+        boundaries = self.boundaries
+        buckets = self.buckets
+        for entity in entities:
+            # Bucket by position rather than the lane attribute, so swaying
+            # obstacles and magnet-pulled coins land where they really are
+            buckets[bisect.bisect(boundaries, entity.x)].append(entity)
+        by_y = attrgetter("y")
+        for bucket in buckets:
+            bucket.sort(key=by_y)
+        self.ys = [list(map(by_y, bucket)) for bucket in buckets]
+        return self
+
+    def lane_for_x(self, x):
+        return bisect.bisect(self.boundaries, x)
+
+    def query(self, lane, y_min, y_max):
+        """Entities in a lane with y_min < y < y_max"""
+        if not 0 <= lane < len(self.buckets):
+            return []
+        ys = self.ys[lane]
+        return self.buckets[lane][
+            bisect.bisect_right(ys, y_min) : bisect.bisect_left(ys, y_max)
+        ]
 
-    def resize(self):
-        """Update font sizes after window resize"""
-        self.font = get_font(scale_value(24), bold=True)
-        self.small_font = get_font(scale_value(18))
+    def near(self, x, y, width, height):
+        """Entities whose boxes could overlap a box centred on (x, y)"""
+        reach_x = (self.max_width + width) / 2
+        reach_y = (self.max_height + height) / 2
+        candidates = []
+        for lane in range(self.lane_for_x(x - reach_x), self.lane_for_x(x + reach_x) + 1):
+            candidates.extend(self.query(lane, y - reach_y, y + reach_y))
+        return candidates
+
+
+# Input replay settings
+# One bit per player action; a tick's mask says which actions landed on it
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_BOOST = 4
+INPUT_PAUSE = 8  # Marks where the run was paused, no effect on the simulation
+REPLAY_MAGIC = b"CRPL"
+REPLAY_VERSION = 4
+# magic, version, game mode, tick rate, screen size, run seed, tick count
+REPLAY_HEADER = struct.Struct("<4sBBHHHqI")
+REPLAY_DIR = "data/replays"
+
+
+class InputLog:
+    """Per-tick input masks for one run, kept run-length encoded as (mask, ticks)"""
+
+    def __init__(self, seed=0, game_mode=GAME_MODE_ENDLESS, width=None, height=None):
+        self.seed = seed
+        self.game_mode = game_mode
+        self.width = SCREEN_WIDTH if width is None else width
+        self.height = SCREEN_HEIGHT if height is None else height
+        self.runs = []
+        self.ticks = 0
+
+    def record(self, mask):
+        runs = self.runs
+        if runs and runs[-1][0] == mask:
+            runs[-1][1] += 1
+        else:
+            runs.append([mask, 1])
+        self.ticks += 1
+
+    def masks(self):
+        """Yield the mask for every tick in order"""
+        for mask, count in self.runs:
+            for _ in range(count):
+                yield mask
+
+    def presses(self):
+        """Number of ticks that carried any input"""
+        return sum(count for mask, count in self.runs if mask)
+
+    def to_bytes(self):
+        out = bytearray(
+            REPLAY_HEADER.pack(
+                REPLAY_MAGIC,
+                REPLAY_VERSION,
+                self.game_mode,
+                SIMULATION_HZ,
+                self.width,
+                self.height,
+                self.seed,
+                self.ticks,
+            )
+        )
+        # Each run is its mask byte then the tick count as a LEB128 varint,
+        # so a quiet stretch of any length costs two or three bytes
+        for mask, count in self.runs:
+            out.append(mask)
+            while count >= 0x80:
+                out.append(count & 0x7F | 0x80)
+                count >>= 7
+            out.append(count)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < REPLAY_HEADER.size:
+            raise ValueError("replay is truncated")
+        magic, version, game_mode, hz, width, height, seed, ticks = REPLAY_HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError("not a replay file, or from another version")
+        if hz != SIMULATION_HZ:
+            raise ValueError(f"replay was recorded at {hz} Hz, the game steps at {SIMULATION_HZ} Hz")
+        log = cls(seed, game_mode, width, height)
+        pos = REPLAY_HEADER.size
+        while pos < len(data):
+            mask = data[pos]
+            count = shift = 0
+            while True:
+                pos += 1
+                if pos >= len(data):
+                    raise ValueError("replay is truncated")
+                byte = data[pos]
+                count |= (byte & 0x7F) << shift
+                shift += 7
+                if byte < 0x80:
+                    break
+            pos += 1
+            log.runs.append([mask, count])
+            log.ticks += count
+        if log.ticks != ticks:
+            raise ValueError(f"replay is truncated: {log.ticks} of {ticks} ticks")
+        return log
+
+    def save(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
 
 
 class Game:
@@ -4967,10 +7291,9 @@ class Game:
             SCREEN_HEIGHT = info.current_h
 
             self.screen = pygame.display.set_mode(
-                (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN
+                (SCREEN_WIDTH, SCREEN_HEIGHT), 0 if HEADLESS else pygame.FULLSCREEN
             )
             pygame.display.set_caption("Car Racing Game")
-            self.clock = pygame.time.Clock()
 
             # Music player has been removed, we'll handle music directly
             self.music_player = None
@@ -4986,6 +7309,9 @@ class Game:
             self.font_small = get_font(scale_value(24))
 
             self.particle_system = ParticleSystem()
+            # Tire marks and road details scroll with the road in one decal layer
+            self.road_decals = DecalLayer(SCREEN_WIDTH, SCREEN_HEIGHT)
+            self.particle_system.decals = self.road_decals
             self.highscore_manager = HighScoreManager()
 
             # Initialize prompt system
@@ -4995,9 +7321,6 @@ class Game:
             self.transition = TransitionEffect(self.screen, "fade")
             self.transitioning = False
 
-            # Initialize timing for updates
-            self.last_update_time = time.time()
-
             # Sparkle animation for menu background
             self.sparkles = []
             self.generate_sparkles(100)  # Create 100 sparkles
@@ -5010,6 +7333,8 @@ class Game:
             # Initialize sound effects
             self.init_sounds()
 
+            # Where to write each run's input log on game over (--record)
+            self.record_path = None
             self.reset_game()
             
             # Load selected car from file (use global variable if available)
@@ -5380,15 +7705,15 @@ class Game:
                 self.create_placeholder_sounds()
 
                 # Load sounds
-                self.sound_engine = pygame.mixer.Sound(self.SOUND_ENGINE)
-                self.sound_crash = pygame.mixer.Sound(self.SOUND_CRASH)
-                self.sound_powerup = pygame.mixer.Sound(self.SOUND_POWERUP)
-                self.sound_coin = pygame.mixer.Sound(self.SOUND_COIN)
-                self.sound_menu_select = pygame.mixer.Sound(self.SOUND_MENU_SELECT)
-                self.sound_menu_navigate = pygame.mixer.Sound(self.SOUND_MENU_NAVIGATE)
-                self.sound_boost = pygame.mixer.Sound(self.SOUND_BOOST)
-                self.sound_shield = pygame.mixer.Sound(self.SOUND_SHIELD)
-                self.sound_game_over = pygame.mixer.Sound(self.SOUND_GAME_OVER)
+                self.sound_engine = assets.load_sound(self.SOUND_ENGINE)
+                self.sound_crash = assets.load_sound(self.SOUND_CRASH)
+                self.sound_powerup = assets.load_sound(self.SOUND_POWERUP)
+                self.sound_coin = assets.load_sound(self.SOUND_COIN)
+                self.sound_menu_select = assets.load_sound(self.SOUND_MENU_SELECT)
+                self.sound_menu_navigate = assets.load_sound(self.SOUND_MENU_NAVIGATE)
+                self.sound_boost = assets.load_sound(self.SOUND_BOOST)
+                self.sound_shield = assets.load_sound(self.SOUND_SHIELD)
+                self.sound_game_over = assets.load_sound(self.SOUND_GAME_OVER)
 
                 # Set volume levels
                 self.sound_engine.set_volume(0.3)
@@ -5481,6 +7806,7 @@ class Game:
             
             # Try to load and play the track
             try:
+                # Music stays out of the asset cache (see AssetManager.load_sound)
                 menu_music = pygame.mixer.Sound(track_path)
                 menu_music.set_volume(0.4)
                 self.menu_music_channel.play(menu_music)  # Play once, no loops
@@ -5655,7 +7981,47 @@ class Game:
             
             surface.blit(cloud_surface, (cloud_x, cloud_y))
 
-    def draw_animated_clouds(self, surface, screen_width, screen_height):
+    def draw_ambient_layer(self, surface, screen_width, screen_height):
+        """Draw the menu clouds and waves, reusing them for a few frames on lower quality tiers"""
+        interval = current_quality["ambient_update_interval"]
+        scale = current_quality["render_scale"]
+
+        # Full quality: draw straight onto the target every frame
+        if interval <= 1 and scale >= 1.0:
+            self.draw_animated_clouds(surface, screen_width, screen_height)
+            self.draw_animated_waves(surface, screen_width, screen_height)
+            return
+
+        layer_key = (screen_width, screen_height, scale)
+        self.ambient_frame_count = getattr(self, "ambient_frame_count", 0) + 1
+        if (
+            getattr(self, "ambient_layer_key", None) != layer_key
+            or self.ambient_frame_count >= interval
+        ):
+            # Redraw at the tier's render scale, then stretch to the screen once
+            layer_width = max(1, int(screen_width * scale))
+            layer_height = max(1, int(screen_height * scale))
+            layer = pygame.Surface((layer_width, layer_height), pygame.SRCALPHA)
+            self.draw_animated_clouds(layer, layer_width, layer_height, scale)
+            self.draw_animated_waves(layer, layer_width, layer_height, scale)
+            if scale != 1.0:
+                layer = pygame.transform.scale(layer, (screen_width, screen_height))
+
+            self.ambient_layer = layer
+            self.ambient_layer_key = layer_key
+            self.ambient_frame_count = 0
+
+        # Only the cloud band at the top and the waves at the bottom have content
+        cloud_band_height = int(screen_height * 0.35) + 70
+        wave_top = int(screen_height * 0.94) - 8
+        surface.blit(self.ambient_layer, (0, 0), (0, 0, screen_width, cloud_band_height))
+        surface.blit(
+            self.ambient_layer,
+            (0, wave_top),
+            (0, wave_top, screen_width, screen_height - wave_top),
+        )
+
+    def draw_animated_clouds(self, surface, screen_width, screen_height, scale=1.0):
         """Draw animated clouds drifting across the night sky"""
         current_time = pygame.time.get_ticks() / 1000.0
         
@@ -5690,24 +8056,28 @@ class Game:
         for layer_idx, layer in enumerate(cloud_layers):
             for cloud_idx in range(layer['count']):
                 # Calculate cloud position based on time and speed
-                base_offset = (current_time * layer['speed'] + cloud_idx * 200) % (screen_width + 300)
-                cloud_x = base_offset - 150
+                base_offset = (
+                    current_time * layer['speed'] + cloud_idx * 200
+                ) * scale % (screen_width + 300 * scale)
+                cloud_x = base_offset - 150 * scale
                 
-                # Use cloud index to determine consistent y position and size
-                import random
-                random.seed(layer_idx * 100 + cloud_idx)  # Consistent random values
-                cloud_y = random.uniform(layer['y_range'][0], layer['y_range'][1])
-                cloud_width = random.randint(layer['size_range'][0], layer['size_range'][1])
+                # Use cloud index to determine consistent y position and size,
+                # without touching any shared random state
+                cloud_rng = rng.keyed("cloud", layer_idx, cloud_idx)
+                cloud_y = cloud_rng.uniform(layer['y_range'][0], layer['y_range'][1])
+                cloud_width = int(
+                    cloud_rng.randint(layer['size_range'][0], layer['size_range'][1]) * scale
+                )
                 cloud_height = cloud_width // 3
                 
                 # Vary alpha based on position for depth effect
                 distance_factor = abs(cloud_x - screen_width/2) / (screen_width/2)
                 alpha_variation = (1 - distance_factor * 0.3)  # Fade at edges
-                base_alpha = random.randint(layer['alpha_range'][0], layer['alpha_range'][1])
+                base_alpha = cloud_rng.randint(layer['alpha_range'][0], layer['alpha_range'][1])
                 cloud_alpha = int(base_alpha * alpha_variation)
                 
                 # Add slight vertical movement
-                cloud_y += math.sin(current_time * 0.3 + cloud_idx) * 10
+                cloud_y += math.sin(current_time * 0.3 + cloud_idx) * 10 * scale
                 
                 # Only draw cloud if it's visible on screen
                 if -cloud_width < cloud_x < screen_width + cloud_width:
@@ -5750,7 +8120,7 @@ class Game:
         
         surface.blit(cloud_surface, (x, y))
 
-    def draw_animated_waves(self, surface, screen_width, screen_height):
+    def draw_animated_waves(self, surface, screen_width, screen_height, scale=1.0):
         """Draw animated sea waves at the very bottom of the screen"""
         current_time = pygame.time.get_ticks() / 1000.0
         
@@ -5768,13 +8138,13 @@ class Game:
         
         for layer in wave_layers:
             wave_points = []
-            wave_y_base = wave_start_y + layer['y_offset']
+            wave_y_base = wave_start_y + layer['y_offset'] * scale
             
             # Create wave points
-            for x in range(0, screen_width + 20, 10):
+            for x in range(0, screen_width + 20, max(2, int(10 * scale))):
                 wave_y = wave_y_base + math.sin(
-                    x * layer['frequency'] + current_time * layer['speed'] * 0.1
-                ) * layer['amplitude']
+                    x / scale * layer['frequency'] + current_time * layer['speed'] * 0.1
+                ) * layer['amplitude'] * scale
                 wave_points.append((x, wave_y))
             
             # Add bottom points to close the polygon
@@ -5786,16 +8156,20 @@ class Game:
                 pygame.draw.polygon(surface, layer['color'], wave_points)
         
         # Add wave foam/whitecaps
-        foam_y = wave_start_y + 2
-        for i in range(0, screen_width, 40):
-            foam_x = i + math.sin(current_time * 2 + i * 0.01) * 5
+        foam_y = wave_start_y + 2 * scale
+        foam_width = max(2, int(15 * scale))
+        foam_height = max(1, int(4 * scale))
+        for i in range(0, int(screen_width / scale), 40):
+            foam_x = (i + math.sin(current_time * 2 + i * 0.01) * 5) * scale
             foam_intensity = (math.sin(current_time * 3 + i * 0.02) + 1) * 0.5
             
             if foam_intensity > 0.7:  # Only show foam when intensity is high
                 foam_alpha = int(foam_intensity * 120)
-                foam_surface = pygame.Surface((15, 4), pygame.SRCALPHA)
-                pygame.draw.ellipse(foam_surface, (255, 255, 255, foam_alpha), (0, 0, 15, 4))
-                surface.blit(foam_surface, (foam_x - 7, foam_y))
+                foam_surface = pygame.Surface((foam_width, foam_height), pygame.SRCALPHA)
+                pygame.draw.ellipse(
+                    foam_surface, (255, 255, 255, foam_alpha), (0, 0, foam_width, foam_height)
+                )
+                surface.blit(foam_surface, (foam_x - foam_width // 2, foam_y))
 
     def start_menu_music_playlist(self):
         """Start the menu music playlist"""
@@ -6050,15 +8424,17 @@ class Game:
     def update_sparkles(self, dt):
         """Update sparkle positions and properties"""
         # Limit the maximum number of sparkles
-        max_sparkles = 50  # Set a maximum limit for sparkles
+        max_sparkles = current_quality["sparkle_count"]  # Set by the quality tier
         if len(self.sparkles) > max_sparkles:
             # Remove excess sparkles
             self.sparkles = self.sparkles[:max_sparkles]
 
+        # Speeds and chances below are per 60 FPS frame
+        step = dt * REFERENCE_FPS
         for sparkle in self.sparkles:
             # Move sparkle in its direction
-            sparkle["x"] += math.cos(sparkle["direction"]) * sparkle["speed"]
-            sparkle["y"] += math.sin(sparkle["direction"]) * sparkle["speed"]
+            sparkle["x"] += math.cos(sparkle["direction"]) * sparkle["speed"] * step
+            sparkle["y"] += math.sin(sparkle["direction"]) * sparkle["speed"] * step
 
             # Wrap around screen edges
             if sparkle["x"] < 0:
@@ -6071,15 +8447,15 @@ class Game:
                 sparkle["y"] = 0
 
             # Occasionally change direction
-            if random.random() < 0.01:
-                sparkle["direction"] = random.uniform(0, 2 * math.pi)
+            if rng.cosmetic.random() < 0.01 * step:
+                sparkle["direction"] = rng.cosmetic.uniform(0, 2 * math.pi)
 
             # Occasionally change speed
-            if random.random() < 0.01:
-                sparkle["speed"] = random.uniform(0.2, 1.0)
+            if rng.cosmetic.random() < 0.01 * step:
+                sparkle["speed"] = rng.cosmetic.uniform(0.2, 1.0)
 
             # Occasionally remove sparkles (5% chance per second)
-            if random.random() < 0.0008:  # ~5% chance per second at 60fps
+            if rng.cosmetic.random() < 0.0008 * step:  # ~5% chance per second
                 self.sparkles.remove(sparkle)
                 break
 
@@ -6262,7 +8638,12 @@ class Game:
                 blit_y = min(y, end_y) - 2
                 self.screen.blit(ray_surface, (blit_x, blit_y))
 
-    def reset_game(self):
+    def reset_game(self, seed=None):
+        # Every run draws from its own seeded streams; the same seed and inputs
+        # replay the same run
+        self.run_seed = rng.reseed(seed)
+        emitter_tables.rewind(rng.particles)
+
         # Use the selected car color if available
         car_color = RED  # Default red
         if hasattr(self, "selected_car"):
@@ -6293,36 +8674,40 @@ class Game:
         
         # PowerUp tracker removed
 
-        self.obstacles = []
-        self.other_cars = []
+        # Obstacles, traffic, power-ups and coins all live in one store; the
+        # pool outlives runs so the last run's entities are reused by the next
+        if not hasattr(self, "entity_pool"):
+            self.entity_pool = EntityPool()
+        if hasattr(self, "entities"):
+            self.entities.clear()
+        self.entities = EntityStore(ENTITY_KINDS, self.entity_pool)
+        self.lane_index = LaneIndex()
+        self.occupancy = OccupancyGrid()
         # self.powerups = [] # removed
         self.powerups = []  # Re-added to fix AttributeError
-        self.magnets = []  # Add magnets list
-        self.boosts = []   # Add boosts list
-        self.slowmos = []  # Add slow-mo list
-        self.shields = []  # Add shields list
-        self.coins = []
         self.speed = INITIAL_SPEED
         self.score = 0
         self.coins_collected = 0
         self.game_over = False
-        self.last_obstacle_time = time.time()
-        self.last_car_time = time.time()
+        # Simulation clock: advanced by SIMULATION_DT per step, never by wall time
+        self.sim_time = 0.0
+        self.sim_accumulator = 0.0
+        # Key presses reach the simulation through a queue, one tick at a time,
+        # and every tick's input is logged so the run can be replayed
+        self.input_queue = deque()
+        self.input_log = InputLog(self.run_seed)
+        # Spawns fall due on the scheduler's own clock, which only runs while
+        # the game does and slows down with slow-mo
+        self.spawner = SpawnScheduler(ENTITY_KINDS)
         # self.last_powerup_time = time.time() # removed
-        self.last_powerup_time = time.time()  # Re-added to fix AttributeError
-        self.last_magnet_time = time.time()  # Add magnet timing
-        self.last_boost_time = time.time()   # Add boost timing
-        self.last_slowmo_time = time.time()  # Add slow-mo timing
-        self.last_shield_time = time.time()  # Add shield timing
-        self.last_coin_time = time.time()
-        self.last_update_time = time.time()
+        self.last_powerup_time = self.sim_time  # Re-added to fix AttributeError
         self.combo_count = 0
         self.combo_timer = 0
         self.score_multiplier = 1
         self.game_mode = GAME_MODE_ENDLESS
         self.distance_traveled = 0
         self.time_remaining = TIME_ATTACK_INITIAL_TIME  # for time attack mode
-        self.time_attack_mission_type = random.randint(
+        self.time_attack_mission_type = rng.spawn.randint(
             0, 5
         )  # Random Time Attack mission
         self.time_attack_target = 0
@@ -6330,7 +8715,7 @@ class Game:
         self.time_attack_speed_timer = 0  # For speed maintenance mission
         self.time_attack_passed_cars = 0  # For passing cars mission
         self.time_attack_avoided_obstacles = 0  # For avoiding obstacles mission
-        self.mission_type = random.randint(0, 3)  # For regular missions mode
+        self.mission_type = rng.spawn.randint(0, 3)  # For regular missions mode
         self.mission_target = 0
         self.mission_progress = 0
         self.set_mission()
@@ -6373,13 +8758,13 @@ class Game:
 
     def set_mission(self):
         if self.mission_type == MISSION_COLLECT_COINS:
-            self.mission_target = random.randint(10, 30)
+            self.mission_target = rng.spawn.randint(10, 30)
             self.mission_description = f"Collect {self.mission_target} coins"
         elif self.mission_type == MISSION_DISTANCE:
-            self.mission_target = random.randint(1000, 3000)
+            self.mission_target = rng.spawn.randint(1000, 3000)
             self.mission_description = f"Travel {self.mission_target}m"
         elif self.mission_type == MISSION_AVOID_CRASHES:
-            self.mission_target = random.randint(30, 60)
+            self.mission_target = rng.spawn.randint(30, 60)
             self.mission_description = f"Survive {self.mission_target} seconds"
         # MISSION_USE_POWERUPS removed
 
@@ -6393,7 +8778,7 @@ class Game:
         elif self.mission_type == MISSION_DISTANCE:
             self.mission_progress = int(self.distance_traveled)
         elif self.mission_type == MISSION_AVOID_CRASHES:
-            self.mission_progress = int(time.time() - self.start_time)
+            self.mission_progress = int(self.sim_time)
         # MISSION_USE_POWERUPS removed
 
         # Check if mission is complete
@@ -6423,24 +8808,26 @@ class Game:
 
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_LEFT:
-                        self.player_car.move_left()
+                        self.input_queue.append(INPUT_LEFT)
                     elif event.key == pygame.K_RIGHT:
-                        self.player_car.move_right()
+                        self.input_queue.append(INPUT_RIGHT)
                     elif event.key == pygame.K_SPACE:
-                        # Use boost when space is pressed
-                        if self.player_car.use_boost_energy():
-                            # Play boost sound
-                            if sound_enabled and hasattr(self, "sound_boost"):
-                                self.sound_boost.play()
-                            # Show boost prompt removed
-                            # if hasattr(self, "prompt_system"):
-                            #     self.prompt_system.show_prompt("powerup_boost")
+                        # Use boost when space is pressed (applied on the next tick)
+                        self.input_queue.append(INPUT_BOOST)
                     # T key handler removed (was for day/night cycle transitions)
                     elif event.key == pygame.K_p:
                         # Press P for power-up statistics
                         print("\n" + "="*60)
                         print("🎮 POWER-UP STATISTICS REMOVED")
                         print("="*60)
+                    elif event.key == pygame.K_F3:
+                        # Toggle the frame timing / quality overlay
+                        self.show_debug_overlay = not getattr(
+                            self, "show_debug_overlay", False
+                        )
+                    elif event.key == pygame.K_F4:
+                        # Cycle frame pacing: sleep, busy loop, hybrid
+                        frame_scheduler.cycle_mode()
                     elif event.key == pygame.K_F11:
                         # Toggle fullscreen mode when F11 is pressed
                         print("F11 key pressed - toggling fullscreen")
@@ -6473,6 +8860,7 @@ class Game:
                             traceback.print_exc()
                     elif event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
                         # Show pause menu when ESC or P is pressed
+                        self.input_queue.append(INPUT_PAUSE)
                         pause_result = self.show_pause_menu()
                         if not pause_result:
                             return False
@@ -6487,6 +8875,7 @@ class Game:
                             40,  # Match drawing size
                         )
                         if pause_button_rect.collidepoint(event.pos):
+                            self.input_queue.append(INPUT_PAUSE)
                             pause_result = self.show_pause_menu()
                             if not pause_result:
                                 return False
@@ -6524,9 +8913,8 @@ class Game:
 
         # Try to load the background image
         try:
-            background_image = pygame.image.load("assets/images/bgm.jpg")
-            background_image = pygame.transform.scale(
-                background_image, (SCREEN_WIDTH, SCREEN_HEIGHT)
+            background_image = assets.load_image(
+                BACKGROUND_IMAGE, (SCREEN_WIDTH, SCREEN_HEIGHT)
             )
 
             has_background_image = True
@@ -6621,7 +9009,7 @@ class Game:
             self.screen.blit(instruction_text, instruction_rect)
 
             pygame.display.flip()
-            self.clock.tick(30)
+            frame_scheduler.tick(30)
 
         return text
 
@@ -6648,9 +9036,8 @@ class Game:
 
         # Try to load the background image
         try:
-            background_image = pygame.image.load("assets/images/bgm.jpg")
-            background_image = pygame.transform.scale(
-                background_image, (SCREEN_WIDTH, SCREEN_HEIGHT)
+            background_image = assets.load_image(
+                BACKGROUND_IMAGE, (SCREEN_WIDTH, SCREEN_HEIGHT)
             )
 
             has_background_image = True
@@ -6695,7 +9082,7 @@ class Game:
             and not self.menu_music_playing
         ):
             try:
-                # Load menu music
+                # Load menu music, outside the asset cache
                 menu_music = pygame.mixer.Sound(self.SOUND_MENU_MUSIC)
                 menu_music.set_volume(0.4)  # Set appropriate volume
                 self.menu_music_channel.play(menu_music, loops=-1)  # Loop indefinitely
@@ -6987,7 +9374,7 @@ class Game:
             self.screen.blit(instruction_text, instruction_rect)
 
             pygame.display.flip()
-            self.clock.tick(30)
+            frame_scheduler.tick(30)
 
     def show_pause_menu(self):
         # Pause engine sound if it's playing
@@ -7020,7 +9407,6 @@ class Game:
             self.sound_menu_select.play()
 
         # Main pause menu loop
-        clock = pygame.time.Clock()
         while True:
             # Calculate slide animation progress
             current_time = time.time()
@@ -7054,7 +9440,7 @@ class Game:
 
                 # Update display
                 pygame.display.flip()
-                clock.tick(60)
+                frame_scheduler.tick(60)
 
                 # Handle events during animation
                 for event in pygame.event.get():
@@ -7136,7 +9522,7 @@ class Game:
 
                     # Update display
                     pygame.display.flip()
-                    clock.tick(60)
+                    frame_scheduler.tick(60)
 
                 return True
             elif result == "OPTIONS":
@@ -7193,7 +9579,7 @@ class Game:
 
                     # Update display
                     pygame.display.flip()
-                    clock.tick(60)
+                    frame_scheduler.tick(60)
 
                 self.game_over = True
                 return True
@@ -7215,7 +9601,144 @@ class Game:
                 # Update the stored game state after resize
                 game_state_surface = self.screen.copy()
 
-            clock.tick(60)
+            frame_scheduler.tick(60)
+
+    def build_updates_document(
+        self,
+        updates_content,
+        content_width,
+        heading_font,
+        text_font,
+        heading_colors,
+        text_color,
+        text_highlight_color,
+    ):
+        """Lay out and render the updates list once into tiles of the content width"""
+        pad = UPDATES_DOCUMENT_PADDING
+        blocks = []  # (surface, x, y) in document coordinates
+        y_pos = pad
+        content_height = 0
+
+        for section in updates_content:
+            # Get the emoji from the section text to determine color
+            emoji = section["text"].split()[0]
+            heading_color = heading_colors.get(
+                emoji, (135, 206, 250)
+            )  # Default to light sky blue
+
+            # Calculate available width for heading
+            available_width = content_width - 100
+            heading_text_without_emoji = " ".join(section["text"].split()[1:])
+
+            # Truncate heading text if needed
+            test_heading = heading_font.render(
+                heading_text_without_emoji, True, heading_color
+            )
+            if test_heading.get_width() > available_width:
+                # Calculate how many characters we can fit
+                char_ratio = available_width / test_heading.get_width()
+                max_chars = max(
+                    5, int(len(heading_text_without_emoji) * char_ratio) - 3
+                )
+                heading_text_without_emoji = (
+                    heading_text_without_emoji[:max_chars] + "..."
+                )
+
+            # Render final heading with emoji
+            heading_text = heading_font.render(
+                emoji + " " + heading_text_without_emoji, True, heading_color
+            )
+            heading_rect = heading_text.get_rect(x=60, y=y_pos)
+
+            # Heading background, kept inside the content area
+            bg_rect = heading_rect.copy()
+            bg_rect.inflate_ip(30, 15)
+            bg_rect.x -= 15
+            if bg_rect.right > content_width - 20:
+                bg_rect.width = content_width - bg_rect.x - 20
+            heading_bg = pygame.Surface(
+                (bg_rect.width, bg_rect.height), pygame.SRCALPHA
+            )
+            heading_bg.fill((heading_color[0], heading_color[1], heading_color[2], 50))
+            blocks.append((heading_bg, bg_rect.x, bg_rect.y))
+
+            # Heading text with shadow for depth
+            shadow_text = heading_font.render(
+                emoji + " " + heading_text_without_emoji, True, (0, 0, 0, 150)
+            )
+            blocks.append((shadow_text, heading_rect.x + 2, heading_rect.y + 2))
+            blocks.append((heading_text, heading_rect.x, heading_rect.y))
+
+            y_pos += heading_rect.height + 25
+            content_height += heading_rect.height + 25
+
+            for item in section["items"]:
+                # Calculate available width for text (with more padding)
+                text_area_width = content_width - 120
+
+                # Split text into feature name and description
+                feature_name = ""
+                feature_description = ""
+                if "–" in item:
+                    parts = item.split("–", 1)
+                    feature_name = parts[0].strip()
+                    feature_description = parts[1].strip()
+                else:
+                    feature_description = item
+
+                # Render feature name (if exists) in highlight color
+                if feature_name:
+                    feature_name_text = text_font.render(
+                        feature_name, True, text_highlight_color
+                    )
+                    blocks.append((feature_name_text, 80, y_pos))
+                    y_pos += feature_name_text.get_height() + 5
+                    content_height += feature_name_text.get_height() + 5
+
+                # Wrap description text (size() measures without rendering)
+                lines = []
+                current_line = []
+                for word in feature_description.split():
+                    test_line = " ".join(current_line + [word])
+                    if text_font.size(test_line)[0] <= text_area_width:
+                        current_line.append(word)
+                    elif current_line:
+                        lines.append(" ".join(current_line))
+                        current_line = [word]
+                    else:
+                        # Word is too long, force it on its own line
+                        lines.append(word)
+                if current_line:
+                    lines.append(" ".join(current_line))
+
+                for line in lines:
+                    if line.strip():  # Only render non-empty lines
+                        line_text = text_font.render(line, True, text_color)
+                        blocks.append((line_text, 80, y_pos))
+                        y_pos += line_text.get_height() + 8  # Increased line spacing
+                        content_height += line_text.get_height() + 8
+
+                # Add extra space between items
+                y_pos += 15
+                content_height += 15
+
+            # Add extra space between sections
+            y_pos += 40
+            content_height += 40
+
+        # Split the document into tiles so very tall content never needs
+        # one huge surface
+        total_height = y_pos + pad
+        tiles = []
+        for tile_top in range(0, total_height, UPDATES_DOCUMENT_TILE_HEIGHT):
+            tile_height = min(UPDATES_DOCUMENT_TILE_HEIGHT, total_height - tile_top)
+            tile = pygame.Surface((content_width, tile_height), pygame.SRCALPHA)
+            for surface, x, y in blocks:
+                if y + surface.get_height() > tile_top and y < tile_top + tile_height:
+                    tile.blit(surface, (x, y - tile_top))
+            tiles.append(tile)
+
+        return tiles, content_height
 
     def show_updates_menu(self, background_surface):
         """Show the upcoming updates menu"""
@@ -7330,15 +9853,71 @@ class Game:
             },
         ]
 
+        # Fonts are created once per visit instead of every frame
+        title_font = assets.get_sys_font("Arial", title_font_size, bold=True)
+        subtitle_font = assets.get_sys_font(
+            "Arial", int(title_font_size * 0.4), italic=True
+        )
+        heading_font = assets.get_sys_font("Arial", heading_font_size, bold=True)
+        text_font = assets.get_sys_font(
+            "Arial", text_font_size + 2
+        )  # Slightly larger text
+        back_font = assets.get_sys_font("Arial", text_font_size, bold=True)
+
+        # Content area with enhanced decorative border - better proportioned
+        content_area = pygame.Rect(
+            180, 160, screen_width - 360, screen_height - 240
+        )  # More balanced padding
+
+        # The wrapped document only depends on the resolution, so it is laid out
+        # once and kept as pre-rendered tiles; scrolling just blits a slice
+        if not hasattr(self, "updates_document_cache"):
+            self.updates_document_cache = {}
+        document_key = (screen_width, screen_height)
+        if document_key not in self.updates_document_cache:
+            self.updates_document_cache[document_key] = self.build_updates_document(
+                updates_content,
+                content_area.width,
+                heading_font,
+                text_font,
+                heading_colors,
+                text_color,
+                text_highlight_color,
+            )
+        document_tiles, content_height = self.updates_document_cache[document_key]
+
+        # Pre-render the back button in both hover states
+        back_button_surfaces = {}
+        for hover, back_color in (
+            (False, back_button_color),
+            (True, back_button_hover_color),
+        ):
+            button_surface = pygame.Surface(
+                (back_button_rect.width, back_button_rect.height), pygame.SRCALPHA
+            )
+            for i in range(back_button_rect.height):
+                # Create gradient effect
+                factor = i / back_button_rect.height
+                r = min(int(back_color[0] * (1 + factor * 0.3)), 255)
+                g = min(int(back_color[1] * (1 + factor * 0.3)), 255)
+                b = min(int(back_color[2] * (1 + factor * 0.3)), 255)
+                pygame.draw.line(
+                    button_surface, (r, g, b), (0, i), (back_button_rect.width, i)
+                )
+            back_button_surfaces[hover] = button_surface
+
+        # Reused every frame for the animated gradient overlay
+        overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+
         # Scrolling
         if not hasattr(self, "updates_menu_scroll_y"):
             self.updates_menu_scroll_y = 0
-        scroll_y = self.updates_menu_scroll_y
-        max_scroll = 0  # Will be calculated when drawing
+        # Calculate max scroll to ensure all content is accessible
+        max_scroll = min(0, content_area.height - content_height - 100)
+        scroll_y = max(max_scroll, min(0, self.updates_menu_scroll_y))
         scroll_speed = 15  # Reduced scroll speed for smoother scrolling
 
         # Main updates menu loop
-        clock = pygame.time.Clock()
         running = True
 
         # Animation variables
@@ -7353,7 +9932,6 @@ class Game:
                 self.screen.blit(background_surface, (0, 0))
 
                 # Create a gradient overlay for more attractive background
-                overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
                 for i in range(10):
                     y_pos = i * (screen_height // 10)
                     height = screen_height // 10
@@ -7372,8 +9950,6 @@ class Game:
                 # Decorative elements removed as requested
 
                 # Draw title with enhanced glow and animation effects
-                title_font = pygame.font.SysFont("Arial", title_font_size, bold=True)
-
                 # Create a background banner for the title
                 banner_height = 100
                 banner_rect = pygame.Rect(0, 30, screen_width, banner_height)
@@ -7465,9 +10041,6 @@ class Game:
                 self.screen.blit(title_text, title_rect)
 
                 # Add subtitle with increased vertical spacing
-                subtitle_font = pygame.font.SysFont(
-                    "Arial", int(title_font_size * 0.4), italic=True
-                )
                 subtitle_text = subtitle_font.render(
                     "Exciting new features coming soon!", True, (200, 200, 255)
                 )
@@ -7476,24 +10049,6 @@ class Game:
                 )  # Increased Y position from 110 to 130
                 self.screen.blit(subtitle_text, subtitle_rect)
 
-                # Draw content with scrolling
-                heading_font = pygame.font.SysFont(
-                    "Arial", heading_font_size, bold=True
-                )
-                text_font = pygame.font.SysFont(
-                    "Arial", text_font_size + 2
-                )  # Slightly larger text
-
-                y_pos = (
-                    180 + scroll_y
-                )  # Increased starting position from 160 to 180 to accommodate subtitle
-                content_height = 0
-
-                # Content area with enhanced decorative border - better proportioned
-                content_area = pygame.Rect(
-                    180, 160, screen_width - 360, screen_height - 240
-                )  # More balanced padding
-
                 # Draw decorative content area background with animated border
                 border_color = (100, 150, 200, 100)
 
@@ -7612,188 +10167,22 @@ class Game:
                             border_width,
                         )
 
-                for section in updates_content:
-                    # Get the emoji from the section text to determine color
-                    emoji = section["text"].split()[0]
-                    heading_color = heading_colors.get(
-                        emoji, (135, 206, 250)
-                    )  # Default to light sky blue
-
-                    # Draw section heading with enhanced background - SIMPLIFIED VERSION
-                    # Calculate available width for heading
-                    available_width = content_area.width - 100
-
-                    # Get the emoji from the section text
-                    emoji = section["text"].split()[0]
-                    heading_text_without_emoji = " ".join(section["text"].split()[1:])
-
-                    # Truncate heading text if needed
-                    test_heading = heading_font.render(
-                        heading_text_without_emoji, True, heading_color
-                    )
-                    if test_heading.get_width() > available_width:
-                        # Calculate how many characters we can fit
-                        char_ratio = available_width / test_heading.get_width()
-                        max_chars = max(
-                            5, int(len(heading_text_without_emoji) * char_ratio) - 3
-                        )
-                        heading_text_without_emoji = (
-                            heading_text_without_emoji[:max_chars] + "..."
-                        )
-
-                    # Render final heading with emoji
-                    heading_text = heading_font.render(
-                        emoji + " " + heading_text_without_emoji, True, heading_color
-                    )
-                    heading_rect = heading_text.get_rect(x=content_area.x + 60, y=y_pos)
-
-                    # Only draw if at least partially in view vertically
-                    # More lenient check - draw if any part of the heading is in the content area vertically
+                # Draw the visible slice of the pre-rendered document.
+                # Content starts at y=180 to accommodate the subtitle.
+                document_y = 180 + scroll_y - UPDATES_DOCUMENT_PADDING
+                for tile_index, tile in enumerate(document_tiles):
+                    tile_y = document_y + tile_index * UPDATES_DOCUMENT_TILE_HEIGHT
                     if (
-                        y_pos + heading_rect.height > content_area.top - 10
-                        and y_pos < content_area.bottom + 10
+                        tile_y + tile.get_height() > clip_rect.top
+                        and tile_y < clip_rect.bottom
                     ):
-                        # Draw heading background
-                        bg_rect = heading_rect.copy()
-                        bg_rect.inflate_ip(30, 15)
-                        bg_rect.x -= 15
-
-                        # Make sure background stays within content area
-                        if bg_rect.right > content_area.right - 20:
-                            bg_rect.width = content_area.right - bg_rect.x - 20
-
-                        # Create simple background for heading
-                        heading_bg = pygame.Surface(
-                            (bg_rect.width, bg_rect.height), pygame.SRCALPHA
-                        )
-                        heading_bg.fill(
-                            (heading_color[0], heading_color[1], heading_color[2], 50)
-                        )
-
-                        # Draw heading background
-                        self.screen.blit(heading_bg, bg_rect)
-
-                        # Draw heading text with shadow for depth
-                        shadow_text = heading_font.render(
-                            emoji + " " + heading_text_without_emoji,
-                            True,
-                            (0, 0, 0, 150),
-                        )
-                        shadow_rect = shadow_text.get_rect(
-                            x=heading_rect.x + 2, y=heading_rect.y + 2
-                        )
-                        self.screen.blit(shadow_text, shadow_rect)
-
-                        # Draw main heading text
-                        self.screen.blit(heading_text, heading_rect)
-
-                    y_pos += (
-                        heading_rect.height + 25
-                    )  # Increased spacing after headings from 20 to 25
-                    content_height += heading_rect.height + 25
-
-                    # Draw section items with IMPROVED text wrapping and visibility
-                    for item_index, item in enumerate(section["items"]):
-                        # Calculate available width for text (with more padding)
-                        text_area_width = content_area.width - 120  # More padding for better readability
-                        
-                        # Split text into feature name and description
-                        feature_name = ""
-                        feature_description = ""
-                        if "–" in item:
-                            parts = item.split("–", 1)
-                            feature_name = parts[0].strip()
-                            feature_description = parts[1].strip()
-                        else:
-                            feature_description = item
-                        
-                        # Render feature name (if exists) in highlight color
-                        if feature_name:
-                            feature_name_text = text_font.render(feature_name, True, text_highlight_color)
-                            feature_name_rect = feature_name_text.get_rect(x=content_area.x + 80, y=y_pos)
-                            
-                            # Check if visible and draw
-                            if (y_pos + feature_name_rect.height > content_area.top - 20 
-                                and y_pos < content_area.bottom + 20):
-                                self.screen.blit(feature_name_text, feature_name_rect)
-                            
-                            y_pos += feature_name_rect.height + 5
-                            content_height += feature_name_rect.height + 5
-                        
-                        # Wrap description text
-                        words = feature_description.split()
-                        lines = []
-                        current_line = []
-                        
-                        for word in words:
-                            test_line = " ".join(current_line + [word])
-                            test_surface = text_font.render(test_line, True, text_color)
-                            
-                            if test_surface.get_width() <= text_area_width:
-                                current_line.append(word)
-                            else:
-                                if current_line:
-                                    lines.append(" ".join(current_line))
-                                    current_line = [word]
-                                else:
-                                    # Word is too long, force it on its own line
-                                    lines.append(word)
-                        
-                        if current_line:
-                            lines.append(" ".join(current_line))
-                        
-                        # Render each line
-                        for line_index, line in enumerate(lines):
-                            if line.strip():  # Only render non-empty lines
-                                line_text = text_font.render(line, True, text_color)
-                                line_rect = line_text.get_rect(x=content_area.x + 80, y=y_pos)
-                                
-                                # Check if visible and draw
-                                if (y_pos + line_rect.height > content_area.top - 20 
-                                    and y_pos < content_area.bottom + 20):
-                                    self.screen.blit(line_text, line_rect)
-                                
-                                y_pos += line_rect.height + 8  # Increased line spacing
-                                content_height += line_rect.height + 8
-                        
-                        # Add extra space between items
-                        y_pos += 15
-                        content_height += 15
-
-                    # Add extra space between sections
-                    y_pos += 40
-                    content_height += 40
-
-                # Calculate max scroll to ensure all content is accessible
-                max_scroll = min(0, content_area.height - content_height - 100)
+                        self.screen.blit(tile, (content_area.x, tile_y))
 
                 # Restore original clipping region before drawing back button and scrollbar
                 self.screen.set_clip(original_clip)
 
                 # Draw back button with enhanced styling
-                back_color = (
-                    back_button_hover_color if back_button_hover else back_button_color
-                )
-
-                # Draw button with gradient and glow
-                button_surface = pygame.Surface(
-                    (back_button_rect.width, back_button_rect.height), pygame.SRCALPHA
-                )
-                for i in range(back_button_rect.height):
-                    # Create gradient effect
-                    factor = i / back_button_rect.height
-                    r = int(back_color[0] * (1 + factor * 0.3))
-                    g = int(back_color[1] * (1 + factor * 0.3))
-                    b = int(back_color[2] * (1 + factor * 0.3))
-                    if r > 255:
-                        r = 255
-                    if g > 255:
-                        g = 255
-                    if b > 255:
-                        b = 255
-                    pygame.draw.line(
-                        button_surface, (r, g, b), (0, i), (back_button_rect.width, i)
-                    )
+                button_surface = back_button_surfaces[back_button_hover]
 
                 # Add button to screen with rounded corners
                 button_rect = button_surface.get_rect(topleft=back_button_rect.topleft)
@@ -7812,7 +10201,6 @@ class Game:
                 )
 
                 # Draw button text with slight shadow for depth
-                back_font = pygame.font.SysFont("Arial", text_font_size, bold=True)
                 shadow_text = back_font.render("Back", True, (0, 0, 0))
                 shadow_rect = shadow_text.get_rect(
                     center=(
@@ -7968,7 +10356,7 @@ class Game:
                     elif event.type == pygame.MOUSEMOTION:
                         back_button_hover = back_button_rect.collidepoint(event.pos)
 
-                clock.tick(60)
+                frame_scheduler.tick(60)
             except Exception as e:
                 print(f"Error in updates menu: {e}")
                 traceback.print_exc()
@@ -8004,7 +10392,6 @@ class Game:
         settings_menu.current_values["FULLSCREEN"] = 1 if is_fullscreen else 0
 
         # Main settings menu loop
-        clock = pygame.time.Clock()
         while True:
             try:
                 # Restore the background
@@ -8052,10 +10439,8 @@ class Game:
                     # Recreate the background surface for the new resolution
                     try:
                         # Try to load the background image
-                        background_image = pygame.image.load("assets/images/bgm.jpg")
-                        # Scale the image to fit the new screen size
-                        background_image = pygame.transform.scale(
-                            background_image, (SCREEN_WIDTH, SCREEN_HEIGHT)
+                        background_image = assets.load_image(
+                            BACKGROUND_IMAGE, (SCREEN_WIDTH, SCREEN_HEIGHT)
                         )
 
                         # Create a new background surface
@@ -8078,7 +10463,7 @@ class Game:
                         LANE_WIDTH * i + LANE_WIDTH // 2 for i in range(6)
                     ]
 
-                clock.tick(30)
+                frame_scheduler.tick(30)
             except Exception as e:
                 print(f"Error in settings menu: {e}")
                 traceback.print_exc()
@@ -8432,63 +10817,50 @@ class Game:
                 )
 
     def add_road_detail(self):
-        """Add a random road detail"""
-        if not hasattr(self, "road_details"):
-            self.road_details = []
-
-        # Limit the number of details for performance
-        if len(self.road_details) >= 10:
+        """Paint a random crack or patch into the road decals above the screen"""
+        if not hasattr(self, "road_decals"):
             return
 
         # Choose a random lane
-        lane = random.randint(0, 7)  # Updated for 8 lanes
+        lane = rng.cosmetic.randint(0, 7)  # Updated for 8 lanes
         lane_x = lane * LANE_WIDTH
 
         # Choose a random detail type
-        detail_type = random.choice(["crack", "patch"])
+        detail_type = rng.cosmetic.choice(["crack", "patch"])
 
         if detail_type == "crack":
-            # Create a zigzag crack
-            points = []
-            x_offset = random.randint(-LANE_WIDTH // 3, LANE_WIDTH // 3)
-            y_start = -50  # Start above screen
-
-            # Create zigzag points
-            segments = random.randint(3, 7)
-            segment_length = random.randint(10, 30)
+            # Create a zigzag crack that ends just above the screen
+            x_offset = lane_x + rng.cosmetic.randint(-LANE_WIDTH // 3, LANE_WIDTH // 3)
+            segments = rng.cosmetic.randint(3, 7)
+            segment_length = rng.cosmetic.randint(10, 30)
+            y_start = -segments * segment_length
 
+            points = []
             for i in range(segments):
-                x_deviation = random.randint(-10, 10)
+                x_deviation = rng.cosmetic.randint(-10, 10)
                 points.append((x_offset + x_deviation, y_start + i * segment_length))
+            width = rng.cosmetic.randint(1, 3)
 
-            # Add the detail
-            self.road_details.append(
-                {
-                    "type": "crack",
-                    "x_offset": lane_x,
-                    "y": y_start,
-                    "points": points,
-                    "width": random.randint(1, 3),
-                    "color": (80, 80, 80),
-                }
-            )
+            def draw(surface, y_offset):
+                pygame.draw.lines(
+                    surface,
+                    (80, 80, 80),
+                    False,
+                    [(x, y + y_offset) for x, y in points],
+                    width,
+                )
+
+            self.road_decals.stamp(draw, y_start, 0)
         else:  # patch
             # Create a road patch
-            width = random.randint(LANE_WIDTH // 4, LANE_WIDTH // 2)
-            height = random.randint(20, 50)
-            x = lane_x - width // 2 + random.randint(-LANE_WIDTH // 4, LANE_WIDTH // 4)
+            width = rng.cosmetic.randint(LANE_WIDTH // 4, LANE_WIDTH // 2)
+            height = rng.cosmetic.randint(20, 50)
+            x = lane_x - width // 2 + rng.cosmetic.randint(-LANE_WIDTH // 4, LANE_WIDTH // 4)
 
-            # Add the detail
-            self.road_details.append(
-                {
-                    "type": "patch",
-                    "x": x,
-                    "y": -height,
-                    "width": width,
-                    "height": height,
-                    "color": (70, 70, 70),
-                }
-            )
+            def draw(surface, y_offset):
+                pygame.draw.rect(surface, (70, 70, 70), (x, -height + y_offset, width, height))
+
+            self.road_decals.stamp(draw, -height, 0)
 
     def draw_speed_lines(self):
         """Draw speed lines for enhanced motion feel during high speed"""
@@ -8616,30 +10988,17 @@ class Game:
             # Draw the road background
             self.draw_road()
 
-            # Draw magnets with culling
-            for magnet in self.magnets:
-                if magnet.y > -50 and magnet.y < SCREEN_HEIGHT + 50:
-                    magnet.draw(self.screen)
-
-            # Draw boosts with culling
-            for boost in self.boosts:
-                if boost.y > -50 and boost.y < SCREEN_HEIGHT + 50:
-                    boost.draw(self.screen)
+            # Draw tire marks and road details painted onto the road
+            if hasattr(self, "road_decals"):
+                self.road_decals.draw(self.screen)
 
-            # Draw slow-mo with culling
-            for slowmo in self.slowmos:
-                if slowmo.y > -50 and slowmo.y < SCREEN_HEIGHT + 50:
-                    slowmo.draw(self.screen)
-
-            # Draw shields with culling
-            for shield in self.shields:
-                if shield.y > -50 and shield.y < SCREEN_HEIGHT + 50:
-                    shield.draw(self.screen)
-
-            # Draw coins with culling (only draw visible ones)
-            for coin in self.coins:
-                if coin.y > -50 and coin.y < SCREEN_HEIGHT + 50:  # Simple culling
-                    coin.draw(self.screen)
+            # Draw pickups under the player with culling
+            for kind, spec in ENTITY_KINDS.items():
+                if spec.get("hazard"):
+                    continue
+                for entity in self.entities.of(kind):
+                    if entity.y > -50 and entity.y < SCREEN_HEIGHT + 50:
+                        entity.draw(self.screen)
 
             # Draw power-ups removed
             # for powerup in self.powerups:
@@ -8648,17 +11007,15 @@ class Game:
 
             # Draw player car (only if not in crash animation or at the beginning of it)
             if not hasattr(self, "crash_animation_timer") or (
-                time.time() - self.crash_animation_timer < 0.3
+                self.sim_time - self.crash_animation_timer < 0.3
             ):
                 self.player_car.draw(self.screen)
 
-            # Draw obstacles with culling
-            for obstacle in self.obstacles:
-                obstacle.draw(self.screen)
-
-            # Draw other cars
-            for car in self.other_cars:
-                car.draw(self.screen)
+            # Draw obstacles and other cars over the player
+            for kind, spec in ENTITY_KINDS.items():
+                if spec.get("hazard"):
+                    for entity in self.entities.of(kind):
+                        entity.draw(self.screen)
 
             # Draw particles
             self.particle_system.draw(self.screen)
@@ -8666,7 +11023,7 @@ class Game:
             # If in crash animation, add special effects
             if hasattr(self, "crash_animation_timer"):
                 # Calculate how far into the animation we are
-                elapsed = time.time() - self.crash_animation_timer
+                elapsed = self.sim_time - self.crash_animation_timer
                 progress = elapsed / 2.0  # 2.0 seconds total (changed from 1.5)
 
                 # Add dramatic slow-motion effect
@@ -9057,21 +11414,417 @@ class Game:
             if hasattr(self, "transition") and self.transition.running:
                 self.transition.draw()
 
+            # Draw the performance overlay on top of everything (toggled with F3)
+            if getattr(self, "show_debug_overlay", False):
+                self.draw_debug_overlay()
+
             pygame.display.flip()
         except Exception as e:
             print(f"Error in draw method: {e}")
             traceback.print_exc()
 
-    def update(self):
+    def draw_debug_overlay(self):
+        """Draw frame timing, quality tier and cache statistics"""
+        particle_count, particle_limit, shed, dropped = (
+            (
+                len(self.particle_system),
+                self.particle_system.particle_limit(),
+                sum(self.particle_system.shed_counts),
+                sum(self.particle_system.dropped_counts),
+            )
+            if hasattr(self, "particle_system")
+            else (0, 0, 0, 0)
+        )
+        asset_stats = assets.stats()
+        pool_stats = self.entity_pool.stats()["all"]
+        frame_stats = frame_scheduler.percentiles()
+        lines = [
+            f"FPS: {getattr(self, 'actual_fps', 0.0):.1f} ({frame_scheduler.mode})",
+            f"Frame p50/p95/p99: {frame_stats['p50']:.1f} / {frame_stats['p95']:.1f}"
+            f" / {frame_stats['p99']:.1f} ms",
+            f"Work: {quality_governor.average_frame_time * 1000:.2f} ms"
+            f" / {quality_governor.frame_budget * 1000:.1f} ms",
+            f"Quality: {current_quality['name']} ({quality_governor.mode})",
+            f"Particles: {particle_count}/{particle_limit}"
+            f" (shed {shed}, dropped {dropped})",
+            f"Assets: {asset_stats['hits']} hits, {asset_stats['misses']} misses",
+            f"Entity pool: {pool_stats['hits']} reused, {pool_stats['misses']} allocated,"
+            f" peak {pool_stats['high_water']}",
+        ]
+
+        debug_font = get_font(14)
+        line_height = debug_font.get_linesize()
+        panel = pygame.Surface((300, line_height * len(lines) + 10), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 160))
+        for i, line in enumerate(lines):
+            panel.blit(debug_font.render(line, True, WHITE), (8, 5 + i * line_height))
+        self.screen.blit(panel, (10, 10))
+
+    def update_entities(self, dt, speed_factor):
+        """Move every entity kind, collide them with the player, then cull"""
+        player = self.player_car
+        # Entity speeds are pixels per 60 FPS frame
+        step = dt * REFERENCE_FPS
+        # AI cars steer around the traffic as it stood at the start of the frame
+        occupancy = self.occupancy.build(
+            {
+                spec["occupancy"]: self.entities.of(kind)
+                for kind, spec in ENTITY_KINDS.items()
+                if "occupancy" in spec
+            }
+        )
+
+        for kind, spec in ENTITY_KINDS.items():
+            entities = self.entities.of(kind)
+            # Newest first, the order AI cars have always drawn their randomness in
+            for entity in reversed(entities):
+                # Moving obstacles sway, AI cars pick lanes
+                if hasattr(entity, "update"):
+                    if spec.get("steers"):
+                        entity.update(dt, player.lane, occupancy)
+                    else:
+                        entity.update(dt)
+
+                speed_modifier = (
+                    spec["brake_speed"]
+                    if getattr(entity, "is_braking", False)
+                    else spec["speed"]
+                )
+                entity.move(self.speed * speed_factor * speed_modifier * step)
+
+            # Coins in magnet range move towards the player together
+            if spec.get("magnetic") and player.has_magnet:
+                magnet_pull(entities, player.x, player.y, step)
+
+        # Narrow phase only for what's near the player once everything has
+        # moved. Collisions are swept over the step, so the query reaches as
+        # far as anything can have travelled, and runs before culling so an
+        # entity that crossed the car and left the screen in one step still hits
+        travel = (self.speed * speed_factor + MAGNET_MAX_PULL) * step
+        self.lane_index.build(self.entities)
+        for entity in self.lane_index.near(
+            player.x, player.y, player.width, player.height + 2 * travel
+        ):
+            if not swept_collides(entity, player):
+                continue
+            spec = ENTITY_KINDS[self.entities.kind_of(entity)]
+            if spec.get("hazard"):
+                self.hit_hazard(entity, spec)
+            else:
+                self.entities.remove(entity)
+                self.collect_pickup(entity, spec)
+
+        for kind, spec in ENTITY_KINDS.items():
+            entities = self.entities.of(kind)
+            # Walk backwards so swap-remove only moves entities already visited
+            for i in range(len(entities) - 1, -1, -1):
+                entity = entities[i]
+                if entity.is_off_screen():
+                    self.entities.remove(entity)
+                    if spec.get("hazard"):
+                        self.pass_hazard(spec)
+
+    def raise_score_multiplier(self, allow_reset=False):
+        """Set the score multiplier from the current combo"""
+        if self.combo_count >= 10:
+            self.score_multiplier = 3
+        elif self.combo_count >= 5:
+            self.score_multiplier = 2
+        elif allow_reset:
+            self.score_multiplier = 1
+
+    def pass_hazard(self, spec):
+        """Reward the player for a hazard that left the screen"""
+        score = spec["pass_score"]
+        self.score += score * self.score_multiplier if spec["pass_multiplied"] else score
+        # Add to combo for avoiding it
+        self.combo_count += 1
+        self.combo_timer = 2.0
+
+        if spec.get("pass_raises_multiplier"):
+            self.raise_score_multiplier()
+
+        # Show combo prompt if it's a significant combo
+        if (
+            spec.get("combo_prompt")
+            and hasattr(self, "prompt_system")
+            and self.combo_count == 5
+        ):
+            self.prompt_system.show_prompt("combo")
+
+    def hit_hazard(self, entity, spec):
+        """Handle the player running into an obstacle or car"""
+        if self.player_car.has_shield:
+            # Shield protects from collision
+            self.entities.remove(entity)
+            self.score += spec["shield_score"]
+            # Add to combo
+            self.combo_count += 2
+            self.combo_timer = 2.0
+            # Create spark effect for shield collision
+            self.particle_system.create_spark(
+                entity.x, entity.y, count=spec["shield_sparks"], category="crash"
+            )
+            # Play shield sound
+            if sound_enabled and hasattr(self, "sound_shield"):
+                self.sound_shield.play()
+            return
+
+        # Store crash position for animation
+        self.crash_position = (self.player_car.x, self.player_car.y)
+        # Create crash effect
+        self.particle_system.create_crash(self.player_car.x, self.player_car.y)
+        # Play crash sound
+        if sound_enabled and hasattr(self, "sound_crash"):
+            self.sound_crash.play()
+        self.game_over = True
+        self.game_has_been_played = True  # Mark that a game has been played
+        # Start crash animation timer
+        self.crash_animation_timer = self.sim_time
+        # Play game over sound
+        if sound_enabled and hasattr(self, "sound_game_over"):
+            self.sound_game_over.play()
+
+    def collect_pickup(self, entity, spec):
+        """Apply a collected power-up or coin"""
+        entity.collect()
+        if "message" in spec:
+            print(spec["message"])
+
+        # Activate the power-up effect
+        if "effect" in spec:
+            getattr(self.player_car, spec["effect"])()
+
+        if spec.get("counts_as_coin"):
+            self.coins_collected += 1
+
+        # Create spark effect for coin collection
+        if spec.get("sparks"):
+            self.particle_system.create_spark(
+                entity.x, entity.y, count=spec["sparks"], category="coin"
+            )
+
+        # Play coin sound (power-ups reuse it)
+        if sound_enabled and hasattr(self, "sound_coin"):
+            self.sound_coin.play()
+
+        # Add points with combo multiplier
+        self.score += spec["score"] * self.score_multiplier
+
+        # Increase combo
+        self.combo_count += 1
+        self.combo_timer = 2.0  # Reset combo timer
+
+        if spec.get("sets_multiplier"):
+            self.raise_score_multiplier(allow_reset=True)
+
+        if spec.get("boost_energy"):
+            self.player_car.add_boost_energy(spec["boost_energy"])
+
+    def spawn_obstacle(self, kind, spec):
+        """Place an obstacle away from other obstacles and fresh traffic"""
+        # Check if there are too many obstacles already
+        if self.entities.count(kind) >= 2:  # Reduced max obstacles from 3 to 2
+            return False
+        # Choose a lane that doesn't already have an obstacle or car nearby
+        available_lanes = list(range(8))  # Updated for 8 lanes
+
+        # Remove lanes that have obstacles
+        for obstacle in self.entities.of("obstacle"):
+            if obstacle.lane in available_lanes:
+                available_lanes.remove(obstacle.lane)
+                # Also remove adjacent lanes for better spacing
+                if obstacle.lane > 0 and obstacle.lane - 1 in available_lanes:
+                    available_lanes.remove(obstacle.lane - 1)
+                if (
+                    obstacle.lane < 7 and obstacle.lane + 1 in available_lanes
+                ):  # Updated for 8 lanes
+                    available_lanes.remove(obstacle.lane + 1)
+
+        # Remove lanes that have cars near the top
+        for car in self.entities.of("car"):
+            if car.y < 200:  # Only check cars near the top of the screen
+                if car.lane in available_lanes:
+                    available_lanes.remove(car.lane)
+
+        if not available_lanes:
+            return False
+        lane = rng.spawn.choice(available_lanes)
+        # Reduced chance of moving obstacles which are more CPU intensive
+        if rng.spawn.random() < 0.2:  # Reduced from 0.3
+            self.entities.spawn(kind, MovingObstacle, lane)
+        else:
+            self.entities.spawn(kind, Obstacle, lane)
+        return True
+
+    def spawn_car(self, kind, spec):
+        """Place a traffic car away from other cars and fresh obstacles"""
+        # Check if there are too many cars already
+        if self.entities.count(kind) >= 2:  # Reduced max cars from 3 to 2
+            return False
+        # Choose a lane that doesn't already have a car or obstacle nearby
+        available_lanes = list(range(8))  # Updated for 8 lanes
+
+        # Remove lanes that have cars
+        for car in self.entities.of("car"):
+            if car.lane in available_lanes:
+                available_lanes.remove(car.lane)
+                # Also remove adjacent lanes for better spacing
+                if car.lane > 0 and car.lane - 1 in available_lanes:
+                    available_lanes.remove(car.lane - 1)
+                if (
+                    car.lane < 7 and car.lane + 1 in available_lanes
+                ):  # Updated for 8 lanes
+                    available_lanes.remove(car.lane + 1)
+
+        # Remove lanes that have obstacles near the top
+        for obstacle in self.entities.of("obstacle"):
+            if obstacle.y < 200:  # Only check obstacles near the top of the screen
+                if obstacle.lane in available_lanes:
+                    available_lanes.remove(obstacle.lane)
+
+        if not available_lanes:
+            return False
+        lane = rng.spawn.choice(available_lanes)
+        # Reduced chance of AI-controlled cars which are more CPU intensive
+        if rng.spawn.random() < 0.3:  # Reduced from 0.5
+            self.entities.spawn(kind, AIControlledCar, lane)
+        else:
+            self.entities.spawn(kind, OtherCar, lane)
+        return True
+
+    def spawn_powerup(self, kind, spec):
+        """Drop a power-up into a random lane"""
+        lane = rng.spawn.randint(0, 7)  # Random lane (0-7 for 8 lanes)
+        self.entities.spawn(kind, spec["spawn_class"], lane)
+        print(spec["spawn_message"].format(lane=lane))
+        return True
+
+    def spawn_coin(self, kind, spec):
+        """Drop a coin somewhere in a random lane"""
+        # Limit the number of coins on screen
+        if self.entities.count(kind) >= 6:  # Reduced for performance
+            return False
+        lane = rng.spawn.randint(0, 7)  # Updated for 8 lanes
+        x = LANE_POSITIONS[lane] + rng.spawn.randint(-LANE_WIDTH // 4, LANE_WIDTH // 4)
+        self.entities.spawn(kind, Coin, x, -20)
+        return True
+
+    def next_input_mask(self):
+        """Fold queued key presses into this tick's mask; a repeated key waits a tick"""
+        mask = 0
+        queue = self.input_queue
+        while queue and not mask & queue[0]:
+            mask |= queue.popleft()
+        return mask
+
+    def apply_inputs(self, mask):
+        """Log one tick of player input and act on it"""
+        self.input_log.record(mask)
+        if not mask:
+            return
+        if mask & INPUT_LEFT:
+            self.player_car.move_left()
+        if mask & INPUT_RIGHT:
+            self.player_car.move_right()
+        if mask & INPUT_BOOST and self.player_car.use_boost_energy():
+            # Play boost sound
+            if sound_enabled and hasattr(self, "sound_boost"):
+                self.sound_boost.play()
+
+    def save_replay(self, path=None):
+        """Write this run's input log; the mode is only known once a run starts"""
+        if path is None:
+            path = os.path.join(REPLAY_DIR, f"run_{self.run_seed}.rpl")
         try:
-            # Performance optimization: Calculate delta time once
-            current_time = time.time()
-            dt = (
-                min(current_time - self.last_update_time, 1.0 / 30.0)
-                if hasattr(self, "last_update_time")
-                else 1.0 / 60.0
+            self.input_log.game_mode = self.game_mode
+            self.input_log.save(path)
+            print(
+                f"Replay saved to {path}: {self.input_log.ticks} ticks, "
+                f"{os.path.getsize(path)} bytes"
             )
-            self.last_update_time = current_time
+        except Exception as e:
+            print(f"Error saving replay: {e}")
+            traceback.print_exc()
+        return path
+
+    def start_replay(self, log):
+        """Reset into the state a recorded run started from"""
+        if (log.width, log.height) != (SCREEN_WIDTH, SCREEN_HEIGHT):
+            # Lane positions and sizes scale with the screen, so the run will drift
+            print(
+                f"Warning: replay recorded at {log.width}x{log.height}, "
+                f"screen is {SCREEN_WIDTH}x{SCREEN_HEIGHT}"
+            )
+        self.reset_game(log.seed)
+        self.game_mode = log.game_mode
+        return log.masks()
+
+    def play_replay(self, log, speed=1.0):
+        """Watch a recorded run in the window, speed > 1 fast-forwards"""
+        masks = self.start_replay(log)
+        ticks = 0
+        last_frame_time = time.perf_counter()
+        while ticks < log.ticks:
+            now = time.perf_counter()
+            frame_time = now - last_frame_time
+            last_frame_time = now
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (
+                    event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE
+                ):
+                    return False
+
+            self.sim_accumulator += min(frame_time * speed, MAX_SIMULATION_STEPS * speed * SIMULATION_DT)
+            while self.sim_accumulator >= SIMULATION_DT and ticks < log.ticks:
+                self.update(SIMULATION_DT, next(masks))
+                self.sim_accumulator -= SIMULATION_DT
+                ticks += 1
+
+            self.interpolate_positions(min(1.0, self.sim_accumulator / SIMULATION_DT))
+            self.draw()
+            self.restore_positions()
+            frame_scheduler.tick(60)
+        print(
+            f"Replay finished: score {self.score}, "
+            f"{int(self.distance_traveled)} m, {self.coins_collected} coins"
+        )
+        return True
+
+    def capture_previous_state(self):
+        """Remember positions before a step so draw can interpolate"""
+        for entity in self.entities:
+            entity.prev_x = entity.x
+            entity.prev_y = entity.y
+        self.player_car.prev_x = self.player_car.x
+        self.player_car.prev_y = self.player_car.y
+
+    def interpolate_positions(self, alpha):
+        """Move things to where they are alpha of the way through the next step"""
+        self.interpolated = []
+        for entity in chain(self.entities, (self.player_car,)):
+            # Entities spawned during the last step have no previous state yet
+            if not hasattr(entity, "prev_x"):
+                continue
+            self.interpolated.append((entity, entity.x, entity.y))
+            entity.x = entity.prev_x + (entity.x - entity.prev_x) * alpha
+            entity.y = entity.prev_y + (entity.y - entity.prev_y) * alpha
+
+    def restore_positions(self):
+        for entity, x, y in getattr(self, "interpolated", ()):
+            entity.x = x
+            entity.y = y
+        self.interpolated = []
+
+    def update(self, dt=SIMULATION_DT, inputs=None):
+        """Advance the simulation by one fixed step; inputs is a replayed tick's mask"""
+        try:
+            self.sim_time = getattr(self, "sim_time", 0.0) + dt
+            current_time = self.sim_time
+            # Per-frame speeds and chances were tuned at REFERENCE_FPS
+            step = dt * REFERENCE_FPS
+            self.capture_previous_state()
+            self.apply_inputs(self.next_input_mask() if inputs is None else inputs)
 
             # If game is over and we're showing the crash animation
             if self.game_over and hasattr(self, "crash_animation_timer"):
@@ -9085,13 +11838,13 @@ class Game:
                 # Continue showing the crash animation for 2 seconds (changed from 1.5)
                 if elapsed < 2.0:
                     # Create additional particles for dramatic effect (reduced frequency for performance)
-                    if random.random() < 0.2:  # Reduced from 0.3
+                    if rng.particles.random() < 0.2 * step:  # Reduced from 0.3
                         self.particle_system.create_crash(
-                            self.crash_position[0] + random.uniform(-20, 20),
-                            self.crash_position[1] + random.uniform(-20, 20),
+                            self.crash_position[0] + rng.particles.uniform(-20, 20),
+                            self.crash_position[1] + rng.particles.uniform(-20, 20),
                         )
                     # Update particles
-                    self.particle_system.update(0.016)  # ~60fps
+                    self.particle_system.update(dt)
                     return
                 else:
                     # Animation finished, remove the timer and proceed to menu
@@ -9159,7 +11912,7 @@ class Game:
             self.particle_system.update(dt)
 
             # Create boost trail if boosting (simplified)
-            if self.player_car.is_boosting and random.random() < 0.3:
+            if self.player_car.is_boosting and rng.particles.random() < 0.3 * step:
                 self.particle_system.create_boost_trail(
                     self.player_car.x, self.player_car.y + self.player_car.height // 2
                 )
@@ -9174,7 +11927,7 @@ class Game:
             speed_factor = slow_mo_factor * boost_factor
 
             # Increase speed over time (base speed increment, not affected by power-ups)
-            self.speed += SPEED_INCREMENT
+            self.speed += SPEED_INCREMENT * step
 
             # Cap speed at 30 (which will display as 300 km/h)
             if self.speed > 30:
@@ -9189,6 +11942,18 @@ class Game:
             distance_this_frame = self.speed * dt * 10 * distance_multiplier
             self.distance_traveled += distance_this_frame
 
+            # Scroll the road decals and paint details into the rows coming in
+            if hasattr(self, "road_decals"):
+                new_rows = self.road_decals.set_distance(self.distance_traveled)
+                if new_rows and rng.cosmetic.random() < new_rows * ROAD_DETAIL_CHANCE:
+                    self.add_road_detail()
+
+                # Lane changes leave tire marks behind the car for a moment
+                if self.player_car.tire_smoke_cooldown > 0:
+                    self.particle_system.create_tire_tracks(
+                        self.player_car.x, self.player_car.y + self.player_car.height // 2
+                    )
+
             # Add boost energy based on distance traveled (1 energy per 50 meters)
             boost_energy_to_add = distance_this_frame / 50.0
             if boost_energy_to_add > 0:
@@ -9217,402 +11982,18 @@ class Game:
                     self.combo_count = 0
                     self.score_multiplier = 1
 
-            # Generate new obstacles
-            if current_time - self.last_obstacle_time > random.uniform(
-                3.0, 6.0
-            ):  # Further increased spawn interval
-                # Check if there are too many obstacles already
-                if len(self.obstacles) < 2:  # Reduced max obstacles from 3 to 2
-                    # Choose a lane that doesn't already have an obstacle or car nearby
-                    available_lanes = list(range(8))  # Updated for 8 lanes
-
-                    # Remove lanes that have obstacles
-                    for obstacle in self.obstacles:
-                        if obstacle.lane in available_lanes:
-                            available_lanes.remove(obstacle.lane)
-                            # Also remove adjacent lanes for better spacing
-                            if (
-                                obstacle.lane > 0
-                                and obstacle.lane - 1 in available_lanes
-                            ):
-                                available_lanes.remove(obstacle.lane - 1)
-                            if (
-                                obstacle.lane < 7
-                                and obstacle.lane + 1 in available_lanes
-                            ):  # Updated for 8 lanes
-                                available_lanes.remove(obstacle.lane + 1)
-
-                    # Remove lanes that have cars near the top
-                    for car in self.other_cars:
-                        if car.y < 200:  # Only check cars near the top of the screen
-                            if car.lane in available_lanes:
-                                available_lanes.remove(car.lane)
-
-                    # If there are available lanes, create an obstacle
-                    if available_lanes:
-                        lane = random.choice(available_lanes)
-                        # Reduced chance of moving obstacles which are more CPU intensive
-                        if random.random() < 0.2:  # Reduced from 0.3
-                            self.obstacles.append(MovingObstacle(lane))
-                        else:
-                            self.obstacles.append(Obstacle(lane))
-                        self.last_obstacle_time = current_time
-
-            # Generate other cars
-            if current_time - self.last_car_time > random.uniform(
-                4.0, 8.0
-            ):  # Further increased spawn interval
-                # Check if there are too many cars already
-                if len(self.other_cars) < 2:  # Reduced max cars from 3 to 2
-                    # Choose a lane that doesn't already have a car or obstacle nearby
-                    available_lanes = list(range(8))  # Updated for 8 lanes
-
-                    # Remove lanes that have cars
-                    for car in self.other_cars:
-                        if car.lane in available_lanes:
-                            available_lanes.remove(car.lane)
-                            # Also remove adjacent lanes for better spacing
-                            if car.lane > 0 and car.lane - 1 in available_lanes:
-                                available_lanes.remove(car.lane - 1)
-                            if (
-                                car.lane < 7 and car.lane + 1 in available_lanes
-                            ):  # Updated for 8 lanes
-                                available_lanes.remove(car.lane + 1)
-
-                    # Remove lanes that have obstacles near the top
-                    for obstacle in self.obstacles:
-                        if (
-                            obstacle.y < 200
-                        ):  # Only check obstacles near the top of the screen
-                            if obstacle.lane in available_lanes:
-                                available_lanes.remove(obstacle.lane)
-
-                    # If there are available lanes, create a car
-                    if available_lanes:
-                        lane = random.choice(available_lanes)
-                        # Reduced chance of AI-controlled cars which are more CPU intensive
-                        if random.random() < 0.3:  # Reduced from 0.5
-                            self.other_cars.append(AIControlledCar(lane))
-                        else:
-                            self.other_cars.append(OtherCar(lane))
-                        self.last_car_time = current_time
-
-            # Generate new power-ups removed
-            # if current_time - self.last_powerup_time > random.uniform(5.0, 15.0):
-            #     lane = random.randint(0, 7)  # Updated for 8 lanes
-            #     powerup_type = random.choice(["boost", "shield", "magnet", "slow_mo"])
-            #     self.powerups.append(PowerUp(lane, powerup_type))
-            #     self.last_powerup_time = current_time
-
-            # Generate new magnets
-            if current_time - self.last_magnet_time > random.uniform(10.0, 20.0):  # Every 10-20 seconds
-                lane = random.randint(0, 7)  # Random lane (0-7 for 8 lanes)
-                self.magnets.append(Magnet(lane))
-                self.last_magnet_time = current_time
-                print(f"🧲 Magnet spawned in lane {lane}!")
-
-            # Generate new boosts
-            if current_time - self.last_boost_time > random.uniform(8.0, 15.0):  # Every 8-15 seconds
-                lane = random.randint(0, 7)  # Random lane (0-7 for 8 lanes)
-                self.boosts.append(Boost(lane))
-                self.last_boost_time = current_time
-                print(f"⚡ Boost spawned in lane {lane}!")
-
-            # Generate new slow-mo
-            if current_time - self.last_slowmo_time > random.uniform(12.0, 25.0):  # Every 12-25 seconds
-                lane = random.randint(0, 7)  # Random lane (0-7 for 8 lanes)
-                self.slowmos.append(SlowMo(lane))
-                self.last_slowmo_time = current_time
-                print(f"⏱️ Slow-Mo spawned in lane {lane}!")
-
-            # Generate new shields
-            if current_time - self.last_shield_time > random.uniform(15.0, 30.0):  # Every 15-30 seconds
-                lane = random.randint(0, 7)  # Random lane (0-7 for 8 lanes)
-                self.shields.append(Shield(lane))
-                self.last_shield_time = current_time
-                print(f"🛡️ Shield spawned in lane {lane}!")
-
-            # Generate new coins
-            if current_time - self.last_coin_time > random.uniform(
-                1.0, 3.0
-            ):  # Increased interval
-                # Limit the number of coins on screen
-                if (
-                    len(self.coins) < 6
-                ):  # Reduced for performance  # Add a limit to coins
-                    lane = random.randint(0, 7)  # Updated for 8 lanes
-                    x = LANE_POSITIONS[lane] + random.randint(
-                        -LANE_WIDTH // 4, LANE_WIDTH // 4
-                    )
-                    self.coins.append(Coin(x, -20))
-                    self.last_coin_time = current_time
-
-            # Update moving obstacles
-            for obstacle in self.obstacles[:]:
-                if isinstance(obstacle, MovingObstacle):
-                    obstacle.update(dt)
-
-            # Update AI cars
-            for car in self.other_cars[:]:
-                if isinstance(car, AIControlledCar):
-                    car.update(
-                        dt, self.player_car.lane, self.obstacles + self.other_cars
-                    )
-
-            # Move obstacles
-            for obstacle in self.obstacles[:]:
-                obstacle.move(self.speed * speed_factor)
-                if obstacle.is_off_screen():
-                    self.obstacles.remove(obstacle)
-                    self.score += 1
-                    # Add to combo for avoiding obstacle
-                    self.combo_count += 1
-                    self.combo_timer = 2.0
-                    # Update score multiplier
-                    if self.combo_count >= 10:
-                        self.score_multiplier = 3
-                    elif self.combo_count >= 5:
-                        self.score_multiplier = 2
-
-                    # Show combo prompt if it's a significant combo
-                    if hasattr(self, "prompt_system") and self.combo_count == 5:
-                        self.prompt_system.show_prompt("combo")
-                elif obstacle.collides_with(self.player_car):
-                    if self.player_car.has_shield:
-                        # Shield protects from collision
-                        self.obstacles.remove(obstacle)
-                        self.score += 2
-                        # Add to combo
-                        self.combo_count += 2
-                        self.combo_timer = 2.0
-                        # Create spark effect for shield collision
-                        self.particle_system.create_spark(
-                            obstacle.x, obstacle.y, count=15
-                        )
-                        # Play shield sound
-                        if sound_enabled and hasattr(self, "sound_shield"):
-                            self.sound_shield.play()
-                    else:
-                        # Store crash position for animation
-                        self.crash_position = (self.player_car.x, self.player_car.y)
-                        # Create crash effect
-                        self.particle_system.create_crash(
-                            self.player_car.x, self.player_car.y
-                        )
-                        # Play crash sound
-                        if sound_enabled and hasattr(self, "sound_crash"):
-                            self.sound_crash.play()
-                        self.game_over = True
-                        self.game_has_been_played = (
-                            True  # Mark that a game has been played
-                        )
-                        # Start crash animation timer
-                        self.crash_animation_timer = time.time()
-                        # Play game over sound
-                        if sound_enabled and hasattr(self, "sound_game_over"):
-                            self.sound_game_over.play()
-
-            # Move other cars
-            for car in self.other_cars[:]:
-                # Apply braking for AI cars
-                speed_modifier = (
-                    0.5 if isinstance(car, AIControlledCar) and car.is_braking else 0.8
-                )
-                car.move(self.speed * speed_factor * speed_modifier)
-
-                if car.is_off_screen():
-                    self.other_cars.remove(car)
-                    self.score += 2 * self.score_multiplier
-                    # Add to combo
-                    self.combo_count += 1
-                    self.combo_timer = 2.0
-                elif car.collides_with(self.player_car):
-                    if self.player_car.has_shield:
-                        # Shield protects from collision
-                        self.other_cars.remove(car)
-                        self.score += 3
-                        # Add to combo
-                        self.combo_count += 2
-                        self.combo_timer = 2.0
-                        # Create spark effect for shield collision
-                        self.particle_system.create_spark(car.x, car.y, count=20)
-                        # Play shield sound
-                        if sound_enabled and hasattr(self, "sound_shield"):
-                            self.sound_shield.play()
-                    else:
-                        # Store crash position for animation
-                        self.crash_position = (self.player_car.x, self.player_car.y)
-                        # Create crash effect
-                        self.particle_system.create_crash(
-                            self.player_car.x, self.player_car.y
-                        )
-                        # Play crash sound
-                        if sound_enabled and hasattr(self, "sound_crash"):
-                            self.sound_crash.play()
-                        self.game_over = True
-                        self.game_has_been_played = (
-                            True  # Mark that a game has been played
-                        )
-                        # Start crash animation timer
-                        self.crash_animation_timer = time.time()
-                        # Play game over sound
-                        if sound_enabled and hasattr(self, "sound_game_over"):
-                            self.sound_game_over.play()
-
-            # Move and check power-ups removed
-            # (powerup collision and collection logic removed)
-
-            # Move and check magnets
-            for magnet in self.magnets[:]:
-                magnet.move(self.speed * speed_factor)
-                if magnet.is_off_screen():
-                    self.magnets.remove(magnet)
-                elif magnet.collides_with(self.player_car):
-                    magnet.collect()
-                    self.magnets.remove(magnet)
-                    
-                    print("🧲 Magnet collected!")
-                    
-                    # Activate magnet effect
-                    self.player_car.activate_magnet()
-                    
-                    # Add points for collecting magnet
-                    self.score += 10 * self.score_multiplier
-                    
-                    # Add to combo
-                    self.combo_count += 1
-                    self.combo_timer = 2.0
-                    
-                    # Play coin sound (reuse existing sound)
-                    if sound_enabled and hasattr(self, "sound_coin"):
-                        self.sound_coin.play()
-
-            # Move and check boosts
-            for boost in self.boosts[:]:
-                boost.move(self.speed * speed_factor)
-                if boost.is_off_screen():
-                    self.boosts.remove(boost)
-                elif boost.collides_with(self.player_car):
-                    boost.collect()
-                    self.boosts.remove(boost)
-                    
-                    print("⚡ Boost collected!")
-                    
-                    # Activate boost effect
-                    self.player_car.activate_boost()
-                    
-                    # Add points for collecting boost
-                    self.score += 15 * self.score_multiplier
-                    
-                    # Add to combo
-                    self.combo_count += 1
-                    self.combo_timer = 2.0
-                    
-                    # Play coin sound (reuse existing sound)
-                    if sound_enabled and hasattr(self, "sound_coin"):
-                        self.sound_coin.play()
-
-            # Move and check slow-mo
-            for slowmo in self.slowmos[:]:
-                slowmo.move(self.speed * speed_factor)
-                if slowmo.is_off_screen():
-                    self.slowmos.remove(slowmo)
-                elif slowmo.collides_with(self.player_car):
-                    slowmo.collect()
-                    self.slowmos.remove(slowmo)
-                    
-                    print("⏱️ Slow-Mo collected!")
-                    
-                    # Activate slow-mo effect
-                    self.player_car.activate_slow_mo()
-                    
-                    # Add points for collecting slow-mo
-                    self.score += 20 * self.score_multiplier
-                    
-                    # Add to combo
-                    self.combo_count += 1
-                    self.combo_timer = 2.0
-                    
-                    # Play coin sound (reuse existing sound)
-                    if sound_enabled and hasattr(self, "sound_coin"):
-                        self.sound_coin.play()
-
-            # Move and check shields
-            for shield in self.shields[:]:
-                shield.move(self.speed * speed_factor)
-                if shield.is_off_screen():
-                    self.shields.remove(shield)
-                elif shield.collides_with(self.player_car):
-                    shield.collect()
-                    self.shields.remove(shield)
-                    
-                    print("🛡️ Shield collected!")
-                    
-                    # Activate shield effect
-                    self.player_car.activate_shield()
-                    
-                    # Add points for collecting shield
-                    self.score += 25 * self.score_multiplier
-                    
-                    # Add to combo
-                    self.combo_count += 1
-                    self.combo_timer = 2.0
-                    
-                    # Play coin sound (reuse existing sound)
-                    if sound_enabled and hasattr(self, "sound_coin"):
-                        self.sound_coin.play()
-
-            # Move and check coins
-            for coin in self.coins[:]:
-                coin.move(self.speed * speed_factor)
-
-                # Check if coin is in magnet range
-                if self.player_car.has_magnet:
-                    dx = self.player_car.x - coin.x
-                    dy = self.player_car.y - coin.y
-                    distance = math.sqrt(dx * dx + dy * dy)
-
-                    if distance < MAGNET_RANGE:
-                        # Move coin towards player with magnet attraction
-                        angle = math.atan2(dy, dx)
-                        magnet_speed = min(distance * 0.1, 8)  # Magnet pull speed
-                        coin.x += math.cos(angle) * magnet_speed
-                        coin.y += math.sin(angle) * magnet_speed
-
-                if coin.is_off_screen():
-                    self.coins.remove(coin)
-                elif coin.collides_with(self.player_car):
-                    coin.collect()
-                    self.coins.remove(coin)
-                    self.coins_collected += 1
-
-                    # Create spark effect for coin collection
-                    self.particle_system.create_spark(coin.x, coin.y, count=5)
-
-                    # Play coin sound
-                    if sound_enabled and hasattr(self, "sound_coin"):
-                        self.sound_coin.play()
-
-                    # Add points for collecting coin with combo multiplier
-                    self.score += COIN_VALUE * self.score_multiplier
-
-                    # Increase combo
-                    self.combo_count += 1
-                    self.combo_timer = 2.0  # Reset combo timer
-
-                    # Update score multiplier
-                    if self.combo_count >= 10:
-                        self.score_multiplier = 3
-                    elif self.combo_count >= 5:
-                        self.score_multiplier = 2
-                    else:
-                        self.score_multiplier = 1
-
-                    # Add boost energy from coin collection
-                    self.player_car.add_boost_energy(3)
+            # Spawn whatever has come due
+            for kind in self.spawner.advance(dt * slow_mo_factor):
+                spec = ENTITY_KINDS[kind]
+                spawned = False
+                try:
+                    spawned = getattr(self, spec["spawner"])(kind, spec)
+                finally:
+                    # A spawner that found no room (or raised) tries again shortly
+                    self.spawner.schedule(kind, None if spawned else SPAWN_RETRY_DELAY)
 
-                    # Show boost energy prompt removed
-                    # (boost energy logic removed)
+            # Move, cull and collide everything on the road
+            self.update_entities(dt, speed_factor)
 
             # Check if mission is complete and show prompt
             if (
@@ -9738,10 +12119,10 @@ class Game:
 
         # Main menu loop
         running = True
-        clock = pygame.time.Clock()
 
         # Track the last selected option to detect changes
         last_selected = -1
+        preview_warmup_started = False
 
         while running:
             # Update menu music (check if track finished and play next)
@@ -9750,8 +12131,9 @@ class Game:
             # Get mouse position
             mouse_pos = pygame.mouse.get_pos()
 
-            # Update sparkles
-            dt = clock.tick(60) / 1000.0  # Convert milliseconds to seconds
+            # The only tick per frame: paces the menu and gives the sparkles
+            # the real frame time
+            dt = frame_scheduler.tick(60) / 1000.0  # Convert milliseconds to seconds
             self.update_sparkles(dt)
 
             # Handle events
@@ -9903,8 +12285,8 @@ class Game:
                     background_image.get_width() != current_width
                     or background_image.get_height() != current_height
                 ):
-                    background_image = pygame.transform.scale(
-                        background_image, (current_width, current_height)
+                    background_image, has_background_image = load_background_image(
+                        current_width, current_height
                     )
                     print(
                         f"Background image rescaled to {current_width}x{current_height}"
@@ -9925,11 +12307,8 @@ class Game:
                 # Add the enhanced glowing moon AFTER the overlay so it's more visible
                 self.draw_moon(self.screen, current_width, current_height)
 
-                # Add animated clouds drifting across the sky
-                self.draw_animated_clouds(self.screen, current_width, current_height)
-
-                # Add animated sea waves at the bottom
-                self.draw_animated_waves(self.screen, current_width, current_height)
+                # Add animated clouds drifting across the sky and sea waves at the bottom
+                self.draw_ambient_layer(self.screen, current_width, current_height)
 
                 # Draw sparkles animation
                 self.update_sparkles(
@@ -9940,11 +12319,8 @@ class Game:
                 # Use the gradient background
                 self.screen.blit(background, (0, 0))
 
-                # Add animated clouds to gradient background too
-                self.draw_animated_clouds(self.screen, SCREEN_WIDTH, SCREEN_HEIGHT)
-
-                # Add animated sea waves to gradient background too
-                self.draw_animated_waves(self.screen, SCREEN_WIDTH, SCREEN_HEIGHT)
+                # Add animated clouds and sea waves to gradient background too
+                self.draw_ambient_layer(self.screen, SCREEN_WIDTH, SCREEN_HEIGHT)
 
             # Calculate title animation (must be inside the loop for continuous animation)
             title_y_offset = (
@@ -10306,7 +12682,12 @@ class Game:
             self.screen.blit(cli_text, cli_rect)
 
             pygame.display.flip()
-            clock.tick(60)
+
+            # Once the menu is on screen, build the garage previews in the
+            # background so the garage and items menus open instantly
+            if not preview_warmup_started:
+                warm_preview_cache(self.screen.get_width(), self.screen.get_height())
+                preview_warmup_started = True
 
         return False
 
@@ -10362,85 +12743,15 @@ class Game:
         info_font = get_font(24)
 
         # Available items with their stats and descriptions
-        items = [
-            {
-                "name": "BOOST",
-                "color": BOOST_COLOR,
-                "symbol": "⚡",
-                "description": "Increases your speed for a short time.",
-                "effect": "Speed x1.5 for 5 seconds",
-            },
-            {
-                "name": "SHIELD",
-                "color": SHIELD_COLOR,
-                "symbol": "🛡️",
-                "description": "Protects your car from crashes.",
-                "effect": "Immunity for 7 seconds",
-            },
-            {
-                "name": "MAGNET",
-                "color": MAGNET_COLOR,
-                "symbol": "🧲",
-                "description": "Attracts coins to your car.",
-                "effect": "150px attraction radius for 5 seconds",
-            },
-            {
-                "name": "SLOW-MO",
-                "color": SLOW_MO_COLOR,
-                "symbol": "⏱️",
-                "description": "Slows down time for better control.",
-                "effect": "50% slower gameplay for 5 seconds",
-            },
-            {
-                "name": "COIN",
-                "color": COIN_COLOR,
-                "symbol": "💰",
-                "description": "Collect to increase your score.",
-                "effect": "+10 points per coin",
-            },
-        ]
+        items = MENU_ITEMS
 
         # Current item index
         current_item = 0
 
-        # Create item images
-        item_images = []
-        for item in items:
-            # Create a surface for the item
-            item_width = 80
-            item_height = 80
-            img = pygame.Surface((item_width, item_height), pygame.SRCALPHA)
-
-            # Draw the item with glow effect
-            for offset in range(3, 0, -1):
-                glow_color = (*item["color"], 100 - offset * 30)
-                pygame.draw.circle(
-                    img,
-                    glow_color,
-                    (item_width // 2, item_height // 2),
-                    item_width // 2 - offset * 2,
-                )
-
-            # Draw main item
-            pygame.draw.circle(
-                img,
-                item["color"],
-                (item_width // 2, item_height // 2),
-                item_width // 2 - 6,
-            )
-
-            # Draw symbol
-            symbol_font = get_font(30, bold=True)
-            symbol_text = symbol_font.render(item["symbol"], True, WHITE)
-            symbol_rect = symbol_text.get_rect(
-                center=(item_width // 2, item_height // 2)
-            )
-            img.blit(symbol_text, symbol_rect)
-
-            item_images.append(img)
+        # Item images come from the shared preview cache
+        item_images = [get_item_icon(i) for i in range(len(items))]
 
         # Main items menu loop
-        clock = pygame.time.Clock()
         running = True
 
         # Create button rectangles
@@ -10601,7 +12912,7 @@ class Game:
 
             # Update display
             pygame.display.flip()
-            clock.tick(60)
+            frame_scheduler.tick(60)
 
     def show_garage_menu(self, background_surface):
         """Show the garage menu for car selection and customization with transition animation"""
@@ -10629,48 +12940,7 @@ class Game:
         info_font = get_font(24, bold=True)  # Now bold
 
         # Available cars with their stats - same car design, different colors
-        cars = [
-            {
-                "name": "RED RACER",
-                "speed": 8,
-                "acceleration": 9,
-                "handling": 7,
-                "color": (255, 0, 0),  # Red
-                "description": "Fast and agile sports car with excellent acceleration.",
-            },
-            {
-                "name": "BLUE BOLT",
-                "speed": 9,
-                "acceleration": 7,
-                "handling": 6,
-                "color": (0, 0, 255),  # Blue
-                "description": "Powerful sports car with high top speed.",
-            },
-            {
-                "name": "GREEN MACHINE",
-                "speed": 6,
-                "acceleration": 6,
-                "handling": 9,
-                "color": (0, 255, 0),  # Green
-                "description": "Nimble sports car with excellent handling.",
-            },
-            {
-                "name": "YELLOW FLASH",
-                "speed": 7,
-                "acceleration": 8,
-                "handling": 7,
-                "color": (255, 255, 0),  # Yellow
-                "description": "Well-balanced sports car with good all-around stats.",
-            },
-            {
-                "name": "PURPLE PHANTOM",
-                "speed": 8,
-                "acceleration": 8,
-                "handling": 8,
-                "color": (128, 0, 128),  # Purple
-                "description": "Premium sports car with balanced performance.",
-            },
-        ]
+        cars = GARAGE_CARS
 
         # Current car index - use selected_car if available
         if hasattr(self, "selected_car") and self.selected_car is not None:
@@ -10678,311 +12948,16 @@ class Game:
         else:
             current_car = 0
 
-        # Create a background for the car display area
-        car_display_bg = pygame.Surface(
-            (screen_width * 0.6, screen_height * 0.4), pygame.SRCALPHA
-        )
-        car_display_bg.fill((30, 30, 50, 180))  # Semi-transparent dark blue background
-
-        # Draw a grid pattern on the background
-        grid_spacing = 20
-        for x in range(0, int(screen_width * 0.6), grid_spacing):
-            pygame.draw.line(
-                car_display_bg, (50, 50, 70, 100), (x, 0), (x, screen_height * 0.4), 1
-            )
-        for y in range(0, int(screen_height * 0.4), grid_spacing):
-            pygame.draw.line(
-                car_display_bg, (50, 50, 70, 100), (0, y), (screen_width * 0.6, y), 1
-            )
-
-        # Create car images - using a completely different approach for better visibility
-        car_images = []
-        for car in cars:
-            # Create a larger surface for the car
-            car_width = int(screen_width * 0.4)  # 40% of screen width
-            car_height = int(car_width * 0.5)  # Maintain aspect ratio
-            img = pygame.Surface((car_width, car_height), pygame.SRCALPHA)
-
-            # Draw the car body
-            car_body_width = car_width * 0.8
-            car_body_height = car_height * 0.5
-            car_body_x = (car_width - car_body_width) / 2
-            car_body_y = car_height * 0.3
-
-            # Car shadow (for depth)
-            shadow_offset = car_height * 0.05
-            shadow_surface = pygame.Surface(
-                (car_body_width, car_body_height), pygame.SRCALPHA
-            )
-            shadow_surface.fill((0, 0, 0, 100))
-            img.blit(
-                shadow_surface, (car_body_x + shadow_offset, car_body_y + shadow_offset)
-            )
-
-            # Main car body (bottom part)
-            pygame.draw.rect(
-                img,
-                car["color"],
-                [car_body_x, car_body_y, car_body_width, car_body_height],
-                0,
-                int(car_width * 0.05),  # Rounded corners
-            )
-
-            # Add metallic effect with gradient
-            highlight_color = (
-                min(car["color"][0] + 60, 255),
-                min(car["color"][1] + 60, 255),
-                min(car["color"][2] + 60, 255),
-            )
-
-            # Top part of car (hood, roof, trunk)
-            top_height = car_height * 0.2
-            top_y = car_body_y - top_height
-
-            # Hood
-            hood_width = car_body_width * 0.8
-            hood_x = car_body_x + (car_body_width - hood_width) / 2
-            pygame.draw.rect(
-                img,
-                highlight_color,
-                [hood_x, top_y, hood_width, top_height],
-                0,
-                int(car_width * 0.03),  # Rounded corners
-            )
-
-            # Windshield (angled)
-            windshield_points = [
-                (hood_x + hood_width * 0.1, top_y + top_height),  # Bottom left
-                (hood_x + hood_width * 0.3, top_y),  # Top left
-                (hood_x + hood_width * 0.7, top_y),  # Top right
-                (hood_x + hood_width * 0.9, top_y + top_height),  # Bottom right
-            ]
-            pygame.draw.polygon(
-                img, (100, 200, 255), windshield_points  # Blue windshield
-            )
-
-            # Windows (side)
-            window_height = car_body_height * 0.3
-            window_y = car_body_y + car_body_height * 0.1
-
-            # Left window
-            pygame.draw.rect(
-                img,
-                (150, 230, 255),  # Light blue window
-                [car_body_x, window_y, car_body_width * 0.15, window_height],
-                0,
-                int(car_width * 0.01),  # Rounded corners
-            )
-
-            # Right window
-            pygame.draw.rect(
-                img,
-                (150, 230, 255),  # Light blue window
-                [
-                    car_body_x + car_body_width * 0.85,
-                    window_y,
-                    car_body_width * 0.15,
-                    window_height,
-                ],
-                0,
-                int(car_width * 0.01),  # Rounded corners
-            )
-
-            # Wheels - larger and more detailed
-            wheel_radius = car_height * 0.15
-            wheel_y = car_body_y + car_body_height - wheel_radius * 0.7
-
-            wheel_positions = [
-                # Front wheel
-                car_body_x + car_body_width * 0.2,
-                # Rear wheel
-                car_body_x + car_body_width * 0.8,
-            ]
-
-            # Draw wheels with rims
-            for wheel_x in wheel_positions:
-                # Tire
-                pygame.draw.circle(
-                    img, BLACK, (int(wheel_x), int(wheel_y)), int(wheel_radius)
-                )
-
-                # Rim
-                pygame.draw.circle(
-                    img,
-                    SLEEK_SILVER,
-                    (int(wheel_x), int(wheel_y)),
-                    int(wheel_radius * 0.6),
-                )
-
-                # Hub
-                pygame.draw.circle(
-                    img,
-                    (100, 100, 100),
-                    (int(wheel_x), int(wheel_y)),
-                    int(wheel_radius * 0.2),
-                )
-
-                # Spokes
-                for angle in range(0, 360, 45):
-                    spoke_x = (
-                        wheel_x + math.cos(math.radians(angle)) * wheel_radius * 0.5
-                    )
-                    spoke_y = (
-                        wheel_y + math.sin(math.radians(angle)) * wheel_radius * 0.5
-                    )
-                    pygame.draw.line(
-                        img,
-                        SLEEK_SILVER,
-                        (int(wheel_x), int(wheel_y)),
-                        (int(spoke_x), int(spoke_y)),
-                        int(wheel_radius * 0.1),
-                    )
-
-            # Headlights with glow effect
-            headlight_radius = car_height * 0.08
-            headlight_y = car_body_y + car_body_height * 0.2
-
-            headlight_positions = [
-                # Left headlight
-                car_body_x + car_body_width * 0.1,
-                # Right headlight
-                car_body_x + car_body_width * 0.9,
-            ]
-
-            for headlight_x in headlight_positions:
-                # Headlight glow
-                for offset in range(3, 0, -1):
-                    glow_radius = headlight_radius + offset * 2
-                    glow_alpha = 150 - offset * 40
-                    glow_surface = pygame.Surface(
-                        (glow_radius * 2, glow_radius * 2), pygame.SRCALPHA
-                    )
-                    pygame.draw.circle(
-                        glow_surface,
-                        (255, 255, 150, glow_alpha),
-                        (glow_radius, glow_radius),
-                        glow_radius,
-                    )
-                    img.blit(
-                        glow_surface,
-                        (
-                            int(headlight_x - glow_radius),
-                            int(headlight_y - glow_radius),
-                        ),
-                    )
-
-                # Headlight
-                pygame.draw.circle(
-                    img,
-                    NEON_YELLOW,
-                    (int(headlight_x), int(headlight_y)),
-                    int(headlight_radius),
-                )
-
-            # Taillights
-            taillight_radius = car_height * 0.06
-            taillight_y = car_body_y + car_body_height * 0.2
-
-            taillight_positions = [
-                # Left taillight
-                car_body_x + car_body_width * 0.05,
-                # Right taillight
-                car_body_x + car_body_width * 0.95,
-            ]
-
-            for taillight_x in taillight_positions:
-                # Taillight glow
-                for offset in range(2, 0, -1):
-                    glow_radius = taillight_radius + offset * 2
-                    glow_alpha = 100 - offset * 30
-                    glow_surface = pygame.Surface(
-                        (glow_radius * 2, glow_radius * 2), pygame.SRCALPHA
-                    )
-                    pygame.draw.circle(
-                        glow_surface,
-                        (255, 50, 50, glow_alpha),
-                        (glow_radius, glow_radius),
-                        glow_radius,
-                    )
-                    img.blit(
-                        glow_surface,
-                        (
-                            int(taillight_x - glow_radius),
-                            int(taillight_y + car_body_height * 0.6 - glow_radius),
-                        ),
-                    )
-
-                # Taillight
-                pygame.draw.circle(
-                    img,
-                    BRIGHT_RED,
-                    (int(taillight_x), int(taillight_y + car_body_height * 0.6)),
-                    int(taillight_radius),
-                )
-
-            # Add details - door lines
-            door_y = car_body_y + car_body_height * 0.4
-            pygame.draw.line(
-                img,
-                (car["color"][0] * 0.7, car["color"][1] * 0.7, car["color"][2] * 0.7),
-                (int(car_body_x + car_body_width * 0.4), int(door_y)),
-                (
-                    int(car_body_x + car_body_width * 0.4),
-                    int(door_y + car_body_height * 0.4),
-                ),
-                2,
-            )
-
-            # Add details - door handles
-            handle_width = car_body_width * 0.05
-            handle_height = car_body_height * 0.03
-            handle_y = car_body_y + car_body_height * 0.35
-
-            # Left door handle
-            pygame.draw.rect(
-                img,
-                SLEEK_SILVER,
-                [
-                    car_body_x + car_body_width * 0.25,
-                    handle_y,
-                    handle_width,
-                    handle_height,
-                ],
-                0,
-                int(handle_height * 0.5),  # Rounded corners
-            )
-
-            # Right door handle
-            pygame.draw.rect(
-                img,
-                SLEEK_SILVER,
-                [
-                    car_body_x + car_body_width * 0.65,
-                    handle_y,
-                    handle_width,
-                    handle_height,
-                ],
-                0,
-                int(handle_height * 0.5),  # Rounded corners
-            )
-
-            # Add car name on the side
-            name_font = get_font(int(car_height * 0.1))
-            name_text = name_font.render(
-                car["name"].split()[0], True, (255, 255, 255, 150)
-            )
-            name_rect = name_text.get_rect(
-                center=(
-                    car_body_x + car_body_width * 0.5,
-                    car_body_y + car_body_height * 0.7,
-                )
-            )
-            img.blit(name_text, name_rect)
+        # Background for the car display area (cached per resolution)
+        car_display_bg = get_garage_display_bg(screen_width, screen_height)
 
-            car_images.append(img)
+        # Car images come from the shared preview cache, which is usually
+        # already warm because the main menu builds it in the background
+        car_images = [
+            get_car_preview(i, screen_width, screen_height) for i in range(len(cars))
+        ]
 
         # Main garage menu loop
-        clock = pygame.time.Clock()
         running = True
 
         # Create button rectangles
@@ -11255,7 +13230,7 @@ class Game:
 
             # Update display
             pygame.display.flip()
-            clock.tick(60)
+            frame_scheduler.tick(60)
 
     def show_game_mode_menu(self):
         """Show the game mode selection menu with transition animation"""
@@ -11274,7 +13249,7 @@ class Game:
             and not self.menu_music_playing
         ):
             try:
-                # Load menu music
+                # Load menu music, outside the asset cache
                 menu_music = pygame.mixer.Sound(self.SOUND_MENU_MUSIC)
                 menu_music.set_volume(0.4)  # Set appropriate volume
                 self.menu_music_channel.play(menu_music, loops=-1)  # Loop indefinitely
@@ -11285,9 +13260,8 @@ class Game:
 
         # Try to load the background image
         try:
-            background_image = pygame.image.load("assets/images/bgm.jpg")
-            background_image = pygame.transform.scale(
-                background_image, (SCREEN_WIDTH, SCREEN_HEIGHT)
+            background_image = assets.load_image(
+                BACKGROUND_IMAGE, (SCREEN_WIDTH, SCREEN_HEIGHT)
             )
 
             has_background_image = True
@@ -11344,14 +13318,14 @@ class Game:
 
         # Main game mode menu loop
         running = True
-        clock = pygame.time.Clock()
 
         while running:
             # Get mouse position
             mouse_pos = pygame.mouse.get_pos()
 
-            # Update sparkles
-            dt = clock.tick(60) / 1000.0  # Convert milliseconds to seconds
+            # The only tick per frame: paces the menu and gives the sparkles
+            # the real frame time
+            dt = frame_scheduler.tick(60) / 1000.0  # Convert milliseconds to seconds
             self.update_sparkles(dt)
 
             # Handle events
@@ -11548,7 +13522,6 @@ class Game:
             self.screen.blit(cli_text, cli_rect)
 
             pygame.display.flip()
-            clock.tick(60)
 
         return False
 
@@ -11556,7 +13529,6 @@ class Game:
         try:
             # Optimize FPS for better performance vs quality balance
             target_fps = 60  # Smooth gameplay
-            clock = pygame.time.Clock()
 
             running = True
             in_menu = True  # Start in menu first
@@ -11574,20 +13546,19 @@ class Game:
             while running:
                 # Calculate delta time for frame-rate independent animations
                 current_time = time.time()
-                dt = min(
-                    current_time - last_frame_time, 1.0 / 30.0
-                )  # Cap dt to prevent large jumps
+                frame_time = current_time - last_frame_time
+                dt = min(frame_time, 1.0 / 30.0)  # Cap dt to prevent large jumps
                 last_frame_time = current_time
 
-                # Performance monitoring (optional)
+                # Work time is measured without the clock sleep so the quality
+                # governor sees how close the frame came to its budget
+                frame_start = time.perf_counter()
+                gameplay_frame = not in_menu
+
+                # Performance monitoring for the debug overlay
                 frame_count += 1
                 if current_time - fps_update_time >= 1.0:
-                    actual_fps = frame_count / (current_time - fps_update_time)
-                    if (
-                        actual_fps < target_fps * 0.8
-                    ):  # If FPS drops below 80% of target
-                        # Could implement dynamic quality reduction here
-                        pass
+                    self.actual_fps = frame_count / (current_time - fps_update_time)
                     frame_count = 0
                     fps_update_time = current_time
 
@@ -11668,9 +13639,17 @@ class Game:
                     # Update screen flash effect
                     self.update_screen_flash(dt)
 
-                    # Update and draw the game
-                    self.update()
+                    # Step the simulation at a fixed rate however fast we render;
+                    # after a long stall the backlog is dropped rather than replayed
+                    self.sim_accumulator += min(frame_time, MAX_SIMULATION_STEPS * SIMULATION_DT)
+                    while self.sim_accumulator >= SIMULATION_DT:
+                        self.update(SIMULATION_DT)
+                        self.sim_accumulator -= SIMULATION_DT
+
+                    # Draw between the last two simulation states
+                    self.interpolate_positions(self.sim_accumulator / SIMULATION_DT)
                     self.draw()
+                    self.restore_positions()
                     
                     # Draw screen flash effect on top of everything
                     self.draw_screen_flash()
@@ -11713,7 +13692,7 @@ class Game:
                             and not self.menu_music_playing
                         ):
                             try:
-                                # Load menu music
+                                # Load menu music, outside the asset cache
                                 menu_music = pygame.mixer.Sound(self.SOUND_MENU_MUSIC)
                                 menu_music.set_volume(0.4)  # Set appropriate volume
                                 self.menu_music_channel.play(
@@ -11724,6 +13703,9 @@ class Game:
                             except Exception as e:
                                 print(f"Error playing menu music: {e}")
 
+                        if self.record_path:
+                            self.save_replay(self.record_path)
+
                         # Game over, return to menu
                         in_menu = True
                         print("Game over, returning to menu")
@@ -11731,8 +13713,15 @@ class Game:
                         # Stop background music when returning to menu
                         self.stop_background_music()
 
+                # Let the governor adjust quality tiers from gameplay frames only,
+                # menus block inside their own loops
+                if gameplay_frame and not in_menu:
+                    quality_governor.record_frame(
+                        time.perf_counter() - frame_start, dt
+                    )
+
                 # Maintain consistent frame rate - use target_fps variable
-                self.clock.tick(target_fps)  # Fixed at 30 FPS for better performance
+                frame_scheduler.tick(target_fps)
         except Exception as e:
             print(f"Error in game loop: {e}")
             traceback.print_exc()
@@ -11758,10 +13747,176 @@ class Game:
             sys.exit()
 
 
+def run_headless(
+    seconds=60.0,
+    render_every=0,
+    report_every=10.0,
+    seed=None,
+    replay=None,
+    record=None,
+    hz=SIMULATION_HZ,
+):
+    """Step the simulation as fast as the CPU allows and report steps per second.
+    With a replay the recorded run is the workload, played once to its end.
+    hz below SIMULATION_HZ tries out the low-rate tick; logs are always at
+    SIMULATION_HZ, so it can't be combined with record or replay."""
+    if hz != SIMULATION_HZ and (replay is not None or record):
+        raise ValueError(f"replays are recorded at {SIMULATION_HZ} Hz")
+    dt = 1.0 / hz
+    game = Game()
+    if replay is not None:
+        masks = replay.masks()
+        game.start_replay(replay)
+        total_steps = replay.ticks
+    else:
+        masks = None
+        game.reset_game(seed)
+        total_steps = int(seconds * hz)
+    first_seed = game.run_seed
+
+    report_steps = max(1, int(report_every * hz))
+    runs = 1
+    crashes = 0
+    render_time = 0.0
+    start = time.perf_counter()
+
+    for step in range(1, total_steps + 1):
+        game.update(dt, None if masks is None else next(masks))
+
+        # Restart once the crash animation has played so soak runs keep going
+        if (
+            masks is None
+            and game.game_over
+            and not hasattr(game, "crash_animation_timer")
+        ):
+            crashes += 1
+            if record:
+                game.save_replay(record)
+            runs += 1
+            # Later runs follow on from the first seed so the whole soak replays
+            game.reset_game(first_seed + runs - 1)
+
+        if render_every and step % render_every == 0:
+            render_start = time.perf_counter()
+            game.draw()
+            render_time += time.perf_counter() - render_start
+
+        if step % report_steps == 0:
+            pygame.event.pump()
+            elapsed = time.perf_counter() - start
+            print(
+                f"[headless] {step / hz:.0f} s simulated, "
+                f"{step / elapsed:.0f} steps/s, score {game.score}, "
+                f"{len(game.entities)} entities, {len(game.particle_system)} particles"
+            )
+
+    elapsed = time.perf_counter() - start
+    # The run still going when time ran out is the latest one, so it wins
+    if record and game.input_log.ticks:
+        game.save_replay(record)
+    stats = {
+        "steps": total_steps,
+        "seconds": elapsed,
+        "steps_per_second": total_steps / elapsed if elapsed > 0 else 0.0,
+        "realtime_factor": total_steps / hz / elapsed if elapsed > 0 else 0.0,
+        "render_seconds": render_time,
+        "runs": runs,
+        "crashes": crashes,
+        "seed": first_seed,
+        "final_score": game.score,
+        "final_distance": game.distance_traveled,
+        "entity_pool": game.entity_pool.stats(),
+    }
+    print(
+        f"[headless] {total_steps} steps in {elapsed:.2f} s: "
+        f"{stats['steps_per_second']:.0f} steps/s "
+        f"({stats['realtime_factor']:.1f}x real time), "
+        f"{runs} runs, {crashes} crashes, seed {first_seed}"
+        + (f", {hz:g} Hz" if hz != SIMULATION_HZ else "")
+        + (f", {render_time:.2f} s rendering" if render_every else "")
+    )
+    return stats
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Car Racing Game")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="run the simulation without a window or audio and report steps per second",
+    )
+    parser.add_argument(
+        "--seconds", type=float, default=60.0, help="game time to simulate when headless"
+    )
+    parser.add_argument(
+        "--render-every",
+        type=int,
+        default=0,
+        metavar="N",
+        help="when headless, also draw every N steps (0 never draws)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="run seed for reproducible headless runs"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="save each run's input log to PATH when it ends, the latest run wins; "
+        "headless runs also save the run still going when --seconds is up",
+    )
+    parser.add_argument(
+        "--replay", metavar="PATH", help="play back a recorded input log"
+    )
+    parser.add_argument(
+        "--sim-hz",
+        type=float,
+        default=SIMULATION_HZ,
+        metavar="HZ",
+        help="when headless, step the simulation at this rate instead",
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="replay speed in the window, 2 plays twice as fast",
+    )
+    args = parser.parse_args()
+    if args.sim_hz != SIMULATION_HZ and (args.record or args.replay):
+        parser.error(f"--record and --replay only work at {SIMULATION_HZ} Hz")
+
+    replay = None
+    if args.replay:
+        try:
+            replay = InputLog.load(args.replay)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Could not load replay {args.replay}: {e}")
+            sys.exit(1)
+
+    if HEADLESS:
+        try:
+            run_headless(
+                args.seconds,
+                args.render_every,
+                seed=args.seed,
+                replay=replay,
+                record=args.record,
+                hz=args.sim_hz,
+            )
+        except Exception as e:
+            print(f"Fatal error: {e}")
+            traceback.print_exc()
+            sys.exit(1)
+        finally:
+            pygame.quit()
+        sys.exit(0)
+
     try:
         print("Starting game...")
         game = Game()
+        game.record_path = args.record
+        if replay is not None:
+            game.play_replay(replay, args.speed)
+            sys.exit(0)
         # Make sure we start with the menu, not the game
         game.game_over = True  # This ensures we go to the menu first
         game.run()
@@ -11965,421 +14120,6 @@ if __name__ == "__main__":
                     )
 
 
-# Add the update method with prompt system integration
-def update(self):
-    try:
-        # Still update player car even when game is over so power-ups can expire
-        if self.game_over:
-            # Calculate delta time for power-up updates
-            current_time = time.time()
-            dt = current_time - self.last_update_time
-            self.last_update_time = current_time
-
-            # Update player car so power-ups can expire properly
-            self.player_car.update(dt)
-            return
-
-        # Calculate delta time
-        current_time = time.time()
-        dt = current_time - self.last_update_time
-        self.last_update_time = current_time
-
-        # Handle welcome prompt timer
-        if hasattr(self, "welcome_prompt_timer"):
-            self.welcome_prompt_timer -= dt
-            if self.welcome_prompt_timer <= 0:
-                self.prompt_system.show_prompt("welcome")
-                delattr(self, "welcome_prompt_timer")
-
-        # Update prompt system
-        if hasattr(self, "prompt_system"):
-            self.prompt_system.update()
-
-        # Update day/night cycle
-        self.update_day_night_cycle(dt)
-
-        # Update player car
-        self.player_car.update(dt)
-
-        # Update particle system
-        self.particle_system.update(dt)
-
-        # Create boost trail if boosting
-        if self.player_car.is_boosting:
-            boost_x = self.player_car.x
-            boost_y = self.player_car.y + self.player_car.height // 2
-
-            # Create boost trail more frequently for a more continuous effect
-            if random.random() < 0.3:  # Reduced for performance
-                self.particle_system.create_boost_trail(boost_x, boost_y)
-
-            # Add occasional sparks for a more dynamic effect
-            if random.random() < 0.3:
-                self.particle_system.create_spark(
-                    boost_x + random.uniform(-10, 10),
-                    boost_y + random.uniform(-5, 5),
-                    count=5,
-                    intensity=0.8,
-                )
-
-        # Apply slow motion if active
-        slow_mo_factor = SLOW_MO_FACTOR if self.player_car.has_slow_mo else 1.0
-
-        # Increase speed over time (base speed increment, not affected by power-ups)
-        self.speed += SPEED_INCREMENT
-
-        # Cap speed at 15 (which will display as 150 km/h)
-        if self.speed > 15:
-            self.speed = 15
-
-        # Update distance traveled (boost affects distance covered)
-        distance_multiplier = self.player_car.current_boost_factor
-        distance_this_frame = self.speed * dt * 10 * distance_multiplier
-        self.distance_traveled += distance_this_frame
-
-        # Add boost energy based on distance traveled (1 energy per 50 meters)
-        boost_energy_to_add = distance_this_frame / 50.0
-        if boost_energy_to_add > 0:
-            self.player_car.add_boost_energy(boost_energy_to_add)
-
-        # Update time remaining for time attack mode
-        if self.game_mode == GAME_MODE_TIME_ATTACK:
-            self.time_remaining -= dt
-            if self.time_remaining <= 0:
-                self.game_over = True
-                self.game_has_been_played = True  # Mark that a game has been played
-                # Play game over sound
-                if sound_enabled:
-                    sound_game_over.play()
-
-        # Update mission progress
-        self.update_mission_progress()
-
-        # Update combo timer
-        if self.combo_timer > 0:
-            self.combo_timer -= dt
-            if self.combo_timer <= 0:
-                self.combo_count = 0
-                self.score_multiplier = 1
-
-        # Generate new obstacles
-        if current_time - self.last_obstacle_time > random.uniform(
-            3.0, 6.0
-        ):  # Further increased spawn interval
-            # Check if there are too many obstacles already
-            if len(self.obstacles) < 2:  # Reduced max obstacles from 3 to 2
-                # Choose a lane that doesn't already have an obstacle or car nearby
-                available_lanes = list(range(6))
-
-                # Remove lanes that have obstacles
-                for obstacle in self.obstacles:
-                    if obstacle.lane in available_lanes:
-                        available_lanes.remove(obstacle.lane)
-                        # Also remove adjacent lanes for better spacing
-                        if obstacle.lane > 0 and obstacle.lane - 1 in available_lanes:
-                            available_lanes.remove(obstacle.lane - 1)
-                        if obstacle.lane < 5 and obstacle.lane + 1 in available_lanes:
-                            available_lanes.remove(obstacle.lane + 1)
-
-                # Remove lanes that have cars near the top
-                for car in self.other_cars:
-                    if car.y < 200:  # Only check cars near the top of the screen
-                        if car.lane in available_lanes:
-                            available_lanes.remove(car.lane)
-
-                # If there are available lanes, create an obstacle
-                if available_lanes:
-                    lane = random.choice(available_lanes)
-                    # Reduced chance of moving obstacles which are more CPU intensive
-                    if random.random() < 0.2:  # Reduced from 0.3
-                        self.obstacles.append(MovingObstacle(lane))
-                    else:
-                        self.obstacles.append(Obstacle(lane))
-                    self.last_obstacle_time = current_time
-
-        # Generate other cars
-        if current_time - self.last_car_time > random.uniform(
-            4.0, 8.0
-        ):  # Further increased spawn interval
-            # Check if there are too many cars already
-            if len(self.other_cars) < 2:  # Reduced max cars from 3 to 2
-                # Choose a lane that doesn't already have a car or obstacle nearby
-                available_lanes = list(range(6))
-
-                # Remove lanes that have cars
-                for car in self.other_cars:
-                    if car.lane in available_lanes:
-                        available_lanes.remove(car.lane)
-                        # Also remove adjacent lanes for better spacing
-                        if car.lane > 0 and car.lane - 1 in available_lanes:
-                            available_lanes.remove(car.lane - 1)
-                        if car.lane < 5 and car.lane + 1 in available_lanes:
-                            available_lanes.remove(car.lane + 1)
-
-                # Remove lanes that have obstacles near the top
-                for obstacle in self.obstacles:
-                    if (
-                        obstacle.y < 200
-                    ):  # Only check obstacles near the top of the screen
-                        if obstacle.lane in available_lanes:
-                            available_lanes.remove(obstacle.lane)
-
-                # If there are available lanes, create a car
-                if available_lanes:
-                    lane = random.choice(available_lanes)
-                    # Reduced chance of AI-controlled cars which are more CPU intensive
-                    if random.random() < 0.3:  # Reduced from 0.5
-                        self.other_cars.append(AIControlledCar(lane))
-                    else:
-                        self.other_cars.append(OtherCar(lane))
-                    self.last_car_time = current_time
-
-        # Generate new power-ups
-        if current_time - self.last_powerup_time > random.uniform(5.0, 15.0):
-            lane = random.randint(0, 5)  # Changed from 0-3 to 0-5 for 6 lanes
-            powerup_type = random.choice(["boost", "shield", "magnet", "slow_mo"])
-            self.powerups.append(PowerUp(lane, powerup_type))
-            self.last_powerup_time = current_time
-
-        # Generate new coins
-        if current_time - self.last_coin_time > random.uniform(
-            1.0, 3.0
-        ):  # Increased interval
-            # Limit the number of coins on screen
-            if len(self.coins) < 6:  # Reduced for performance  # Add a limit to coins
-                lane = random.randint(0, 5)  # Changed from 0-3 to 0-5 for 6 lanes
-                x = LANE_POSITIONS[lane] + random.randint(
-                    -LANE_WIDTH // 4, LANE_WIDTH // 4
-                )
-                self.coins.append(Coin(x, -20))
-                self.last_coin_time = current_time
-
-        # Update moving obstacles
-        for obstacle in self.obstacles[:]:
-            if isinstance(obstacle, MovingObstacle):
-                obstacle.update(dt)
-
-        # Update AI cars
-        for car in self.other_cars[:]:
-            if isinstance(car, AIControlledCar):
-                car.update(dt, self.player_car.lane, self.obstacles + self.other_cars)
-
-        # Move obstacles
-        for obstacle in self.obstacles[:]:
-            obstacle.move(self.speed * slow_mo_factor)
-            if obstacle.is_off_screen():
-                self.obstacles.remove(obstacle)
-                self.score += 1
-                # Add to combo for avoiding obstacle
-                self.combo_count += 1
-                self.combo_timer = 2.0
-                # Update score multiplier
-                if self.combo_count >= 10:
-                    self.score_multiplier = 3
-                elif self.combo_count >= 5:
-                    self.score_multiplier = 2
-
-                # Show combo prompt if it's a significant combo
-                if hasattr(self, "prompt_system") and self.combo_count == 5:
-                    self.prompt_system.show_prompt("combo")
-            elif obstacle.collides_with(self.player_car):
-                if self.player_car.has_shield:
-                    # Shield protects from collision
-                    self.obstacles.remove(obstacle)
-                    self.score += 2
-                    # Add to combo
-                    self.combo_count += 2
-                    self.combo_timer = 2.0
-                    # Create spark effect for shield collision
-                    self.particle_system.create_spark(obstacle.x, obstacle.y, count=15)
-                    # Play shield sound
-                    if sound_enabled:
-                        sound_shield.play()
-                else:
-                    # Create crash effect
-                    self.particle_system.create_crash(
-                        self.player_car.x, self.player_car.y
-                    )
-                    # Play crash sound
-                    if sound_enabled:
-                        sound_crash.play()
-                    self.game_over = True
-                    self.game_has_been_played = True  # Mark that a game has been played
-                    # Play game over sound
-                    if sound_enabled:
-                        sound_game_over.play()
-
-        # Move other cars
-        for car in self.other_cars[:]:
-            # Apply braking for AI cars
-            speed_modifier = (
-                0.5 if isinstance(car, AIControlledCar) and car.is_braking else 0.8
-            )
-            car.move(self.speed * slow_mo_factor * speed_modifier)
-
-            if car.is_off_screen():
-                self.other_cars.remove(car)
-                self.score += 2 * self.score_multiplier
-                # Add to combo
-                self.combo_count += 1
-                self.combo_timer = 2.0
-            elif car.collides_with(self.player_car):
-                if self.player_car.has_shield:
-                    # Shield protects from collision
-                    self.other_cars.remove(car)
-                    self.score += 3
-                    # Add to combo
-                    self.combo_count += 2
-                    self.combo_timer = 2.0
-                    # Create spark effect for shield collision
-                    self.particle_system.create_spark(car.x, car.y, count=20)
-                    # Play shield sound
-                    if sound_enabled:
-                        sound_shield.play()
-                else:
-                    # Create crash effect
-                    self.particle_system.create_crash(
-                        self.player_car.x, self.player_car.y
-                    )
-                    # Play crash sound
-                    if sound_enabled:
-                        sound_crash.play()
-                    self.game_over = True
-                    self.game_has_been_played = True  # Mark that a game has been played
-                    # Play game over sound
-                    if sound_enabled:
-                        sound_game_over.play()
-
-        # Move and check power-ups
-        for powerup in self.powerups[:]:
-            powerup.move(self.speed * slow_mo_factor)
-            if powerup.is_off_screen():
-                self.powerups.remove(powerup)
-            elif powerup.collides_with(self.player_car):
-                powerup.collect()
-                self.powerups.remove(powerup)
-
-                # Apply power-up effect
-                if powerup.type == "boost":
-                    self.player_car.activate_boost()
-                    # Create spark effect for boost activation
-                    self.particle_system.create_spark(
-                        self.player_car.x,
-                        self.player_car.y + self.player_car.height // 2,
-                        count=15,
-                    )
-                    # Play boost sound
-                    if sound_enabled:
-                        sound_boost.play()
-                    # Show boost prompt
-                    if hasattr(self, "prompt_system"):
-                        self.prompt_system.show_prompt("powerup_boost")
-                elif powerup.type == "shield":
-                    self.player_car.activate_shield()
-                    # Play shield sound
-                    if sound_enabled:
-                        sound_shield.play()
-                    # Show shield prompt
-                    if hasattr(self, "prompt_system"):
-                        self.prompt_system.show_prompt("powerup_shield")
-                elif powerup.type == "magnet":
-                    self.player_car.activate_magnet()
-                    # Play powerup sound
-                    if sound_enabled:
-                        sound_powerup.play()
-                    # Show magnet prompt
-                    if hasattr(self, "prompt_system"):
-                        self.prompt_system.show_prompt("powerup_magnet")
-                elif powerup.type == "slow_mo":
-                    self.player_car.activate_slow_mo()
-                    # Play powerup sound
-                    if sound_enabled:
-                        sound_powerup.play()
-                    # Show slow-mo prompt
-                    if hasattr(self, "prompt_system"):
-                        self.prompt_system.show_prompt("powerup_slow_mo")
-
-                # Add points for collecting power-up
-                self.score += 5 * self.score_multiplier
-                # Add to combo
-                self.combo_count += 1
-                self.combo_timer = 2.0
-                # Track power-ups used for missions
-                self.powerups_used += 1
-
-        # Move and check coins
-        for coin in self.coins[:]:
-            coin.move(self.speed * slow_mo_factor)
-
-            # Check if coin is in magnet range
-            if self.player_car.has_magnet:
-                dx = self.player_car.x - coin.x
-                dy = self.player_car.y - coin.y
-                distance = math.sqrt(dx * dx + dy * dy)
-
-                if distance < MAGNET_RANGE:
-                    # Move coin towards player with stronger attraction
-                    angle = math.atan2(dy, dx)
-                    magnet_speed = min(distance * 0.1, 8)  # Stronger magnet pull
-                    coin.x += math.cos(angle) * magnet_speed
-                    coin.y += math.sin(angle) * magnet_speed
-
-            if coin.is_off_screen():
-                self.coins.remove(coin)
-            elif coin.collides_with(self.player_car):
-                coin.collect()
-                self.coins.remove(coin)
-                self.coins_collected += 1
-
-                # Create spark effect for coin collection
-                self.particle_system.create_spark(coin.x, coin.y, count=5)
-
-                # Play coin sound
-                if sound_enabled:
-                    sound_coin.play()
-
-                # Add points for collecting coin with combo multiplier
-                self.score += COIN_VALUE * self.score_multiplier
-
-                # Increase combo
-                self.combo_count += 1
-                self.combo_timer = 2.0  # Reset combo timer
-
-                # Update score multiplier
-                if self.combo_count >= 10:
-                    self.score_multiplier = 3
-                elif self.combo_count >= 5:
-                    self.score_multiplier = 2
-                else:
-                    self.score_multiplier = 1
-
-                # Add boost energy
-                self.player_car.add_boost_energy(5)
-
-                # Show boost energy prompt when energy is full
-                if (
-                    hasattr(self, "prompt_system")
-                    and self.player_car.boost_energy >= self.player_car.max_boost_energy
-                ):
-                    self.prompt_system.show_prompt("boost_energy")
-
-        # Check if mission is complete and show prompt
-        if (
-            self.game_mode == GAME_MODE_MISSIONS
-            and self.mission_progress >= self.mission_target
-        ):
-            if hasattr(self, "prompt_system"):
-                self.prompt_system.show_prompt("mission_complete")
-
-    except Exception as e:
-        print(f"Error in update method: {e}")
-        traceback.print_exc()
-
-
-# Attach the update method to the Game class
-Game.update = update
-
-
 def update_sparkles(self, dt):
     """Update sparkle positions and properties"""
     for sparkle in self.sparkles: